@@ -0,0 +1,303 @@
+"""Adjusted design values (F') from the reference values of a ``Wood_Type``.
+
+The pipeline applies the ASD adjustment factors of NDS Table 4.3.1 / 5.3.1 as
+vectorized stages over arrays of members:
+
+    C_D, C_M, C_t, C_i   service conditions, cached per
+                         (wood type, size class, duration, service) key
+    C_F / C_V            size factor for sawn timbers, volume factor for glulam
+    C_L                  beam stability, from F_b* (all factors but C_fu, C_V, C_L)
+    C_fu                 flat use factor supplied by the caller
+    C_P                  column stability, from F_c* (all factors but C_P)
+
+Each stage is a function ``stage(members, values, factors)`` that scales the
+(N, 7) ``values`` array in place, so callers can add or drop stages.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .batch import BeamBatch, ColumnBatch, encode
+
+DESIGN_VALUES = ("F_b", "F_t", "F_v", "F_c_perp", "F_c", "E", "E_min")
+F_b, F_t, F_v, F_c_perp, F_c, E, E_min = range(len(DESIGN_VALUES))
+
+SIZE_CLASSES = ("dimension", "timber")
+
+LOAD_DURATIONS = (
+    "permanent",
+    "ten_years",
+    "two_months",
+    "seven_days",
+    "ten_minutes",
+    "impact",
+)
+# Load duration factor C_D (NDS Table 2.3.2), applies to F_b, F_t, F_v and F_c
+LOAD_DURATION_FACTOR = (0.9, 1.0, 1.15, 1.25, 1.6, 2.0)
+
+TEMPERATURES = ("normal", "elevated", "high")
+# Temperature factor C_t (NDS Table 2.3.3) for dry service:
+# T <= 100F, 100F < T <= 125F and 125F < T <= 150F
+TEMPERATURE_FACTOR = {
+    "normal": (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0),
+    "elevated": (0.8, 0.9, 0.8, 0.8, 0.8, 0.9, 0.9),
+    "high": (0.7, 0.9, 0.7, 0.7, 0.7, 0.9, 0.9),
+}
+
+# Wet service factor C_M (NDS Supplement Tables 4A, 4D and 5A)
+WET_SERVICE_FACTOR = {
+    ("lumber", "dimension"): (0.85, 1.0, 0.97, 0.67, 0.8, 0.9, 0.9),
+    ("lumber", "timber"): (1.0, 1.0, 1.0, 0.67, 0.91, 1.0, 1.0),
+    ("glulam", "dimension"): (0.8, 0.8, 0.875, 0.53, 0.73, 0.833, 0.833),
+    ("glulam", "timber"): (0.8, 0.8, 0.875, 0.53, 0.73, 0.833, 0.833),
+}
+
+# Incising factor C_i (NDS Table 4.3.8)
+INCISING_FACTOR = (0.8, 0.8, 0.8, 1.0, 0.8, 0.95, 0.95)
+
+ReferenceValues = namedtuple(
+    "ReferenceValues",
+    ("lumber_type",) + DESIGN_VALUES + ("size_class",),
+    defaults=(None,),
+)
+
+AdjustedValues = namedtuple(
+    "AdjustedValues", DESIGN_VALUES + ("C_F", "C_V", "C_L", "C_P")
+)
+
+Members = namedtuple(
+    "Members",
+    [
+        "reference",
+        "breadth",
+        "depth",
+        "length",
+        "C_fu",
+        "load_placement",
+        "single_span_beam",
+        "column_bracing",
+        "design_K_e",
+        "volume_factor_exponent",
+    ],
+)
+
+
+def reference_values(wood_type):
+    """Hashable reference design values of a ``Wood_Type`` row, with the size
+    class of the row (None when it has none)"""
+    return ReferenceValues(
+        wood_type.lumber_type,
+        *(float(getattr(wood_type, name)) for name in DESIGN_VALUES),
+        getattr(wood_type, "size_class", None),
+    )
+
+
+def size_class(breadth, reference=None):
+    """Integer code into SIZE_CLASSES per member
+
+    The size class of the reference row when it has one; otherwise 2" to 4"
+    thick dimension lumber or 5" x 5" and larger timbers by breadth.
+    """
+    breadth = np.asarray(breadth)
+    if reference is not None and reference.size_class is not None:
+        code = SIZE_CLASSES.index(reference.size_class)
+        return np.full(breadth.shape, code, dtype=np.intp)
+    return (breadth >= 5.0).astype(np.intp)
+
+
+@lru_cache(maxsize=1024)
+def service_values(reference, size_class, duration, wet_service, temperature, incised):
+    """Reference values times C_D, C_M, C_t and C_i for one key
+
+    Parameters
+    ----------
+    reference : ReferenceValues
+    size_class : str
+        one of SIZE_CLASSES
+    duration : str
+        one of LOAD_DURATIONS
+    wet_service : bool
+        moisture content above 19% (16% for glulam) in service
+    temperature : str
+        one of TEMPERATURES
+    incised : bool
+        lumber incised to increase penetration of preservatives
+    """
+    if reference.lumber_type == "log":
+        raise ValueError("No design values are available for log members.")
+    values = np.array([getattr(reference, name) for name in DESIGN_VALUES])
+    C_D = LOAD_DURATION_FACTOR[LOAD_DURATIONS.index(duration)]
+    values[[F_b, F_t, F_v, F_c]] *= C_D
+    if wet_service:
+        values *= WET_SERVICE_FACTOR[reference.lumber_type, size_class]
+    values *= TEMPERATURE_FACTOR[temperature]
+    if incised and reference.lumber_type == "lumber":
+        values *= INCISING_FACTOR
+    values.setflags(write=False)
+    return values
+
+
+def size_stage(members, values, factors):
+    """C_F for sawn timbers deeper than 12" (Equation 4.3-1), C_V for glulam;
+    dimension lumber keeps C_F = 1, see ``size_class``"""
+    is_glulam = members.reference.lumber_type == "glulam"
+    depth = members.depth
+    if is_glulam:
+        x = members.volume_factor_exponent
+        C_V = (
+            (5.125 / members.breadth) ** (1 / x)
+            * (12.0 / depth) ** (1 / x)
+            * (21.0 * 12.0 / members.length) ** (1 / x)
+        )
+        factors["C_V"] = np.minimum(C_V, 1.0)
+    else:
+        is_timber = size_class(members.breadth, members.reference) == 1
+        is_deep_timber = (depth > 12.0) & is_timber
+        C_F = np.where(is_deep_timber, (12.0 / np.maximum(depth, 12.0)) ** (1 / 9), 1.0)
+        factors["C_F"] = C_F
+        values[:, F_b] *= C_F
+
+
+def beam_stability_stage(members, values, factors):
+    """C_L from F_b* and E_min'; glulam takes the lesser of C_L and C_V"""
+    beams = BeamBatch(
+        members.reference.lumber_type,
+        members.depth,
+        members.breadth,
+        members.length,
+        values[:, E],
+    )
+    R_B = beams.slenderness_ratio(
+        beams.effective_length(members.load_placement, members.single_span_beam)
+    )
+    F_bE = beams.critical_buckling_design_value(R_B, E_min_prime=values[:, E_min])
+    C_L = np.minimum(beams.stability_factor(F_bE, values[:, F_b]), 1.0)
+    factors["C_L"] = C_L
+    values[:, F_b] *= np.minimum(C_L, factors["C_V"])
+
+
+def flat_use_stage(members, values, factors):
+    """Flat use factor C_fu supplied by the caller"""
+    values[:, F_b] *= members.C_fu
+
+
+def column_stability_stage(members, values, factors):
+    """C_P from F_c* and E_min', buckling about the weaker axis"""
+    columns = ColumnBatch(
+        members.reference.lumber_type,
+        members.depth,
+        members.breadth,
+        members.length,
+        values[:, E],
+    )
+    s_r = columns.effective_length(
+        members.column_bracing, members.design_K_e
+    ) / np.minimum(members.breadth, members.depth)
+    F_cE = columns.critical_buckling_design_value(s_r, E_min_prime=values[:, E_min])
+    C_P = np.minimum(columns.stability_factor(F_cE, values[:, F_c]), 1.0)
+    factors["C_P"] = C_P
+    values[:, F_c] *= C_P
+
+
+DEFAULT_STAGES = (
+    size_stage,
+    beam_stability_stage,
+    flat_use_stage,
+    column_stability_stage,
+)
+
+
+def adjusted_values(
+    wood_type,
+    breadth,
+    depth,
+    length,
+    duration="ten_years",
+    wet_service=False,
+    temperature="normal",
+    incised=False,
+    C_fu=1.0,
+    load_placement="uniform",
+    single_span_beam=True,
+    column_bracing="both_trans_fixed_rot_free",
+    design_K_e="recommended",
+    volume_factor_exponent=10.0,
+    stages=DEFAULT_STAGES,
+):
+    """Adjusted design values F' for arrays of members of one wood type
+
+    Parameters
+    ----------
+    wood_type : Wood_Type or ReferenceValues
+    breadth, depth, length : array_like
+        member dimensions (inches)
+    duration : array_like of str or int
+        load duration per member, one of LOAD_DURATIONS
+    wet_service, temperature, incised :
+        service conditions shared by all members, see ``service_values``
+    C_fu : array_like
+        flat use factor per member
+    load_placement, single_span_beam :
+        beam bracing conditions for C_L, see ``BeamBatch.effective_length``
+    column_bracing, design_K_e :
+        column end conditions for C_P, see ``ColumnBatch.effective_length``
+    volume_factor_exponent : float
+        x in the glulam volume factor: 20 for Southern Pine, 10 otherwise
+    stages : sequence of callables
+        geometry dependent stages applied after the service factors
+
+    Returns
+    -------
+    AdjustedValues
+        F_b', F_t', F_v', F_c_perp', F_c', E' and E_min' per member,
+        with the C_F, C_V, C_L and C_P factors that were applied
+    """
+    if not isinstance(wood_type, ReferenceValues):
+        wood_type = reference_values(wood_type)
+    duration_code = encode(duration, LOAD_DURATIONS, "duration")
+    breadth, depth, length, duration_code = np.broadcast_arrays(
+        np.asarray(breadth, dtype=float),
+        np.asarray(depth, dtype=float),
+        np.asarray(length, dtype=float),
+        duration_code,
+    )
+    shape = breadth.shape
+    breadth, depth, length, duration_code = (
+        array.ravel() for array in (breadth, depth, length, duration_code)
+    )
+
+    table = np.array(
+        [
+            [
+                service_values(
+                    wood_type, size, duration, wet_service, temperature, incised
+                )
+                for duration in LOAD_DURATIONS
+            ]
+            for size in SIZE_CLASSES
+        ]
+    )
+    values = table[size_class(breadth, wood_type), duration_code]
+
+    members = Members(
+        wood_type,
+        breadth,
+        depth,
+        length,
+        np.broadcast_to(np.asarray(C_fu, dtype=float), shape).ravel(),
+        np.broadcast_to(load_placement, shape).ravel(),
+        np.broadcast_to(single_span_beam, shape).ravel(),
+        np.broadcast_to(column_bracing, shape).ravel(),
+        np.broadcast_to(design_K_e, shape).ravel(),
+        volume_factor_exponent,
+    )
+    ones = np.ones(breadth.shape)
+    factors = {"C_F": ones, "C_V": ones, "C_L": ones, "C_P": ones}
+    for stage in stages:
+        stage(members, values, factors)
+
+    return AdjustedValues(
+        *(values[:, i].reshape(shape) for i in range(len(DESIGN_VALUES))),
+        *(factors[name].reshape(shape) for name in ("C_F", "C_V", "C_L", "C_P")),
+    )
@@ -1,9 +1,18 @@
 from django.contrib import admin
 
-from .models import Wood_Type
+from .models import BeamColumnResult, Wood_Type
 
 # from django.contrib.auth import admin as auth_admin
 # from django.utils.translation import gettext_lazy as _
 
 
 admin.site.register(Wood_Type)
+
+
+@admin.register(BeamColumnResult)
+class BeamColumnResultAdmin(admin.ModelAdmin):
+    list_display = ("calculation", "governing", "governing_check", "engine_version")
+    list_filter = ("governing_check", "engine_version", "calculation__wood_type")
+    list_select_related = ("calculation",)
+    ordering = ("-governing",)
+    readonly_fields = BeamColumnResult.UPDATED_FIELDS
@@ -0,0 +1,287 @@
+"""Vectorized versions of the checks in ``beams_and_columns.py``.
+
+Each batch class holds arrays of member properties and evaluates a whole
+frame takeoff in a handful of array operations. The branches of the scalar
+``Beam`` and ``Column`` classes are replaced by masked selects.
+"""
+import numpy as np
+
+from .tables import (
+    ASD_COEFFICIENTS,
+    BEAM_EFFECTIVE_LENGTH,
+    K_E,
+    ColumnBracing,
+    DesignKe,
+    LoadPlacement,
+    LumberType,
+)
+
+LUMBER_TYPES = tuple(LumberType.__members__)
+BEAM_LOAD_PLACEMENTS = tuple(LoadPlacement.__members__)
+COLUMN_BRACINGS = tuple(ColumnBracing.__members__)
+DESIGN_K_E = tuple(DesignKe.__members__)
+
+BEAM_EFFECTIVE_LENGTH_TABLE = np.array(BEAM_EFFECTIVE_LENGTH)
+K_E_TABLE = np.array(K_E)
+ASD_COEFFICIENT_TABLE = np.array(ASD_COEFFICIENTS)
+BEAM_EFFECTIVE_LENGTH_TABLE.setflags(write=False)
+K_E_TABLE.setflags(write=False)
+ASD_COEFFICIENT_TABLE.setflags(write=False)
+
+# Column stability "c" and E_min coefficients, indexed like LUMBER_TYPES
+COLUMN_STABILITY_C = np.array([0.8, 0.9, 0.85])
+COV_E = np.array([0.25, 0.1, np.nan])
+
+
+def encode(values, choices, name="value"):
+    """Converts an array of labels into integer codes indexing ``choices``
+
+    Parameters
+    ----------
+    values : array_like of str or int
+        Labels from ``choices``, or codes that already index into it
+    choices : tuple of str
+        Allowed labels, in code order
+    name : str
+        Name used in the error message
+    """
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.integer):
+        if values.size and (values.min() < 0 or values.max() >= len(choices)):
+            raise ValueError(f"{name} codes must be between 0 and {len(choices) - 1}.")
+        return values.astype(np.intp)
+
+    labels, inverse = np.unique(values, return_inverse=True)
+    lookup = {choice: code for code, choice in enumerate(choices)}
+    try:
+        label_codes = np.array([lookup[label] for label in labels], dtype=np.intp)
+    except KeyError:
+        raise ValueError(f"{name} can only be one of {choices}.")
+    return label_codes[inverse].reshape(values.shape)
+
+
+def beam_stability_factor(ratio):
+    """C_L from the ratio F_bE / F_b_star"""
+    first_factor = (1 + ratio) / 1.9
+    return first_factor - np.sqrt(first_factor**2 - ratio / 0.95)
+
+
+def column_stability_factor(ratio, c):
+    """C_P from the ratio F_cE / F_c_star"""
+    first_factor = (1 + ratio) / 2.0 / c
+    return first_factor - np.sqrt(first_factor**2 - ratio / c)
+
+
+class SupportTypeBatch:
+    def __init__(self, lumber_type, depth, breadth, length, mod_of_elast):
+        """Arrays of members sharing one support type.
+        All inputs are broadcast against each other.
+
+        Parameters
+        ----------
+        lumber_type : array_like of str or int
+            Type of wood {"lumber", "glulam", "log"} (or their index in LUMBER_TYPES)
+        depth : array_like
+            depth of support (inches)
+        breadth : array_like
+            width (breadth) of support (inches)
+        length : array_like
+            length of support (inches)
+        mod_of_elast: array_like
+            modulus of elasticity (psi)
+        """
+        (
+            lumber_code,
+            self.depth,
+            self.breadth,
+            self.length,
+            self.mod_of_elast,
+        ) = np.broadcast_arrays(
+            encode(lumber_type, LUMBER_TYPES, "lumber_type"),
+            np.asarray(depth, dtype=float),
+            np.asarray(breadth, dtype=float),
+            np.asarray(length, dtype=float),
+            np.asarray(mod_of_elast, dtype=float),
+        )
+        self.lumber_code = lumber_code
+
+    def __len__(self):
+        return self.depth.size
+
+    @property
+    def is_log(self):
+        return self.lumber_code == LUMBER_TYPES.index("log")
+
+    def modulus_of_elasticity(self):
+        """Minimum modulus of elasticity from the 5% exclusion limit value.
+        Logs have no published CoVE and come back as NaN.
+
+        Notes
+        -----
+        CoVE : coefficient of variation for modulus of elasticity
+            0.25 for visually graded lumber
+            0.1 for structural glued laminated timber
+        """
+        CoVE = COV_E[self.lumber_code]
+        scale = np.array([1.03, 1.05, np.nan])[self.lumber_code]
+        return scale * self.mod_of_elast * (1 - 1.645 * CoVE) / 1.66
+
+    def moment_of_inertia(self):
+        return self.breadth * (self.depth**3) / 12.0
+
+    def _e_min_prime(self, E_min_prime):
+        if E_min_prime is None:
+            return self.modulus_of_elasticity()
+        return np.asarray(E_min_prime, dtype=float)
+
+
+class BeamBatch(SupportTypeBatch):
+    def effective_length(self, load_placement="uniform", single_span_beam=False):
+        """Vectorized ``Beam.effective_length``, from table 3.4.3.1.1-1 pg. 80 in
+        American Institute of Timber Construction Wiley (2012)
+
+        Parameters
+        ----------
+        load_placement : array_like of str or int, optional
+            One of BEAM_LOAD_PLACEMENTS per member
+        single_span_beam : array_like of bool, optional
+        """
+        placement = encode(load_placement, BEAM_LOAD_PLACEMENTS, "load_placement")
+        single_span = np.asarray(single_span_beam, dtype=np.intp)
+        short = (self.length / self.depth < 7.0).astype(np.intp)
+        coefficients = BEAM_EFFECTIVE_LENGTH_TABLE[placement, single_span, short]
+        if np.isnan(coefficients).any():
+            raise ValueError(
+                "single_span_beam must be true if load_placement other than 'uniform' or 'concentrated_end'."
+            )
+        return coefficients[..., 0] * self.length + coefficients[..., 1] * self.depth
+
+    def slenderness_ratio(self, l_e=None, k=1.72, moments=None):
+        """Vectorized ``Beam.slenderness_ratio``
+
+        Parameters
+        ----------
+        l_e : array_like, optional
+            effective length; defaults to ``effective_length()``
+        k : The value of k is given in Table 3.4.3.1.2-1 for select cases
+             and can be conservatively taken as 1.72 for all other cases.
+        moments : dict of array_like, optional
+            Used to calculate slenderness_ratio with method of moments on beam Equation 3.4.3.1.2-2
+        """
+        if moments:
+            eta = 1.3 * k * self.depth / self.length
+            C_e = np.sqrt(eta**2 + 1) - eta
+            if "M_max" in moments:
+                C_b = (
+                    12.5
+                    * moments["M_max"]
+                    / (
+                        3 * moments["M_a"]
+                        + 4 * moments["M_b"]
+                        + 3 * moments["M_c"]
+                        + 2.5 * moments["M_max"]
+                    )
+                )
+            else:
+                C_b = (
+                    3.0
+                    - (2 / 3) * (moments["M_1"] / moments["M_0"])
+                    - (8 / 3) * moments["M_CL"] / (moments["M_1"] + moments["M_0"])
+                )
+            return np.sqrt(
+                1.84 * self.length * self.depth / C_b / C_e / self.breadth**2
+            )
+        if l_e is None:
+            l_e = self.effective_length()
+        return np.sqrt(l_e * self.depth / self.breadth**2)
+
+    def critical_buckling_design_value(self, R_B=None, E_min_prime=None):
+        """F_bE for every member (Equation 3.4.3.1-2)
+
+        Parameters
+        ----------
+        R_B : array_like, optional
+            slenderness ratio; defaults to ``slenderness_ratio()``
+        E_min_prime : array_like, optional
+            adjusted minimum modulus of elasticity; defaults to ``modulus_of_elasticity()``
+        """
+        if R_B is None:
+            R_B = self.slenderness_ratio()
+        return 1.2 * self._e_min_prime(E_min_prime) / (R_B**2)
+
+    def stability_factor(self, F_bE, F_b_star):
+        """Beam stability factor C_L
+
+        Parameters
+        ----------
+        F_bE : critical buckling design value for bending
+        F_b_star : reference bending design value multiplied by all applicable adjustment factors
+            except Cfu, CL, CV, and CI
+        """
+        return beam_stability_factor(np.asarray(F_bE) / F_b_star)
+
+
+class ColumnBatch(SupportTypeBatch):
+    def effective_length(
+        self, column_bracing="both_trans_fixed_rot_fixed", design_K_e="recommended"
+    ):
+        """Vectorized ``Column.effective_length`` (see Table 3.4.3.9.2-1 pg. 89) of
+        American Institute of Timber Construction Wiley (2012)
+
+        Parameters
+        ----------
+        column_bracing : array_like of str or int, optional
+            One of COLUMN_BRACINGS per member
+        design_K_e : array_like of str or int, optional
+            One of DESIGN_K_E per member
+        """
+        bracing = encode(column_bracing, COLUMN_BRACINGS, "column_bracing")
+        design = encode(design_K_e, DESIGN_K_E, "design_K_e")
+        K_e = K_E_TABLE[bracing, design]
+        return K_e * self.length
+
+    def slenderness_ratio(self, l_e=None):
+        """l_e / d for every member
+
+        Parameters
+        ----------
+        l_e : array_like, optional
+            effective length; defaults to ``effective_length()``
+        """
+        if l_e is None:
+            l_e = self.effective_length()
+        return l_e / self.depth
+
+    def slenderness_exceeded(self, s_r=None):
+        """Mask of members past the slenderness limit in the completed structure
+        (43 for logs, 50 otherwise)."""
+        if s_r is None:
+            s_r = self.slenderness_ratio()
+        return s_r > np.where(self.is_log, 43.0, 50.0)
+
+    def critical_buckling_design_value(self, s_r=None, E_min_prime=None):
+        """F_cE for every member (Equation 3.4.3.9-2)
+
+        Parameters
+        ----------
+        s_r : array_like, optional
+            slenderness ratio; defaults to ``slenderness_ratio()``
+        E_min_prime : array_like, optional
+            adjusted minimum modulus of elasticity; defaults to ``modulus_of_elasticity()``
+        """
+        if s_r is None:
+            s_r = self.slenderness_ratio()
+        scale = np.where(self.is_log, 0.617, 0.822)
+        return scale * self._e_min_prime(E_min_prime) / (s_r**2)
+
+    def stability_factor(self, F_cE, F_c_star):
+        """Column stability factor C_P
+
+        Parameters
+        ----------
+        F_cE : critical buckling design value for compression
+        F_c_star : reference compression design value multiplied by all applicable adjustment factors
+            except C_P
+        """
+        c = COLUMN_STABILITY_C[self.lumber_code]
+        return column_stability_factor(np.asarray(F_cE) / F_c_star, c)
@@ -1,7 +1,54 @@
-import numpy as np
+"""Scalar design checks for one member at a time.
+
+Only the standard library is needed here; the vectorized methods import
+NumPy and the batch modules when they are first called, so code that only
+touches the scalar path (models, forms, migrations) never loads NumPy.
+"""
+import math
+
+from .checks import CheckLog
+from .equations import interaction_terms
+from .tables import (  # noqa: F401 LOAD_TYPES is re-exported
+    ASD_COEFFICIENTS,
+    ASD_COMBINATIONS,
+    ASD_REQUIRED,
+    BEAM_EFFECTIVE_LENGTH,
+    K_E,
+    LIVE_LOAD_STRUCTURE_TYPES,
+    LOAD_TYPES,
+    ColumnBracing,
+    DesignKe,
+    LoadPlacement,
+    code,
+)
 
 
 class Support_Type:
+    """Immutable member value object. Section properties are computed once
+    on creation; use ``replace`` to try out a modified member.
+    """
+
+    __slots__ = (
+        "support_type",
+        "lumber_type",
+        "depth",
+        "breadth",
+        "length",
+        "mod_of_elast",
+        "_area",
+        "_moment_of_inertia",
+        "_section_modulus",
+        "_mod_of_elast_min",
+    )
+    _fields = (
+        "support_type",
+        "lumber_type",
+        "depth",
+        "breadth",
+        "length",
+        "mod_of_elast",
+    )
+
     def __init__(
         self, support_type, lumber_type, depth, breadth, length, mod_of_elast, **kwargs
     ):
@@ -22,25 +69,74 @@ class Support_Type:
             modulus of elasticity (psi)
         """
 
-        if support_type in ["beam", "column", "beam_column"]:
-            self.support_type = support_type
-        else:
+        if support_type not in ["beam", "column", "beam_column"]:
             raise ValueError(
                 "support_type can only be 'beam', 'column', or 'beam_column'."
             )
 
-        if lumber_type in ["lumber", "glulam", "log"]:
-            self.lumber_type = lumber_type
-        else:
+        if lumber_type not in ["lumber", "glulam", "log"]:
             raise ValueError("lumber_type can only be 'log', 'lumber', or 'glulam'.")
 
-        self.depth = np.float(depth)
-        self.breadth = np.float(breadth)
-        self.length = np.float(length)
-        self.mod_of_elast = np.float(mod_of_elast)
+        depth = float(depth)
+        breadth = float(breadth)
+        _set = object.__setattr__
+        _set(self, "support_type", support_type)
+        _set(self, "lumber_type", lumber_type)
+        _set(self, "depth", depth)
+        _set(self, "breadth", breadth)
+        _set(self, "length", float(length))
+        _set(self, "mod_of_elast", float(mod_of_elast))
+        _set(self, "_area", breadth * depth)
+        _set(self, "_moment_of_inertia", breadth * (depth**3) / 12.0)
+        _set(self, "_section_modulus", breadth * (depth**2) / 6.0)
+        _set(self, "_mod_of_elast_min", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace()")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace()")
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __hash__(self):
+        return hash((type(self), self._astuple()))
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{name}={value!r}" for name, value in self._asdict().items()
+        )
+        return f"{type(self).__name__}({values})"
 
-    def modulus_of_elasticity(self):
+    def __reduce__(self):
+        return (type(self), self._astuple())
+
+    def _astuple(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def _asdict(self):
+        return {name: getattr(self, name) for name in self._fields}
+
+    def replace(self, **changes):
+        """Returns a copy of the member with ``changes`` applied, e.g.
+        ``beam.replace(depth=9.25)``
         """
+        fields = self._asdict()
+        unknown = set(changes) - set(fields)
+        if unknown:
+            raise TypeError(f"replace() got unexpected fields {sorted(unknown)}")
+        fields.update(changes)
+        return type(self)(**fields)
+
+    @property
+    def mod_of_elast_min(self):
+        return self.modulus_of_elasticity()
+
+    def modulus_of_elasticity(self):
+        """Minimum modulus of elasticity, computed once per member
         Notes
         -----
         E_05 : The 5% exclusion limit value
@@ -48,18 +144,23 @@ class Support_Type:
             0.25 for visually graded lumber
             0.1 for structural glued laminated timber
         """
+        if self._mod_of_elast_min is not None:
+            return self._mod_of_elast_min
+
         if self.lumber_type == "lumber":
             CoVE = 0.25
             E_05 = self.mod_of_elast * (1 - 1.645 * CoVE)
-            self.mod_of_elast_min = 1.03 * E_05 / 1.66
+            mod_of_elast_min = 1.03 * E_05 / 1.66
         elif self.lumber_type == "glulam":
             CoVE = 0.1
             E_05 = self.mod_of_elast * (1 - 1.645 * CoVE)
-            self.mod_of_elast_min = 1.05 * E_05 / 1.66
+            mod_of_elast_min = 1.05 * E_05 / 1.66
         elif self.lumber_type == "log":
             raise NotImplementedError()
         else:
             raise ValueError("lumber_type can only be 'log', 'lumber', or 'glulam'.")
+        object.__setattr__(self, "_mod_of_elast_min", mod_of_elast_min)
+        return mod_of_elast_min
 
     def estimated_shrinkage(self, S_0, m_i, m_f):
         """Estimates Wood Shrinkage.
@@ -94,14 +195,17 @@ class Support_Type:
             * ((21.0 / Length) ** (1 / x))
         )
 
+    def area(self):
+        """Gross cross-sectional area b * d"""
+        return self._area
+
     def moment_of_inertia(self):
-        """
-        Parameters
-        ----------
-        d : depth of beam
-        b : width (breadth) of beam
-        """
-        return self.breadth * (self.depth**3) / 12.0
+        """Strong axis moment of inertia b * d^3 / 12"""
+        return self._moment_of_inertia
+
+    def section_modulus(self):
+        """Strong axis section modulus b * d^2 / 6"""
+        return self._section_modulus
 
     def critical_buckling_design_value(
         self,
@@ -110,6 +214,7 @@ class Support_Type:
         K_e=1.0,
         material_type="log",
         structure_type="beam",
+        checks=None,
     ):
         """Calculates critical buckling design value.
         From American Institute of Timber Construction - Timber construction manual-Wiley (2012) page 140
@@ -119,9 +224,9 @@ class Support_Type:
         E_min_prime :  adjusted modulus of elasticity for beam and column stability calculations
         lumber_type : Used to determine scaling and slenderness ratio
         structure_type : Used to select either "beam" or "column"
+        checks : CheckLog, optional
+            Receives the slenderness limit check for columns
         """
-        # print(f"Using structure type: {structure_type}")
-        # print(f"Using material type: {material_type}")
         s_r = self.slenderness_ratio(
             l_e,
             self.depth,
@@ -132,22 +237,15 @@ class Support_Type:
         )
         if structure_type == "column":
             if material_type == "log":
-                if s_r > 43.0:
-                    print("slenderness_ratio must be less than 43.")
+                max_s_r = 43.0
                 scale = 0.617
             else:
-                if s_r > 50.0:  # <75 for construction
-                    print(
-                        "slenderness_ratio must be less",
-                        "than 50 in the completed structure and less than 75 during construction.",
-                    )
+                max_s_r = 50.0  # <75 for construction
                 scale = 0.822
+            if checks is not None:
+                checks.record("slenderness_ratio", s_r, max_s_r)
         elif structure_type == "beam":
-            if material_type == "log":
-                print("EMPTY")
-                scale = 1.2
-            else:
-                scale = 1.2
+            scale = 1.2
         else:
             raise ValueError("structure_type can only be 'beam' or 'column'.")
 
@@ -171,9 +269,9 @@ class Support_Type:
         """
         # print(f"Using structure type: {structure_type}")
         if structure_type == "column":
-            if self.lumber_type == "log":
+            if self.lumber_type == "lumber":
                 c = 0.8
-            elif self.lumber_type == "lumber":
+            elif self.lumber_type == "log":
                 c = 0.85
             elif self.lumber_type == "glulam":
                 c = 0.9
@@ -183,10 +281,10 @@ class Support_Type:
                 )
 
             first_factor = (1 + F_E / F_star) / 2.0 / c
-            second_factor = np.sqrt(first_factor**2 - F_E / F_star / c)
+            second_factor = math.sqrt(first_factor**2 - F_E / F_star / c)
         elif structure_type == "beam":
             first_factor = (1 + (F_E / F_star)) / 1.9
-            second_factor = np.sqrt(first_factor**2 - (F_E / F_star / 0.95))
+            second_factor = math.sqrt(first_factor**2 - (F_E / F_star / 0.95))
         else:
             raise ValueError("structure_type can only be 'beam' or 'column'.")
 
@@ -209,6 +307,7 @@ class Support_Type:
         E_min_prime_1,
         E_min_prime_2,
         E_min_prime_c,
+        checks=None,
     ):
         """
         Parameters
@@ -227,109 +326,45 @@ class Support_Type:
         F_b2_prime : weak axis adjusted bending stress b2
         E_min_prime_1 : strong axis Minimum Modulus of Eccentricity
         E_min_prime_2 : weak axis Minimum Modulus of Eccentricity
+        checks : CheckLog, optional
+            Receives the buckling, masking and interaction checks
         Notes
         -----
         F_bE : critical buckling design value for bending
         F_cE1 : critical buckling design value for strong axis buckling
         F_cE2 : critical buckling design value for weak axis buckling
         """
-        F_cE1 = self.critical_buckling_design_value(
-            l_e_c,
-            E_min_prime_1,
+        interaction, F_cE1, F_cE2, F_bE, excess_capacity = interaction_terms(
             d1,
-            b=0.0,
-            K_e=1.0,
-            material_type="lumber",
-            structure_type="column",
-        )
-        F_cE2 = self.critical_buckling_design_value(
-            l_e_c,
-            E_min_prime_2,
             d2,
-            b=0.0,
-            K_e=1.0,
-            material_type="lumber",
-            structure_type="column",
-        )
-        F_bE = self.critical_buckling_design_value(
+            l_e_c,
             l_e_b,
+            e1,
+            e2,
+            f_c,
+            f_b1,
+            f_b2,
+            F_c_prime,
+            F_b1_prime,
+            F_b2_prime,
+            E_min_prime_1,
+            E_min_prime_2,
             E_min_prime_c,
-            d1,
-            b=d2,
-            K_e=1.0,
-            material_type="lumber",
-            structure_type="beam",
         )
 
-        print(F_cE1, F_cE2, F_bE)
-        if f_c >= F_cE1:
-            print(
-                f"{f_c} >= {F_cE1} compression stress exceeds critical buckling design value for strong axis buckling"
-            )
-        else:
-            print(
-                f"{f_c} < {F_cE1} compression stress within critical buckling design value for strong axis buckling"
-            )
-
-        if f_c >= F_cE2:
-            print(
-                f"{f_c} >= {F_cE2} compression stress exceeds critical buckling design value for weak axis buckling"
-            )
-        else:
-            print(
-                f"{f_c} < {F_cE2} compression stress exceeds critical buckling design value for weak axis buckling"
-            )
-
-        if f_b1 >= F_bE:
-            print(
-                f"{f_b1} >= {F_bE} compression stress exceeds critical buckling design value for weak axis buckling"
-            )
-        else:
-            print(
-                f"{f_b1} < {F_bE} compression stress exceeds critical buckling design value for weak axis buckling"
-            )
-
-        first_factor = (f_c / F_c_prime) ** 2
-        second_factor_top = f_b1 + f_c * (6 * e1 / d1) * (1 + (0.234 * f_c / F_cE1))
-        second_factor_bottom = F_b1_prime * (1 - (f_c / F_cE1))
-        third_factor_subfactor = ((f_b1 + f_c * (6 * e1 / d1)) / F_bE) ** 2
-
-        excess_capacity = f_c / F_cE2 + third_factor_subfactor
-        if excess_capacity >= 1.0:
-            print(
-                f"{excess_capacity} >= {1.} overstress in weak axis bending",
-                "is being masked by excess capacity in compression and strong axis bending",
-            )
-        else:
-            print(
-                f"{excess_capacity} < {1.} overstress in weak axis bending is not masked by",
-                "excess capacity in compression and strong axis bending",
-            )
-
-        if F_cE2 == 0.0:  # Don't divide by zero
-            return first_factor + (second_factor_top / second_factor_bottom)
-        else:
-            third_factor_top = f_b2 + f_c * (6 * e2 / d2) * (
-                1 + (0.234 * f_c / F_cE2) + 0.234 * third_factor_subfactor
-            )
-            third_factor_bottom = F_b2_prime * (
-                1 - (f_c / F_cE2) - third_factor_subfactor
-            )
-            if third_factor_bottom == 0.0:  # Don't divide by zero
-                return first_factor + (second_factor_top / second_factor_bottom)
-            else:
-                return (
-                    first_factor
-                    + (second_factor_top / second_factor_bottom)
-                    + (third_factor_top / third_factor_bottom)
-                )
+        if checks is not None:
+            checks.record("strong_axis_buckling", f_c, F_cE1, strict=True)
+            checks.record("weak_axis_buckling", f_c, F_cE2, strict=True)
+            checks.record("lateral_torsional_buckling", f_b1, F_bE, strict=True)
+            # Overstress in weak axis bending is masked by excess capacity
+            # in compression and strong axis bending
+            checks.record("weak_axis_masking", excess_capacity, 1.0, strict=True)
+            checks.record("beam_column_interaction", interaction, 1.0)
+        return interaction
 
 
 class Beam(Support_Type):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Wood Type to get all the properties
-        # Extract this from choice/database?
+    __slots__ = ()
 
     def effective_length(self, load_placement="uniform", single_span_beam=False):
         """Only for cantilevers! Can also be found in table 3.4.3.1.1-1 pg. 80 in
@@ -348,35 +383,16 @@ class Beam(Support_Type):
         Table 3.4.3.1.1-1 pg. 80 in American Institute of Timber Construction Wiley (2012)
         """
 
-        if load_placement == "uniform":
-            if self.length / self.depth < 7.0:
-                if single_span_beam:
-                    return 2.06 * self.length
-                else:
-                    return 1.33 * self.length
-            else:
-                if single_span_beam:
-                    return 1.63 * self.length + 3 * self.depth
-                else:
-                    return 0.9 * self.length + 3 * self.depth
-        elif load_placement == "concentrated_end":
-            if self.length / self.depth < 7.0:
-                return 1.87 * self.length
-            else:
-                return 1.44 * self.length + 3 * self.depth
-        elif load_placement == "concentrated_center_no_support" and single_span_beam:
-            if self.length / self.depth < 7.0:
-                return 1.8 * self.length
-            else:
-                return 1.37 * self.length + 3 * self.depth
-        elif load_placement == "concentrated_center_with_support" and single_span_beam:
-            return 1.11 * self.length
-        else:
+        placement = code(LoadPlacement, load_placement, "load_placement")
+        short = self.length / self.depth < 7.0
+        length_coefficient, depth_coefficient = BEAM_EFFECTIVE_LENGTH[placement][
+            bool(single_span_beam)
+        ][short]
+        if length_coefficient != length_coefficient:  # NaN
             raise ValueError(
-                "load_placement must be a value in: {'uniform', 'concentrated_end',\
-                 'concentrated_center_no_support', 'concentrated_center_with_support',} \
-                and/or single_span_beam must be true if load_placement other than 'uniform' or 'concentrated_end'."
+                "single_span_beam must be true if load_placement other than 'uniform' or 'concentrated_end'."
             )
+        return length_coefficient * self.length + depth_coefficient * self.depth
 
     def slenderness_ratio(self, k=1.72, moments={}):
         """
@@ -388,7 +404,7 @@ class Beam(Support_Type):
         """
         if moments:
             eta = 1.3 * k * self.depth / self.length
-            C_e = np.sqrt(eta**2 + 1) - eta
+            C_e = math.sqrt(eta**2 + 1) - eta
             if "M_max" in moments.keys():
                 C_b = (
                     12.5
@@ -407,11 +423,11 @@ class Beam(Support_Type):
                     - (2 / 3) * (moments["M_1"] / moments["M_0"])
                     - (8 / 3) * moments["M_CL"] / (moments["M_1"] + moments["M_0"])
                 )
-            return np.sqrt(
+            return math.sqrt(
                 1.84 * self.length * self.depth / C_b / C_e / self.breadth**2
             )
         else:
-            return np.sqrt(self.effective_length() * self.depth / self.breadth**2)
+            return math.sqrt(self.effective_length() * self.depth / self.breadth**2)
 
     def flat_use_or_size_factor(self):
         """The size factor for 5 in. × 5 in. and larger sawn timbers of depth greater than 12 in.
@@ -432,9 +448,9 @@ class Beam(Support_Type):
         load_case : int between 0 and 5 corresponding to above diagram
         a : location of force if non-uniform
         """
-        mom_of_inert = self.moment_of_inertia(self.depth, self.breadth)
+        mom_of_inert = self._moment_of_inertia
         if load_case == 0:
-            return (w * self.length**3) / 3.0 / self.mod_of_elast / self.length
+            return (w * self.length**3) / 3.0 / self.mod_of_elast / mom_of_inert
         elif load_case == 1:
             return (
                 (w * a**2 * (3.0 * self.length - a))
@@ -453,7 +469,43 @@ class Beam(Support_Type):
         elif load_case == 5:
             return (w * self.length**2) / 2.0 / self.mod_of_elast / mom_of_inert
 
-    def bending_stress(self, M, F_b_prime=0.0):
+    def diagrams(
+        self,
+        uniform=0.0,
+        point=0.0,
+        point_location=0.0,
+        cantilever=False,
+        exclude_within_d=False,
+        stations=21,
+    ):
+        """Shear, moment and deflection along the beam, see ``diagrams.beam_diagrams``
+        Parameters
+        ----------
+        uniform : uniform load or sequence of uniform loads (lb/in)
+        point : concentrated load or sequence of concentrated loads (lb)
+        point_location : distance of each concentrated load from the left (or fixed) support
+        cantilever : True if fixed at x = 0 and free at the other end
+        exclude_within_d : exclude loads within a distance d of the supports from the shear
+        stations : number of evenly spaced stations
+        """
+        import numpy as np
+
+        from .diagrams import Diagrams, beam_diagrams
+
+        result = beam_diagrams(
+            self.length,
+            self.mod_of_elast,
+            self._moment_of_inertia,
+            uniform=np.atleast_2d(uniform),
+            point=np.atleast_2d(point),
+            point_location=np.atleast_2d(point_location),
+            cantilever=cantilever,
+            depth=self.depth if exclude_within_d else None,
+            stations=stations,
+        )
+        return Diagrams(*(values[0] for values in result))
+
+    def bending_stress(self, M, F_b_prime=0.0, checks=None):
         """Calculates bending stress for a square beam, for nonsquare, see eqn. 4.2.1-1.
         From American Institute of Timber Construction - Timber construction manual-Wiley (2012) page 103
         Parameters
@@ -463,15 +515,12 @@ class Beam(Support_Type):
         b : width (breadth) if "beam"
         M : bending moment due to applied loads
         F_b_prime : adjusted bending stress
+        checks : CheckLog, optional
+            Receives the bending check when F_b_prime is assigned
         """
-        f_b = 6 * M / self.breadth / self.depth**2
-        if F_b_prime > 0:
-            if f_b > F_b_prime:
-                print(f"{f_b} > {F_b_prime} bending stress exceeds allowable design")
-            else:
-                print(f"{f_b} <= {F_b_prime} bending stress within allowable design")
-        else:
-            print("No adjusted bending stress assigned.")
+        f_b = M / self._section_modulus
+        if checks is not None and F_b_prime > 0:
+            checks.record("bending_stress", f_b, F_b_prime)
         return f_b
 
     def shear_force(self, force):
@@ -483,22 +532,19 @@ class Beam(Support_Type):
         """
         return force * self.length / 2 - force * self.depth
 
-    def shear_stress(self, V, F_v_prime=0.0):
+    def shear_stress(self, V, F_v_prime=0.0, checks=None):
         """Calculates shear stress for a square beam, for nonsquare, see eqn. 4.2.2-1.
         From American Institute of Timber Construction - Timber construction manual-Wiley (2012) page 104
         Parameters
         ----------
         V : Shear Force
         F_v_prime : adjusted shear stress
+        checks : CheckLog, optional
+            Receives the shear check when F_v_prime is assigned
         """
-        f_v = 3 * V / 2 / self.breadth / self.depth
-        if F_v_prime > 0:
-            if f_v > F_v_prime:
-                print(f"{f_v} > {F_v_prime} shear stress exceeds allowable design")
-            else:
-                print(f"{f_v} <= {F_v_prime} shear stress within allowable design")
-        else:
-            print("No adjusted shear stress assigned.")
+        f_v = 3 * V / 2 / self._area
+        if checks is not None and F_v_prime > 0:
+            checks.record("shear_stress", f_v, F_v_prime)
         return f_v
 
     def beam_weight(self, density):
@@ -507,9 +553,9 @@ class Beam(Support_Type):
         ----------
         density : wood density (pounds per cubic inch)
         """
-        return self.depth * self.breadth * density
+        return self._area * density
 
-    def allowable_bending_stress(self, f_c, F_bx_star, C_V, C_L):
+    def allowable_bending_stress(self, f_c, F_bx_star, C_V, C_L, checks=None):
         """
         Parameters
         ----------
@@ -517,24 +563,16 @@ class Beam(Support_Type):
         C_V :
         C_L :
         f_c : flexural compression stress (compression stress parallel-to-grain)
+        checks : CheckLog, optional
+            Receives the flexural compression and adjusted bending checks
         """
-        if f_c >= F_bx_star * (1 - C_V):
-            print(
-                f"{f_c} >= {F_bx_star*(1-C_V)} bending stress exceeds allowable design"
-            )
-        else:
-            print(
-                f"{f_c} >= {F_bx_star*(1-C_V)} bending stress within allowable design"
-            )
-
         F_bx_prime = F_bx_star * C_V + f_c
-        if F_bx_prime >= F_bx_star * C_L:
-            print(
-                f"{F_bx_prime} >= {F_bx_star*C_L} bending stress exceeds allowable design"
+        if checks is not None:
+            checks.record(
+                "flexural_compression", f_c, F_bx_star * (1 - C_V), strict=True
             )
-        else:
-            print(
-                f"{F_bx_prime} >= {F_bx_star*C_L} bending stress within allowable design"
+            checks.record(
+                "allowable_bending_stress", F_bx_prime, F_bx_star * C_L, strict=True
             )
         return F_bx_prime
 
@@ -577,12 +615,34 @@ class Beam(Support_Type):
                 final_force += force
             return final_force * (self.length**2.0) / 8.0
 
+    def continuous_span_checks(
+        self, span_lengths, uniform, F_b_prime=0.0, F_v_prime=0.0, checks=None
+    ):
+        """Bending and shear stress of this section run continuously over several spans
+        Parameters
+        ----------
+        span_lengths : length of each span (inches)
+        uniform : uniform load on each span (lb/in)
+        F_b_prime : adjusted bending stress
+        F_v_prime : adjusted shear stress
+        checks : CheckLog, optional
+            Receives the bending and shear checks
+        Returns
+        -------
+        f_b, f_v : governing bending and shear stress over all spans
+        """
+        from .continuous import continuous_beam
+
+        result = continuous_beam(span_lengths, uniform)
+        f_b = self.bending_stress(
+            result.max_moment[0], F_b_prime=F_b_prime, checks=checks
+        )
+        f_v = self.shear_stress(result.max_shear[0], F_v_prime=F_v_prime, checks=checks)
+        return f_b, f_v
+
 
 class Column(Support_Type):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Wood Type to get all the properties
-        # Extract this from choice/database?
+    __slots__ = ()
 
     def effective_length(
         self, column_bracing="both_trans_fixed_rot_fixed", design_K_e="recommended"
@@ -602,40 +662,9 @@ class Column(Support_Type):
         American Institute of Timber Construction Wiley (2012)
         """
 
-        if column_bracing == "both_trans_fixed_rot_fixed":
-            if design_K_e == "recommended":
-                K_e = 0.65
-            elif design_K_e == "theoretical":
-                K_e = 0.5
-        elif column_bracing == "both_trans_fixed_rot_free":
-            K_e = 1.0
-        elif column_bracing == "top_trans_fixed_rot_free":
-            if design_K_e == "recommended":
-                K_e = 0.8
-            elif design_K_e == "theoretical":
-                K_e = 0.7
-        elif column_bracing == "top_trans_free_rot_fixed":
-            if design_K_e == "recommended":
-                K_e = 1.2
-            elif design_K_e == "theoretical":
-                K_e = 1.0
-        elif column_bracing == "top_trans_free_rot_free":
-            if design_K_e == "recommended":
-                K_e = 2.1
-            elif design_K_e == "theoretical":
-                K_e = 2.0
-        elif column_bracing == "top_trans_free_rot_fixed_bot_rot_free_trans_fixed":
-            if design_K_e == "recommended":
-                K_e = 2.4
-            elif design_K_e == "theoretical":
-                K_e = 2.0
-        else:
-            raise ValueError(
-                "column_bracing must be a value in: {'both_trans_fixed_rot_fixed',\
-                 'both_trans_fixed_rot_free', 'top_trans_free_rot_free', 'top_trans_free_rot_fixed',\
-                  'top_trans_fixed_rot_free', 'top_trans_free_rot_fixed_bot_rot_free_trans_fixed'}."
-            )
-
+        K_e = K_E[code(ColumnBracing, column_bracing, "column_bracing")][
+            code(DesignKe, design_K_e, "design_K_e")
+        ]
         return K_e * self.length
 
     def slenderness_ratio(
@@ -652,13 +681,11 @@ class Column(Support_Type):
             Whethere conditions are ideal (theoretical), or approximated (recommended)
         """
         return (
-            self.effective_length(
-                self.length, column_bracing=column_bracing, design_K_e=design_K_e
-            )
+            self.effective_length(column_bracing=column_bracing, design_K_e=design_K_e)
             / self.depth
         )
 
-    def column_design_criteria(self, P, A_g, A_n, F_c_prime, F_c_star):
+    def column_design_criteria(self, P, A_g, A_n, F_c_prime, F_c_star, checks=None):
         """
         Parameters
         ----------
@@ -667,21 +694,24 @@ class Column(Support_Type):
         A_n : net cross-sectional area
         F_c_prime : Adjusted compression design value
         F_c_star : Adjusted compression design value (without C_p)
-        """
-        if P / A_g <= F_c_prime:
-            print(f"{P/A_g} <= {F_c_prime} compression stress within allowable design")
-        else:
-            print(f"{P/A_g} > {F_c_prime} compression stress exceeds allowable design")
+        checks : CheckLog, optional
+            Accumulator to add the results to
 
-        if P / A_n <= F_c_star:
-            print(f"{P/A_n} <= {F_c_star} compression stress within allowable design")
-        else:
-            print(f"{P/A_n} > {F_c_star} compression stress exceeds allowable design")
+        Returns
+        -------
+        CheckLog
+            Gross and net section compression checks
+        """
+        if checks is None:
+            checks = CheckLog()
+        checks.record("gross_compression_stress", P / A_g, F_c_prime)
+        checks.record("net_compression_stress", P / A_n, F_c_star)
+        return checks
 
 
 class Loads:
     def __init__(self, *args, **kwargs):
-        print("Nothing Here.")
+        pass
 
     def live_load(self, L_0, A_f, F, structure_type="roof"):
         """Calculate Live Load for roof or floor
@@ -709,12 +739,43 @@ class Loads:
             return L_0 * R1 * R2  # psf
         elif structure_type == "floor":
             if A_f > 200:
-                return L_0 * (0.25 * 10.6 / np.sqrt(A_f))
+                return L_0 * (0.25 * 10.6 / math.sqrt(A_f))
             else:
                 return L_0
         else:
             raise ValueError("structure_type can only be 'roof' or 'floor'.")
 
+    def live_loads(self, L_0, A_f, F=0.0, structure_type="roof"):
+        """Vectorized ``live_load`` for many members at once.
+        All inputs are broadcast against each other.
+
+        Parameters
+        ----------
+        L_0 : array_like
+            minimum unreduced uniformly distributed live load
+        A_f : array_like
+            tributary area supported by each structural member (ft2)
+        F : array_like
+            inches of rise per foot for a sloped roof (ignored for floors)
+        structure_type : array_like of str or int
+            "roof" or "floor" per member (or their index in LIVE_LOAD_STRUCTURE_TYPES)
+        """
+        import numpy as np
+
+        from .batch import encode
+
+        is_floor = (
+            encode(structure_type, LIVE_LOAD_STRUCTURE_TYPES, "structure_type") == 1
+        )
+        L_0 = np.asarray(L_0, dtype=float)
+        A_f = np.asarray(A_f, dtype=float)
+        R1 = np.clip(1.2 - 0.001 * A_f, 0.6, 1.0)
+        R2 = np.clip(1.2 - 0.05 * np.asarray(F, dtype=float), 0.6, 1.0)
+        floor_reduction = np.where(
+            A_f > 200.0, 0.25 * 10.6 / np.sqrt(np.maximum(A_f, 200.0)), 1.0
+        )
+        return L_0 * np.where(is_floor, floor_reduction, R1 * R2)
+
     def allowable_stress_design(self, D, L=0, Lr=0, S=0, R=0, W=0, E=0):
         """Calculates Allowable Stress Design for relevant load combinations
         Parameters
@@ -726,118 +787,47 @@ class Loads:
         R : Rain load
         W : Wind load
         E : Earthquake load
-        """
-        ASD = {}
-        ASD["D"] = D
-        if W != 0.0:
-            print(f"Dead + Wind Load: {0.6*D+W}")
-            ASD["D+W"] = 0.6 * D + W
 
-        if E != 0.0:
-            print(f"Dead + Earthquake Load: {0.6*D+0.7*E}")
-            ASD["D+E"] = 0.6 * D + 0.7 * E
-
-        if L != 0.0:
-            print(f"Dead + Live Load: {D+L}")
-            ASD["D+L"] = D + L
-
-        if Lr != 0.0:
-            print(f"Dead + Roof Live Load: {D+Lr}")
-            ASD["D+Lr"] = D + L
-
-        if S != 0.0:
-            print(f"Dead + Snow Live Load: {D+S}")
-            ASD["D+S"] = D + S
-
-        if R != 0.0:
-            print(f"Dead + Rain Live Load: {D+R}")
-            ASD["D+R"] = D + R
-
-        if W != 0.0:
-            print(f"Dead + Wind Live Load: {D+W}")
-            ASD["D+WL"] = D + W
-
-        if E != 0.0:
-            print(f"Dead + Earthquake Live Load: {D+.7*E}")
-            ASD["D+EL"] = D + 0.7 * E
-
-        if L != 0.0:
-            if Lr != 0.0:
-                print(f"Dead + Live + Roof + Load: {D+0.75*L+0.75*Lr}")
-                ASD["D+L+Lr"] = D + 0.75 * L + 0.75 * Lr
-
-            if S != 0.0:
-                print(f"Dead + Live + Snow + Load: {D+0.75*L+0.75*S}")
-                ASD["D+L+S"] = D + 0.75 * L + 0.75 * S
-
-            if R != 0.0:
-                print(f"Dead + Live + Rain + Load: {D+0.75*L+0.75*R}")
-                ASD["D+L+R"] = D + 0.75 * L + 0.75 * R
-
-            if W != 0.0 and Lr != 0.0:
-                print(f"Dead + Wind + Live + Roof + Load: {D+0.75*W+0.75*L+0.75*Lr}")
-                ASD["D+W+L+Lr"] = D + 0.75 * W + 0.75 * L + 0.75 * Lr
-
-            if W != 0.0 and S != 0.0:
-                print(f"Dead + Wind + Live + Snow + Load: {D+0.75*W+0.75*L+0.75*S}")
-                ASD["D+W+L+S"] = D + 0.75 * W + 0.75 * L + 0.75 * S
-
-            if W != 0.0 and R != 0.0:
-                print(f"Dead + Wind + Live + Rain + Load: {D+0.75*W+0.75*L+0.75*R}")
-                ASD["D+W+L+R"] = D + 0.75 * W + 0.75 * L + 0.75 * R
-
-            if E != 0.0 and Lr != 0.0:
-                print(
-                    f"Dead + Earthquake + Live + Roof + Load: {D+0.75*E+0.75*L+0.75*Lr}"
-                )
-                ASD["D+E+L+Lr"] = D + 0.75 * E + 0.75 * L + 0.75 * Lr
-
-            if E != 0.0 and S != 0.0:
-                print(
-                    f"Dead + Earthquake + Live + Snow + Load: {D+0.75*E+0.75*L+0.75*S}"
-                )
-                ASD["D+E+L+S"] = D + 0.75 * E + 0.75 * L + 0.75 * S
-
-            if E != 0.0 and R != 0.0:
-                print(
-                    f"Dead + Earthquake + Live + Rain + Load: {D+0.75*E+0.75*L+0.75*R}"
-                )
-                ASD["D+E+L+R"] = D + 0.75 * E + 0.75 * L + 0.75 * R
-        else:
-            if Lr != 0.0:
-                print(f"Dead + Roof + Load: {D+0.75*Lr}")
-                ASD["D+Lr"] = D + 0.75 * Lr
-
-            if S != 0.0:
-                print(f"Dead + Snow + Load: {D+0.75*S}")
-                ASD["D+S"] = D + 0.75 * S
-
-            if R != 0.0:
-                print(f"Dead + Rain + Load: {D+0.75*R}")
-                ASD["D+R"] = D + 0.75 * R
-
-            if W != 0.0 and Lr != 0.0:
-                print(f"Dead + Wind + Roof + Load: {D+0.75*W+0.75*Lr}")
-                ASD["D+W+Lr"] = D + 0.75 * W + 0.75 * Lr
-
-            if W != 0.0 and S != 0.0:
-                print(f"Dead + Wind + Snow + Load: {D+0.75*W+0.75*S}")
-                ASD["D+W+S"] = D + 0.75 * W + 0.75 * S
-
-            if W != 0.0 and R != 0.0:
-                print(f"Dead + Wind + Rain + Load: {D+0.75*W+0.75*R}")
-                ASD["D+W+R"] = D + 0.75 * W + 0.75 * R
-
-            if E != 0.0 and Lr != 0.0:
-                print(f"Dead + Earthquake + Roof + Load: {D+0.75*E+0.75*Lr}")
-                ASD["D+E+Lr"] = D + 0.75 * E + 0.75 * Lr
-
-            if E != 0.0 and S != 0.0:
-                print(f"Dead + Earthquake + Snow + Load: {D+0.75*E+0.75*S}")
-                ASD["D+E+S"] = D + 0.75 * E + 0.75 * S
-
-            if E != 0.0 and R != 0.0:
-                print(f"Dead + Earthquake + Rain + Load: {D+0.75*E+0.75*R}")
-                ASD["D+E+R"] = D + 0.75 * E + 0.75 * R
+        Notes
+        -----
+        Only combinations whose loads are all non-zero are returned, except that
+        the 0.75 L term of the "D+L+..." combinations may be zero.
+        """
+        loads = (float(D), float(L), float(Lr), float(S), float(R), float(W), float(E))
+        return {
+            name: sum(
+                coefficient * load for coefficient, load in zip(coefficients, loads)
+            )
+            for name, coefficients, required in zip(
+                ASD_COMBINATIONS, ASD_COEFFICIENTS, ASD_REQUIRED
+            )
+            if all(load != 0.0 or not needed for load, needed in zip(loads, required))
+        }
 
-        return ASD
+    def load_combinations(self, loads):
+        """Evaluates every ASD load combination for every member at once
+        Parameters
+        ----------
+        loads : array_like, shape (N, 7) or (7,)
+            Load effects per member, with columns ordered as LOAD_TYPES
+
+        Returns
+        -------
+        combinations : ndarray, shape (N, len(ASD_COMBINATIONS))
+            Every combination for every member
+        governing : ndarray, shape (N,)
+            Combination with the largest magnitude for each member
+        governing_index : ndarray, shape (N,)
+            Index of the governing combination in ASD_COMBINATIONS
+        """
+        import numpy as np
+
+        from .batch import ASD_COEFFICIENT_TABLE
+
+        loads = np.asarray(loads, dtype=float)
+        combinations = loads @ ASD_COEFFICIENT_TABLE.T
+        governing_index = np.argmax(np.abs(combinations), axis=-1)
+        governing = np.take_along_axis(
+            combinations, governing_index[..., np.newaxis], axis=-1
+        )[..., 0]
+        return combinations, governing, governing_index
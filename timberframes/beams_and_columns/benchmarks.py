@@ -0,0 +1,263 @@
+"""Benchmarks of the engine at several problem sizes.
+
+Each benchmark builds ``size`` members once and returns a callable that runs
+one evaluation of all of them; the best of ``repeat`` runs is kept. Results
+are written to and compared against JSON baselines by the
+``benchmark_engine`` management command.
+
+Scalar benchmarks loop over ``Beam``, ``Column`` and ``Loads`` objects and stop
+at ``max_size`` members, since a million Python-level calls would dominate
+the run without telling us more than 1e5 does.
+"""
+import json
+import platform
+import re
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .adjustments import ReferenceValues, adjusted_values
+from .batch import BeamBatch, ColumnBatch
+from .beams_and_columns import LOAD_TYPES, Beam, Column, Loads
+from .kernels import beam_column_interaction
+
+SIZES = (1, 10**3, 10**5, 10**6)
+
+Benchmark = namedtuple("Benchmark", ["name", "setup", "max_size"])
+
+Regression = namedtuple("Regression", ["name", "size", "baseline", "current", "change"])
+
+DOUGLAS_FIR = ReferenceValues(
+    "lumber", 900.0, 575.0, 180.0, 625.0, 1350.0, 1.6e6, 5.8e5
+)
+GLULAM = ReferenceValues("glulam", 2400.0, 1650.0, 265.0, 650.0, 1600.0, 1.8e6, 9.5e5)
+
+
+def _members(size, seed=0):
+    """Reproducible breadths, depths and lengths (inches) of ``size`` members"""
+    rng = np.random.default_rng(seed)
+    breadth = rng.choice([1.5, 3.5, 5.5, 7.5], size)
+    depth = rng.choice([5.5, 7.25, 9.25, 11.25], size)
+    length = rng.uniform(48.0, 240.0, size)
+    return breadth, depth, length
+
+
+def scalar_beam(size):
+    beams = [
+        Beam("beam", "lumber", d, b, L, DOUGLAS_FIR.E)
+        for b, d, L in zip(*_members(size))
+    ]
+
+    def run():
+        for beam in beams:
+            R_B = beam.slenderness_ratio()
+            C_L = beam.stability_factor(
+                1.2 * DOUGLAS_FIR.E_min / R_B**2, DOUGLAS_FIR.F_b
+            )
+            beam.bending_stress(1.0e4, F_b_prime=DOUGLAS_FIR.F_b * C_L)
+            beam.shear_stress(500.0)
+            beam.deflection(5.0)
+
+    return run
+
+
+def scalar_column(size):
+    columns = [
+        Column("column", "lumber", d, b, L, DOUGLAS_FIR.E)
+        for b, d, L in zip(*_members(size))
+    ]
+
+    def run():
+        for column in columns:
+            s_r = column.slenderness_ratio("both_trans_fixed_rot_free")
+            C_P = column.stability_factor(
+                0.822 * DOUGLAS_FIR.E_min / s_r**2,
+                DOUGLAS_FIR.F_c,
+                structure_type="column",
+            )
+            area = column.area()
+            column.column_design_criteria(
+                4000.0, area, area, DOUGLAS_FIR.F_c * C_P, DOUGLAS_FIR.F_c
+            )
+
+    return run
+
+
+def scalar_loads(size):
+    loads = Loads()
+    rows = np.random.default_rng(0).uniform(0.0, 50.0, (size, len(LOAD_TYPES)))
+    rows = rows.tolist()
+
+    def run():
+        for row in rows:
+            loads.allowable_stress_design(*row)
+            loads.live_load(row[1], 150.0, 4.0)
+
+    return run
+
+
+def batch_beam(size):
+    breadth, depth, length = _members(size)
+
+    def run():
+        beams = BeamBatch("lumber", depth, breadth, length, DOUGLAS_FIR.E)
+        R_B = beams.slenderness_ratio(beams.effective_length("uniform", True))
+        F_bE = beams.critical_buckling_design_value(R_B, E_min_prime=DOUGLAS_FIR.E_min)
+        beams.stability_factor(F_bE, DOUGLAS_FIR.F_b)
+
+    return run
+
+
+def batch_column(size):
+    breadth, depth, length = _members(size)
+
+    def run():
+        columns = ColumnBatch("lumber", depth, breadth, length, DOUGLAS_FIR.E)
+        s_r = columns.slenderness_ratio(columns.effective_length())
+        F_cE = columns.critical_buckling_design_value(
+            s_r, E_min_prime=DOUGLAS_FIR.E_min
+        )
+        columns.stability_factor(F_cE, DOUGLAS_FIR.F_c)
+
+    return run
+
+
+def batch_loads(size):
+    loads = Loads()
+    rows = np.random.default_rng(0).uniform(0.0, 50.0, (size, len(LOAD_TYPES)))
+
+    def run():
+        loads.load_combinations(rows)
+        loads.live_loads(rows[:, 1], 150.0, 4.0)
+
+    return run
+
+
+def interaction(size):
+    breadth, depth, length = _members(size)
+
+    def run():
+        beam_column_interaction(
+            depth,
+            breadth,
+            length,
+            1.63 * length,
+            0.0,
+            0.0,
+            100.0,
+            300.0,
+            0.0,
+            1000.0,
+            900.0,
+            900.0,
+            DOUGLAS_FIR.E_min,
+            DOUGLAS_FIR.E_min,
+            DOUGLAS_FIR.E_min,
+        )
+
+    return run
+
+
+def adjustment(size):
+    breadth, depth, length = _members(size)
+
+    def run():
+        adjusted_values(DOUGLAS_FIR, breadth, depth, length, duration="two_months")
+
+    return run
+
+
+def glulam_adjustment(size):
+    breadth, depth, length = _members(size)
+
+    def run():
+        adjusted_values(GLULAM, breadth, depth, length, duration="two_months")
+
+    return run
+
+
+BENCHMARKS = (
+    Benchmark("scalar.beam", scalar_beam, 10**5),
+    Benchmark("scalar.column", scalar_column, 10**5),
+    Benchmark("scalar.loads", scalar_loads, 10**5),
+    Benchmark("batch.beam", batch_beam, None),
+    Benchmark("batch.column", batch_column, None),
+    Benchmark("batch.loads", batch_loads, None),
+    Benchmark("kernels.interaction", interaction, None),
+    Benchmark("adjustments.adjusted_values", adjustment, None),
+    Benchmark("adjustments.glulam", glulam_adjustment, None),
+)
+
+
+def time_benchmark(benchmark, size, repeat=3):
+    """Best wall time (seconds) of ``repeat`` runs of ``benchmark`` at ``size``,
+    after one untimed run that compiles any Numba kernels and warms caches"""
+    run = benchmark.setup(size)
+    run()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(sizes=SIZES, repeat=3, pattern=None):
+    """Times every benchmark whose name matches ``pattern`` at every size up
+    to its ``max_size``
+
+    Returns
+    -------
+    dict
+        {benchmark name: {str(size): seconds}}
+    """
+    results = {}
+    for benchmark in BENCHMARKS:
+        if pattern and not re.search(pattern, benchmark.name):
+            continue
+        results[benchmark.name] = {
+            str(size): time_benchmark(benchmark, size, repeat)
+            for size in sizes
+            if benchmark.max_size is None or size <= benchmark.max_size
+        }
+    return results
+
+
+def compare(results, baseline, threshold=10.0):
+    """Benchmarks slower than their baseline by more than ``threshold`` percent.
+    Benchmarks or sizes missing from the baseline are not compared.
+    """
+    regressions = []
+    for name, timings in results.items():
+        for size, current in timings.items():
+            reference = baseline.get(name, {}).get(size)
+            if not reference:
+                continue
+            change = 100.0 * (current - reference) / reference
+            if change > threshold:
+                regressions.append(
+                    Regression(name, int(size), reference, current, change)
+                )
+    return regressions
+
+
+def save_baseline(path, results):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "results": results,
+            },
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+        f.write("\n")
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)["results"]
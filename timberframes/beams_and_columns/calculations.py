@@ -0,0 +1,262 @@
+"""Capacity and utilization of beams, columns and beam-columns.
+
+``evaluate`` runs the adjustment pipeline and the stress checks over arrays of
+members with the batch engine; a single member is a batch of one.
+``member_results`` evaluates one saved calculation through the Django cache,
+keyed by a canonical hash of its inputs and the revision of its wood type, so
+identical inputs share one computation until the wood type changes. The same
+canonical inputs give ``input_fingerprint``, which identifies saved
+calculations so a resubmission reuses its row. ``evaluate_members`` evaluates
+many saved calculations of one wood type at once for the stored results.
+
+NumPy and the engine are imported on first use to keep them out of
+``django.setup()``.
+"""
+import hashlib
+import json
+
+from django.core.cache import cache
+
+SUPPORT_TYPES = ("beam", "column", "beam_and_column")
+# Bump when a change to the engine changes the results
+ENGINE_VERSION = "1"
+
+RESULT_FIELDS = (
+    "F_b_prime",
+    "F_v_prime",
+    "F_c_prime",
+    "C_L",
+    "C_P",
+    "moment_capacity",
+    "shear_capacity",
+    "axial_capacity",
+    "bending",
+    "shear",
+    "deflection",
+    "compression",
+    "interaction",
+    "governing",
+)
+UTILIZATION_FIELDS = RESULT_FIELDS[-6:-1]
+
+CACHE_PREFIX = "beams_and_columns:result"
+
+
+def evaluate(
+    reference,
+    support_type,
+    breadth,
+    depth,
+    length,
+    uniform=0.0,
+    axial=0.0,
+    duration="ten_years",
+    deflection_limit=360.0,
+    column_bracing="both_trans_fixed_rot_free",
+):
+    """Capacities and demand to capacity ratios for broadcastable arrays of
+    members of one wood type
+
+    Beams are single spans under a uniform load, laterally unbraced over their
+    length; columns buckle about their weaker axis, pinned at both ends unless
+    ``column_bracing`` says otherwise.
+    Beams only get the bending, shear and deflection checks, columns only the
+    compression check, and beam-columns all of them plus the interaction.
+
+    Parameters
+    ----------
+    reference : adjustments.ReferenceValues
+    support_type : array_like of str or int
+        one of SUPPORT_TYPES per member
+    breadth, depth, length : array_like
+        member dimensions (inches)
+    uniform : array_like
+        uniform load on the beam (lb/in)
+    axial : array_like
+        concentric axial compression load (lb)
+    duration : array_like of str
+        load duration, see ``adjustments.LOAD_DURATIONS``
+    deflection_limit : float
+        allowable deflection is length / deflection_limit
+    column_bracing : array_like of str
+        end conditions of the column, see ``batch.COLUMN_BRACINGS``
+
+    Returns
+    -------
+    ndarray with one float field per entry of RESULT_FIELDS
+    """
+    import numpy as np
+
+    from .adjustments import adjusted_values
+    from .batch import encode
+
+    support, breadth, depth, length, uniform, axial = np.broadcast_arrays(
+        encode(support_type, SUPPORT_TYPES, "support_type"),
+        np.asarray(breadth, dtype=float),
+        np.asarray(depth, dtype=float),
+        np.asarray(length, dtype=float),
+        np.asarray(uniform, dtype=float),
+        np.asarray(axial, dtype=float),
+    )
+    adjusted = adjusted_values(
+        reference,
+        breadth,
+        depth,
+        length,
+        duration=duration,
+        column_bracing=column_bracing,
+    )
+    area = breadth * depth
+    section_modulus = breadth * depth**2 / 6.0
+    moment_of_inertia = breadth * depth**3 / 12.0
+
+    result = np.zeros(breadth.shape, dtype=[(name, float) for name in RESULT_FIELDS])
+    result["F_b_prime"] = adjusted.F_b
+    result["F_v_prime"] = adjusted.F_v
+    result["F_c_prime"] = adjusted.F_c
+    result["C_L"] = adjusted.C_L
+    result["C_P"] = adjusted.C_P
+    result["moment_capacity"] = adjusted.F_b * section_modulus
+    result["shear_capacity"] = 2.0 / 3.0 * adjusted.F_v * area
+    result["axial_capacity"] = adjusted.F_c * area
+
+    is_beam = support != SUPPORT_TYPES.index("column")
+    is_column = support != SUPPORT_TYPES.index("beam")
+    uniform = np.where(is_beam, uniform, 0.0)
+    f_c = np.where(is_column, axial, 0.0) / area
+    f_b = uniform * length**2 / 8.0 / section_modulus
+    f_v = 1.5 * uniform * np.maximum(length / 2.0 - depth, 0.0) / area
+    deflection = 5.0 * uniform * length**4 / 384.0 / adjusted.E / moment_of_inertia
+    result["bending"] = f_b / adjusted.F_b
+    result["shear"] = f_v / adjusted.F_v
+    result["deflection"] = deflection / (length / deflection_limit)
+    result["compression"] = f_c / adjusted.F_c
+
+    F_cE = 0.822 * adjusted.E_min / (length / np.minimum(breadth, depth)) ** 2
+    # np.where evaluates both branches, including 0 / 0 where f_b is 0 and the
+    # axial load reaches the buckling load
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amplification = np.where(f_c < F_cE, 1.0 - f_c / F_cE, 0.0)
+        result["interaction"] = np.where(
+            support == SUPPORT_TYPES.index("beam_and_column"),
+            (f_c / adjusted.F_c) ** 2
+            + np.where(f_b > 0.0, f_b / (adjusted.F_b * amplification), 0.0),
+            0.0,
+        )
+    result["governing"] = np.max([result[name] for name in UTILIZATION_FIELDS], axis=0)
+    return result
+
+
+def as_dict(record):
+    """Plain floats of one record of ``evaluate``"""
+    return {name: float(record[name]) for name in RESULT_FIELDS}
+
+
+def governing_check(results):
+    """Name of the check with the highest utilization in ``results``"""
+    return max(UTILIZATION_FIELDS, key=results.__getitem__)
+
+
+def evaluate_members(wood_type, members):
+    """Results of several members of one wood type from a single ``evaluate``
+
+    Parameters
+    ----------
+    wood_type : models.Wood_Type
+    members : sequence of (support_type, breadth, depth, length, options)
+        ``options`` are the keyword arguments of ``evaluate`` for the member,
+        with the same names for every member
+
+    Returns
+    -------
+    list of dict of RESULT_FIELDS, or None for wood types the engine has no
+    design values for (logs)
+    """
+    from .adjustments import reference_values
+
+    if not members:
+        return []
+    support_types, breadths, depths, lengths, options = zip(*members)
+    try:
+        record = evaluate(
+            reference_values(wood_type),
+            list(support_types),
+            [float(breadth) for breadth in breadths],
+            [float(depth) for depth in depths],
+            [float(length) for length in lengths],
+            **{name: [option[name] for option in options] for name in options[0]},
+        )
+    except ValueError:
+        return None
+    return [as_dict(result) for result in record]
+
+
+def _number(value):
+    return repr(float(value))
+
+
+def canonical_inputs(support_type, wood_type_id, breadth, depth, length, **options):
+    """JSON of the inputs of a calculation, so that Decimal("1.50"), 1.5 and
+    "1.5" give the same text"""
+    return json.dumps(
+        [
+            support_type,
+            wood_type_id,
+            _number(breadth),
+            _number(depth),
+            _number(length),
+            {
+                name: value if isinstance(value, str) else _number(value)
+                for name, value in options.items()
+            },
+        ],
+        sort_keys=True,
+    )
+
+
+def input_fingerprint(support_type, wood_type_id, breadth, depth, length, **options):
+    """SHA-256 of ``canonical_inputs``, identifies a calculation by content"""
+    canonical = canonical_inputs(
+        support_type, wood_type_id, breadth, depth, length, **options
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def result_key(support_type, wood_type, breadth, depth, length, **options):
+    """Cache key of a calculation: a hash of its canonical inputs, the
+    revision of its wood type and the engine version"""
+    canonical = canonical_inputs(
+        support_type, wood_type.pk, breadth, depth, length, **options
+    )
+    digest = hashlib.sha256(
+        f"{ENGINE_VERSION}|{wood_type.revision}|{canonical}".encode()
+    ).hexdigest()
+    return f"{CACHE_PREFIX}:{digest}"
+
+
+def member_results(support_type, wood_type, breadth, depth, length, **options):
+    """Results of one member as a dict of RESULT_FIELDS, computed once per
+    distinct input and kept in the cache until the wood type changes
+
+    Returns None for wood types the engine has no design values for (logs).
+    """
+    key = result_key(support_type, wood_type, breadth, depth, length, **options)
+    results = cache.get(key)
+    if results is None:
+        from .adjustments import reference_values
+
+        try:
+            record = evaluate(
+                reference_values(wood_type),
+                support_type,
+                float(breadth),
+                float(depth),
+                float(length),
+                **options,
+            )
+        except ValueError:
+            results = {}
+        else:
+            results = as_dict(record[()])
+        cache.set(key, results, timeout=None)
+    return results or None
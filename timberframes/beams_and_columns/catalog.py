@@ -0,0 +1,96 @@
+"""Process-wide, read-through catalog of wood types.
+
+Every worker keeps all wood types in memory, keyed by id, together with the
+catalog version it loaded them at. The version is a counter in the shared
+Django cache that the ``post_save`` and ``post_delete`` signals of
+``Wood_Type`` bump once the transaction commits; a worker compares its
+version with the shared one on each access and reloads the whole catalog when
+they differ. Reading the catalog therefore costs one cache lookup and no
+database query until a wood type changes anywhere. When the cache keeps
+nothing there is no version to compare, and the table is read on every access.
+
+The wood types handed out are shared by every thread of the worker and must
+be treated as read-only.
+"""
+import threading
+import time
+
+from django.core.cache import cache
+
+VERSION_KEY = "beams_and_columns:wood_type_catalog_version"
+
+_lock = threading.Lock()
+# Version of a catalog that was never loaded, unequal to any shared version
+_NEVER_LOADED = object()
+# (version, {id: Wood_Type}) of the last load, replaced rather than mutated
+_catalog = (_NEVER_LOADED, {})
+
+
+def catalog_version():
+    """The shared catalog version, started from the clock when the cache has
+    none so a counter that was evicted cannot come back at a version some
+    worker already holds; None when the cache does not store anything"""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate():
+    """Makes every worker reload the catalog on its next access"""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        catalog_version()
+
+
+def _load():
+    from .models import Wood_Type
+
+    return {wood_type.pk: wood_type for wood_type in Wood_Type.objects.order_by("pk")}
+
+
+def _wood_types():
+    global _catalog
+    version = catalog_version()
+    if version is None:
+        # Without a shared version (DummyCache, or a cache outage with errors
+        # ignored) a copy can not be told stale, so read the table every time
+        return _load()
+    loaded_version, wood_types = _catalog
+    if loaded_version == version:
+        return wood_types
+    with _lock:
+        loaded_version, wood_types = _catalog
+        if loaded_version != version:
+            wood_types = _load()
+            _catalog = (version, wood_types)
+    return wood_types
+
+
+def wood_types():
+    """All wood types, ordered by id"""
+    return list(_wood_types().values())
+
+
+def get_wood_type(pk):
+    """The wood type with id ``pk``
+
+    Raises
+    ------
+    Wood_Type.DoesNotExist
+    """
+    try:
+        return _wood_types()[int(pk)]
+    except (KeyError, TypeError, ValueError):
+        from .models import Wood_Type
+
+        raise Wood_Type.DoesNotExist(f"No wood type with id {pk!r}.")
+
+
+def clear():
+    """Drops this worker's copy of the catalog"""
+    global _catalog
+    with _lock:
+        _catalog = (_NEVER_LOADED, {})
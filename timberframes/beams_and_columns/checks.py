@@ -0,0 +1,65 @@
+"""Pass/fail records for the engine checks.
+
+Engine methods accept an optional ``checks`` accumulator and append a
+``CheckResult`` for each comparison they make. Nothing is formatted until
+``CheckLog.report`` is called.
+"""
+from collections import namedtuple
+
+CheckResult = namedtuple(
+    "CheckResult", ["name", "demand", "capacity", "ratio", "passed"]
+)
+
+
+def check(name, demand, capacity, strict=False):
+    """Builds a ``CheckResult`` for ``demand`` against ``capacity``
+
+    Parameters
+    ----------
+    name : str
+        Short identifier of the check, e.g. "bending_stress"
+    demand : float
+        Computed stress, force or ratio
+    capacity : float
+        Allowable value for ``demand``
+    strict : bool
+        If True, ``demand`` must be strictly below ``capacity`` to pass
+    """
+    ratio = demand / capacity if capacity else float("inf")
+    passed = demand < capacity if strict else demand <= capacity
+    return CheckResult(name, demand, capacity, ratio, bool(passed))
+
+
+class CheckLog(list):
+    """List of ``CheckResult`` collected over one or more calculations"""
+
+    def record(self, name, demand, capacity, strict=False):
+        result = check(name, demand, capacity, strict=strict)
+        self.append(result)
+        return result
+
+    @property
+    def passed(self):
+        return all(result.passed for result in self)
+
+    @property
+    def failures(self):
+        return [result for result in self if not result.passed]
+
+    @property
+    def governing(self):
+        """Result with the highest demand to capacity ratio"""
+        if not self:
+            return None
+        return max(self, key=lambda result: result.ratio)
+
+    def report(self):
+        """Human readable summary, one line per check"""
+        lines = []
+        for result in self:
+            status = "OK" if result.passed else "FAIL"
+            lines.append(
+                f"{result.name}: {result.demand:.6g} / {result.capacity:.6g}"
+                f" = {result.ratio:.3f} {status}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,116 @@
+"""Continuous beams over many supports, by the three-moment equation.
+
+Plates and girts run continuously over several posts. With the end supports
+pinned, the unknown support moments form a tridiagonal system that is solved
+in O(n) with the Thomas algorithm. The sweep runs over the spans and is
+vectorized over a batch of beams that share the same number of spans.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+ContinuousBeam = namedtuple(
+    "ContinuousBeam",
+    [
+        "support_moments",
+        "reactions",
+        "end_shears",
+        "span_moments",
+        "max_moment",
+        "max_shear",
+    ],
+)
+
+
+def solve_tridiagonal(lower, diagonal, upper, rhs):
+    """Thomas algorithm for a batch of tridiagonal systems
+
+    Parameters
+    ----------
+    lower : ndarray, shape (B, m)
+        sub-diagonal; ``lower[:, 0]`` is ignored
+    diagonal : ndarray, shape (B, m)
+        main diagonal
+    upper : ndarray, shape (B, m)
+        super-diagonal; ``upper[:, -1]`` is ignored
+    rhs : ndarray, shape (B, m)
+        right hand side
+    """
+    m = diagonal.shape[-1]
+    c = np.empty_like(diagonal)
+    d = np.empty_like(rhs)
+    c[:, 0] = upper[:, 0] / diagonal[:, 0]
+    d[:, 0] = rhs[:, 0] / diagonal[:, 0]
+    for i in range(1, m):
+        denominator = diagonal[:, i] - lower[:, i] * c[:, i - 1]
+        c[:, i] = upper[:, i] / denominator
+        d[:, i] = (rhs[:, i] - lower[:, i] * d[:, i - 1]) / denominator
+    for i in range(m - 2, -1, -1):
+        d[:, i] -= c[:, i] * d[:, i + 1]
+    return d
+
+
+def continuous_beam(span_lengths, uniform, moment_of_inertia=1.0):
+    """Support moments, reactions and span moments of continuous beams
+    under uniform loads, with pinned end supports.
+
+    Parameters
+    ----------
+    span_lengths : array_like, shape (B, n) or (n,)
+        length of each span (inches)
+    uniform : array_like, shape (B, n) or (n,)
+        uniform load on each span (lb/in)
+    moment_of_inertia : array_like, shape (B, n) or (n,)
+        moment of inertia of each span; only ratios between spans matter
+
+    Returns
+    -------
+    ContinuousBeam
+        support_moments : (B, n + 1), negative for hogging
+        reactions : (B, n + 1)
+        end_shears : (B, n, 2), shear just right of the left support and
+            just left of the right support of each span
+        span_moments : (B, n), maximum positive moment within each span
+        max_moment : (B,), largest moment magnitude anywhere on the beam
+        max_shear : (B,), largest shear magnitude anywhere on the beam
+    """
+    L = np.atleast_2d(np.asarray(span_lengths, dtype=float))
+    w, inertia = np.broadcast_arrays(
+        np.asarray(uniform, dtype=float), np.asarray(moment_of_inertia, dtype=float)
+    )
+    w = np.broadcast_to(w, L.shape)
+    inertia = np.broadcast_to(inertia, L.shape)
+    n_beams, n_spans = L.shape
+
+    support_moments = np.zeros((n_beams, n_spans + 1))
+    if n_spans > 1:
+        flexibility = L / inertia
+        load_term = w * L**3 / 4.0 / inertia
+        support_moments[:, 1:-1] = solve_tridiagonal(
+            flexibility[:, :-1],
+            2.0 * (flexibility[:, :-1] + flexibility[:, 1:]),
+            flexibility[:, 1:],
+            -(load_term[:, :-1] + load_term[:, 1:]),
+        )
+
+    M_left = support_moments[:, :-1]
+    M_right = support_moments[:, 1:]
+    V_left = w * L / 2.0 + (M_right - M_left) / L
+    V_right = V_left - w * L
+    end_shears = np.stack([V_left, V_right], axis=-1)
+
+    reactions = np.zeros((n_beams, n_spans + 1))
+    reactions[:, :-1] += V_left
+    reactions[:, 1:] -= V_right
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x0 = np.clip(np.where(w != 0.0, V_left / w, 0.0), 0.0, L)
+    span_moments = M_left + V_left * x0 - w * x0**2 / 2.0
+
+    max_moment = np.maximum(
+        np.abs(support_moments).max(axis=-1), np.abs(span_moments).max(axis=-1)
+    )
+    max_shear = np.abs(end_shears).max(axis=(-2, -1))
+    return ContinuousBeam(
+        support_moments, reactions, end_shears, span_moments, max_moment, max_shear
+    )
@@ -0,0 +1,125 @@
+"""Shear, moment and deflection diagrams for many beams at once.
+
+Loads are superposed, so any number of uniform and concentrated loads can be
+combined per beam. Every diagram comes back as an (N beams, K stations) array.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+Diagrams = namedtuple("Diagrams", ["stations", "shear", "moment", "deflection"])
+
+
+def _per_beam(values, n_beams):
+    """Broadcasts ``values`` to (n_beams, n_loads) for superposition"""
+    values = np.asarray(values, dtype=float)
+    if values.ndim < 2:
+        values = values.reshape(-1, 1) if values.ndim == 1 else values.reshape(1, 1)
+    return np.broadcast_to(values, (n_beams, values.shape[-1]))
+
+
+def beam_diagrams(
+    length,
+    mod_of_elast,
+    moment_of_inertia,
+    uniform=0.0,
+    point=0.0,
+    point_location=0.0,
+    cantilever=False,
+    depth=None,
+    stations=21,
+):
+    """Evaluates shear, moment and deflection at stations along each span.
+
+    Parameters
+    ----------
+    length : array_like, shape (N,)
+        span length (inches)
+    mod_of_elast : array_like, shape (N,)
+        modulus of elasticity (psi)
+    moment_of_inertia : array_like, shape (N,)
+        moment of inertia (in^4)
+    uniform : array_like, shape (N,) or (N, U)
+        uniform loads (lb/in); the columns are superposed
+    point : array_like, shape (N,) or (N, P)
+        concentrated loads (lb); the columns are superposed
+    point_location : array_like, shape (N,) or (N, P)
+        distance of each concentrated load from the left (or fixed) support
+    cantilever : array_like of bool, shape (N,)
+        True for cantilevers fixed at x = 0, False for simple spans
+    depth : array_like, shape (N,), optional
+        If given, loads within a distance d of a support are excluded from the
+        shear diagram, as permitted for the shear design of bending members
+    stations : int
+        number of evenly spaced stations K, including both ends
+
+    Returns
+    -------
+    Diagrams
+        stations, shear, moment and deflection, each of shape (N, K).
+        Downward loads and deflections are positive.
+    """
+    length = np.atleast_1d(np.asarray(length, dtype=float))
+    n_beams = length.size
+    EI = np.broadcast_to(
+        np.asarray(mod_of_elast, dtype=float) * moment_of_inertia, (n_beams,)
+    )[:, np.newaxis]
+    cantilever = np.broadcast_to(np.asarray(cantilever, dtype=bool), (n_beams,))[
+        :, np.newaxis
+    ]
+    L = length[:, np.newaxis]
+    x = L * np.linspace(0.0, 1.0, stations)
+
+    # Uniform loads: (N, 1)
+    w = _per_beam(uniform, n_beams).sum(axis=-1, keepdims=True)
+    if depth is not None:
+        d = np.broadcast_to(np.asarray(depth, dtype=float), (n_beams,))[:, np.newaxis]
+        x_shear = np.where(cantilever, np.maximum(x, d), np.clip(x, d, L - d))
+    else:
+        x_shear = x
+    shear = np.where(cantilever, w * (L - x_shear), w * (L / 2.0 - x_shear))
+    moment = np.where(cantilever, -w * (L - x) ** 2 / 2.0, w * x * (L - x) / 2.0)
+    deflection = np.where(
+        cantilever,
+        w * x**2 * (6.0 * L**2 - 4.0 * L * x + x**2) / 24.0,
+        w * x * (L**3 - 2.0 * L * x**2 + x**3) / 24.0,
+    )
+
+    # Concentrated loads: (N, 1, P) against stations (N, K, 1)
+    P = _per_beam(point, n_beams)[:, np.newaxis, :]
+    a = _per_beam(point_location, n_beams)[:, np.newaxis, :]
+    xs = x[..., np.newaxis]
+    Ls = L[..., np.newaxis]
+    cant = cantilever[..., np.newaxis]
+    b = Ls - a
+    left = xs < a
+    R1 = P * b / Ls
+
+    point_shear = np.where(cant, np.where(left, P, 0.0), np.where(left, R1, R1 - P))
+    if depth is not None:
+        ds = d[..., np.newaxis]
+        near_support = np.where(cant, a < ds, (a < ds) | (b < ds))
+        point_shear = np.where(near_support, 0.0, point_shear)
+    point_moment = np.where(
+        cant,
+        np.where(left, -P * (a - xs), 0.0),
+        np.where(left, R1 * xs, R1 * xs - P * (xs - a)),
+    )
+    point_deflection = np.where(
+        cant,
+        np.where(
+            left, P * xs**2 * (3.0 * a - xs) / 6.0, P * a**2 * (3.0 * xs - a) / 6.0
+        ),
+        np.where(
+            left,
+            P * b * xs * (Ls**2 - b**2 - xs**2) / 6.0 / Ls,
+            P * a * (Ls - xs) * (2.0 * Ls * xs - xs**2 - a**2) / 6.0 / Ls,
+        ),
+    )
+
+    return Diagrams(
+        x,
+        shear + point_shear.sum(axis=-1),
+        moment + point_moment.sum(axis=-1),
+        (deflection + point_deflection.sum(axis=-1)) / EI,
+    )
@@ -0,0 +1,99 @@
+"""Choices for entering a breadth or depth as a whole number and a fraction.
+
+The choice tuples are built once per resolution at import and shared by every
+``BreadthDepthField`` and ``BreadthDepthWidget``, so creating a form costs a
+dictionary lookup. The compressed "whole,fraction" string the field produces
+is parsed back to inches by ``parse_dimension``.
+"""
+from collections import namedtuple
+from fractions import Fraction
+from types import MappingProxyType
+
+from django.utils.translation import gettext_lazy as _
+
+DimensionChoices = namedtuple(
+    "DimensionChoices",
+    ["whole", "fraction", "inches_per_unit", "values", "labels"],
+)
+DimensionChoices.__doc__ = """Choices of one resolution
+Parameters
+----------
+whole : ((value, label), ...) whole units
+fraction : ((value, label), ...) fractions of a unit, values as decimals
+inches_per_unit : size of one whole unit in inches
+values : {"whole,fraction": inches} for every pair of choices
+labels : (whole label, fraction label, message for a missing part) of the field
+"""
+
+
+def _build(
+    whole_units, unit_labels, divisions, inches_per_unit, fraction_label, labels
+):
+    singular, plural = unit_labels
+    whole = tuple(
+        (f"{n}", f"{n} {singular if n == 1 else plural}") for n in range(whole_units)
+    )
+    fraction = tuple(
+        (f"{n / divisions}", fraction_label(n, divisions)) for n in range(divisions)
+    )
+    values = {
+        f"{whole_value},{fraction_value}": (int(whole_value) + n / divisions)
+        * inches_per_unit
+        for whole_value, _ in whole
+        for n, (fraction_value, _) in enumerate(fraction)
+    }
+    return DimensionChoices(
+        whole, fraction, inches_per_unit, MappingProxyType(values), labels
+    )
+
+
+def _inch_fraction(n, divisions):
+    return str(Fraction(n, divisions))
+
+
+def _millimeters(n, divisions):
+    return f"{n} mm"
+
+
+INCH_LABELS = (
+    _("Inches"),
+    _("Fraction of an Inch"),
+    _("Enter an inch and a fraction of an inch."),
+)
+METRIC_LABELS = (
+    _("Centimeters"),
+    _("Millimeters"),
+    _("Enter centimeters and millimeters."),
+)
+
+DIMENSION_CHOICES = MappingProxyType(
+    {
+        "1/16": _build(16, ("inch", "inches"), 16, 1.0, _inch_fraction, INCH_LABELS),
+        "1/32": _build(16, ("inch", "inches"), 32, 1.0, _inch_fraction, INCH_LABELS),
+        # whole centimeters and millimeters
+        "mm": _build(41, ("cm", "cm"), 10, 1 / 2.54, _millimeters, METRIC_LABELS),
+    }
+)
+DEFAULT_RESOLUTION = "1/16"
+
+
+def dimension_choices(resolution=DEFAULT_RESOLUTION):
+    try:
+        return DIMENSION_CHOICES[resolution]
+    except KeyError:
+        raise ValueError(f"resolution can only be one of {tuple(DIMENSION_CHOICES)}.")
+
+
+def parse_dimension(value, resolution=DEFAULT_RESOLUTION):
+    """Inches from a compressed "whole,fraction" string, e.g. "3,0.5" is 3 1/2"
+    at the inch resolutions and 3.5 cm at "mm"
+    """
+    choices = dimension_choices(resolution)
+    inches = choices.values.get(value)
+    if inches is not None:
+        return inches
+    whole, _, fraction = value.partition(",")
+    try:
+        return (float(whole) + float(fraction or 0.0)) * choices.inches_per_unit
+    except ValueError:
+        raise ValueError(f"{value!r} is not a 'whole,fraction' dimension.")
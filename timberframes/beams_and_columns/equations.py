@@ -0,0 +1,52 @@
+"""Closed-form design equations shared by the scalar classes and the compiled
+kernels. Plain Python arithmetic only, so ``beams_and_columns.py`` can use them
+without importing NumPy and ``kernels.py`` can hand them to Numba.
+"""
+
+
+def interaction_terms(
+    d1,
+    d2,
+    l_e_c,
+    l_e_b,
+    e1,
+    e2,
+    f_c,
+    f_b1,
+    f_b2,
+    F_c_prime,
+    F_b1_prime,
+    F_b2_prime,
+    E_min_prime_1,
+    E_min_prime_2,
+    E_min_prime_c,
+):
+    """Interaction value and the critical buckling values of one member.
+    See ``Support_Type.general_eqn_for_beam_columns`` for the parameters.
+
+    Returns
+    -------
+    interaction, F_cE1, F_cE2, F_bE, excess_capacity
+    """
+    F_cE1 = 0.822 * E_min_prime_1 / (l_e_c / d1) ** 2
+    F_cE2 = 0.822 * E_min_prime_2 / (l_e_c / d2) ** 2
+    F_bE = 1.2 * E_min_prime_c * d2**2 / (l_e_b * d1)
+
+    strong_axis_moment = f_b1 + f_c * (6.0 * e1 / d1)
+    third_factor_subfactor = (strong_axis_moment / F_bE) ** 2
+    interaction = (f_c / F_c_prime) ** 2 + (
+        f_b1 + f_c * (6.0 * e1 / d1) * (1.0 + 0.234 * f_c / F_cE1)
+    ) / (F_b1_prime * (1.0 - f_c / F_cE1))
+
+    excess_capacity = third_factor_subfactor
+    if F_cE2 != 0.0:  # Don't divide by zero
+        excess_capacity += f_c / F_cE2
+        third_factor_bottom = F_b2_prime * (1.0 - f_c / F_cE2 - third_factor_subfactor)
+        if third_factor_bottom != 0.0:  # Don't divide by zero
+            interaction += (
+                f_b2
+                + f_c
+                * (6.0 * e2 / d2)
+                * (1.0 + 0.234 * f_c / F_cE2 + 0.234 * third_factor_subfactor)
+            ) / third_factor_bottom
+    return interaction, F_cE1, F_cE2, F_bE, excess_capacity
@@ -1,52 +1,36 @@
-from fractions import Fraction as frac
-
-import numpy as np
 from django import forms
-from django.db import models
-from django.utils.translation import gettext_lazy as _
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.forms.models import ModelChoiceIterator
 
+from . import catalog
+from .dimensions import DEFAULT_RESOLUTION, dimension_choices, parse_dimension
 from .widgets import BreadthDepthWidget
 
 
 class BreadthDepthField(forms.MultiValueField):
-    """Field to select inches and fractions of inches for breadth and depth models"""
+    """Field to select whole units and fractions of a unit (inches, or
+    centimeters and millimeters) for breadth and depth models
+
+    Parameters
+    ----------
+    resolution : str, optional {"1/16", "1/32", "mm"}
+        Smallest fraction that can be selected, see ``dimensions.DIMENSION_CHOICES``
+    """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, resolution=DEFAULT_RESOLUTION, **kwargs):
         # Define one message for all fields.
 
         # description = _("Field to select inches and fractions of inches for breadth and depth models.")
-        kwargs["error_messages"] = {
-            _("incomplete"): _("Enter an inch and a fraction of an inch.")
-        }
-
-        i_selections = []
-        for x in np.arange(0, 16):
-            if x == 1:
-                i_selections.append((f"{x}", f"{x} inch"))
-            else:
-                i_selections.append((f"{x}", f"{x} inches"))
-        INCH_SELECTIONS = tuple(i_selections)
-
-        f_selections = []
-        for x in np.arange(0, 16) / 16:
-            f_selections.append((f"{x}", str(frac(x))))
-        FRACTIONAL_SELECTIONS = tuple(f_selections)
+        choices = dimension_choices(resolution)
+        whole_label, fraction_label, incomplete = choices.labels
+        kwargs["error_messages"] = {"incomplete": incomplete}
 
+        self.resolution = resolution
         fields = (
-            models.CharField(
-                max_length=20,
-                choices=INCH_SELECTIONS,
-                default="0",
-                verbose_name="Inches",
-            ),
-            models.CharField(
-                max_length=20,
-                choices=FRACTIONAL_SELECTIONS,
-                default="0.0",
-                verbose_name="Fraction of an Inch",
-            ),
+            forms.ChoiceField(choices=choices.whole, label=whole_label),
+            forms.ChoiceField(choices=choices.fraction, label=fraction_label),
         )
-        kwargs["widget"] = BreadthDepthWidget  # MultiWidget(widgets=[])
+        kwargs["widget"] = BreadthDepthWidget(resolution=resolution)
         super().__init__(
             fields,
             *args,
@@ -57,3 +41,37 @@ class BreadthDepthField(forms.MultiValueField):
         if data_list:
             return (",").join(data_list)
         return None
+
+    def to_inches(self, value):
+        """Inches from the compressed value"""
+        return parse_dimension(value, self.resolution)
+
+
+class CatalogChoiceIterator(ModelChoiceIterator):
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for wood_type in catalog.wood_types():
+            yield self.choice(wood_type)
+
+    def __len__(self):
+        return len(catalog.wood_types()) + (self.field.empty_label is not None)
+
+
+class WoodTypeChoiceField(forms.ModelChoiceField):
+    """ModelChoiceField for a wood type that renders and validates from
+    ``catalog`` instead of querying its queryset"""
+
+    iterator = CatalogChoiceIterator
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            return catalog.get_wood_type(value)
+        except ObjectDoesNotExist:
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
@@ -1,6 +1,9 @@
+from decimal import Decimal
+
 from django.forms import ModelForm
 from django.utils.translation import gettext_lazy as _
 
+from .fields import WoodTypeChoiceField
 from .models import Beams_and_Columns, Wood_Type
 
 
@@ -19,7 +22,10 @@ class BeamAndColumnForm(ModelForm):
             "breadth",
             "depth",
             "length",
+            "uniform",
+            "axial",
         ]
+        field_classes = {"wood_type": WoodTypeChoiceField}
         labels = {
             "wood_type": _("What type of wood are you using?"),
             # "lumber_type": _("Lumber Type"),
@@ -33,8 +39,23 @@ class BeamAndColumnForm(ModelForm):
             "length": _(
                 "What is the unsupported span of your system (vertical or horizontal)?"
             ),
+            "uniform": _("What uniform load does the beam carry (lb/in)?"),
+            "axial": _("What axial load does the column carry (lb)?"),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Without loads the results still give the capacities
+        for name in Beams_and_Columns.INPUT_LOADS:
+            self.fields[name].required = False
+
+    def clean(self):
+        cleaned_data = super().clean()
+        for name in Beams_and_Columns.INPUT_LOADS:
+            if name not in self.errors and cleaned_data.get(name) is None:
+                cleaned_data[name] = Decimal(0)
+        return cleaned_data
+
 
 class WoodTypeForm(ModelForm):
     """
@@ -47,7 +68,7 @@ class WoodTypeForm(ModelForm):
             "wood_name",
             "lumber_type",
             "lumber_grade",
-            # "size",
+            "size_class",
             "E",
             "E_min",
             "G",
@@ -61,7 +82,7 @@ class WoodTypeForm(ModelForm):
             "wood_name": _("Wood Name"),
             "lumber_type": _("Lumber Type"),
             "lumber_grade": _("Grade"),
-            # "size": _("Size"),
+            "size_class": _("Size Class"),
             "E": _("Modulus of Elasticity"),
             "E_min": _("Minimum Modulus of Elasticity"),
             "G": _("Specific Gravity"),
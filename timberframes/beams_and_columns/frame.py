@@ -0,0 +1,296 @@
+"""Direct stiffness analysis of 2D frames such as timber bents.
+
+Posts, tie beams, rafters and knee braces are plane frame members with three
+degrees of freedom per node (u, v, rotation). The global stiffness matrix is
+assembled in sparse COO form, converted to CSC and factorized once; every load
+case is then solved against the same factorization.
+"""
+from collections import namedtuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+from .checks import CheckLog
+
+DOF_PER_NODE = 3
+
+FrameResult = namedtuple(
+    "FrameResult",
+    ["displacements", "reactions", "end_forces", "axial", "shear", "moment"],
+)
+
+
+class Frame:
+    def __init__(
+        self,
+        nodes,
+        members,
+        mod_of_elast,
+        area,
+        moment_of_inertia,
+        supports,
+        releases=None,
+    ):
+        """Plane frame made of prismatic members
+        Parameters
+        ----------
+        nodes : array_like, shape (n, 2)
+            x, y coordinates of each node (inches)
+        members : array_like of int, shape (m, 2)
+            start and end node of each member
+        mod_of_elast : array_like, shape (m,)
+            modulus of elasticity of each member (psi)
+        area : array_like, shape (m,)
+            cross-sectional area of each member (in^2)
+        moment_of_inertia : array_like, shape (m,)
+            moment of inertia of each member (in^4)
+        supports : array_like of bool, shape (n, 3)
+            restrained u, v and rotation at each node
+        releases : array_like of bool, shape (m, 2), optional
+            moment release (pin) at the start and end of each member,
+            e.g. both ends for pegged knee braces
+        """
+        self.nodes = np.asarray(nodes, dtype=float)
+        self.members = np.asarray(members, dtype=np.intp)
+        n_members = len(self.members)
+        self.EA = np.broadcast_to(
+            np.asarray(mod_of_elast, dtype=float) * area, (n_members,)
+        )
+        self.EI = np.broadcast_to(
+            np.asarray(mod_of_elast, dtype=float) * moment_of_inertia, (n_members,)
+        )
+        self.supports = np.asarray(supports, dtype=bool)
+        if releases is None:
+            releases = np.zeros((n_members, 2), dtype=bool)
+        self.releases = np.broadcast_to(
+            np.asarray(releases, dtype=bool), (n_members, 2)
+        )
+
+        delta = self.nodes[self.members[:, 1]] - self.nodes[self.members[:, 0]]
+        self.length = np.hypot(delta[:, 0], delta[:, 1])
+        self.cos = delta[:, 0] / self.length
+        self.sin = delta[:, 1] / self.length
+
+        self.n_dof = DOF_PER_NODE * len(self.nodes)
+        self.member_dofs = (
+            DOF_PER_NODE * self.members[:, :, np.newaxis] + np.arange(DOF_PER_NODE)
+        ).reshape(n_members, 2 * DOF_PER_NODE)
+
+        self.local_stiffness = self._local_stiffness()
+        self.transformation = self._transformation()
+        self.global_stiffness = np.einsum(
+            "mji,mjk,mkl->mil",
+            self.transformation,
+            self.local_stiffness,
+            self.transformation,
+        )
+        self._factorization = None
+
+    def _transformation(self):
+        c, s = self.cos, self.sin
+        T = np.zeros((len(self.members), 6, 6))
+        for offset in (0, 3):
+            T[:, offset, offset] = c
+            T[:, offset, offset + 1] = s
+            T[:, offset + 1, offset] = -s
+            T[:, offset + 1, offset + 1] = c
+            T[:, offset + 2, offset + 2] = 1.0
+        return T
+
+    def _local_stiffness(self):
+        L = self.length
+        EA_L = self.EA / L
+        EI = self.EI
+        pin_start, pin_end = self.releases[:, 0], self.releases[:, 1]
+        k = np.zeros((len(self.members), 6, 6))
+        k[:, 0, 0] = k[:, 3, 3] = EA_L
+        k[:, 0, 3] = k[:, 3, 0] = -EA_L
+
+        # Bending terms for v1, theta1, v2, theta2 with the end releases condensed out
+        fixed = np.array(
+            [[12, 6, -12, 6], [6, 4, -6, 2], [-12, -6, 12, -6], [6, 2, -6, 4]],
+            dtype=float,
+        )
+        start = np.array(
+            [[3, 0, -3, 3], [0, 0, 0, 0], [-3, 0, 3, -3], [3, 0, -3, 3]], dtype=float
+        )
+        end = np.array(
+            [[3, 3, -3, 0], [3, 3, -3, 0], [-3, -3, 3, 0], [0, 0, 0, 0]], dtype=float
+        )
+        coefficients = np.where(
+            (pin_start & pin_end)[:, None, None],
+            0.0,
+            np.where(
+                pin_start[:, None, None],
+                start,
+                np.where(pin_end[:, None, None], end, fixed),
+            ),
+        )
+        # Powers of L for each entry: EI / L^3 * [1, L, 1, L] outer [1, L, 1, L]
+        scale = np.stack([np.ones_like(L), L, np.ones_like(L), L], axis=-1)
+        bending = (
+            coefficients
+            * scale[:, :, None]
+            * scale[:, None, :]
+            * (EI / L**3)[:, None, None]
+        )
+        index = np.array([1, 2, 4, 5])
+        k[:, index[:, None], index[None, :]] = bending
+        return k
+
+    def _equivalent_loads(self, uniform):
+        """Local equivalent nodal loads for uniform transverse member loads
+        (n_cases, m, 6), with w positive in the local +y direction."""
+        w = uniform
+        L = self.length
+        pin_start, pin_end = self.releases[:, 0], self.releases[:, 1]
+        V1 = np.select(
+            [pin_start & pin_end, pin_start, pin_end], [0.5, 0.375, 0.625], 0.5
+        )
+        M1 = np.select([pin_start, pin_end], [0.0, 1.0 / 8.0], 1.0 / 12.0)
+        M2 = np.select([pin_end, pin_start], [0.0, -1.0 / 8.0], -1.0 / 12.0)
+        loads = np.zeros(w.shape + (6,))
+        loads[..., 1] = w * V1 * L
+        loads[..., 2] = w * M1 * L**2
+        loads[..., 4] = w * (1.0 - V1) * L
+        loads[..., 5] = w * M2 * L**2
+        return loads
+
+    def stiffness_matrix(self):
+        """Global stiffness matrix in CSR form"""
+        rows = np.broadcast_to(
+            self.member_dofs[:, :, None], self.global_stiffness.shape
+        )
+        cols = np.broadcast_to(
+            self.member_dofs[:, None, :], self.global_stiffness.shape
+        )
+        return sparse.coo_matrix(
+            (self.global_stiffness.ravel(), (rows.ravel(), cols.ravel())),
+            shape=(self.n_dof, self.n_dof),
+        ).tocsr()
+
+    def free_dofs(self, K=None):
+        """Unrestrained degrees of freedom. Rotations that no member resists
+        (nodes where every member is pinned) are excluded as well."""
+        if K is None:
+            K = self.stiffness_matrix()
+        free = ~self.supports.ravel() & (np.abs(K.diagonal()) > 0.0)
+        return np.flatnonzero(free)
+
+    def factorize(self):
+        """Sparse LU factorization of the free-free stiffness, computed once"""
+        if self._factorization is None:
+            K = self.stiffness_matrix()
+            free = self.free_dofs(K)
+            K_ff = K[free][:, free].tocsc()
+            self._factorization = (K, free, splu(K_ff))
+        return self._factorization
+
+    def solve(self, nodal_loads=None, uniform=None):
+        """Solves every load case against one factorization
+        Parameters
+        ----------
+        nodal_loads : array_like, shape (n_cases, n, 3) or (n, 3), optional
+            Fx, Fy and moment applied at each node
+        uniform : array_like, shape (n_cases, m) or (m,), optional
+            uniform load on each member in its local +y direction (lb/in)
+
+        Returns
+        -------
+        FrameResult
+            displacements : (n_cases, n, 3)
+            reactions : (n_cases, n, 3)
+            end_forces : (n_cases, m, 6) local N1, V1, M1, N2, V2, M2
+            axial : (n_cases, m) axial force, positive in tension
+            shear : (n_cases, m) largest shear magnitude along each member
+            moment : (n_cases, m) largest moment magnitude along each member
+        """
+        n_nodes, n_members = len(self.nodes), len(self.members)
+        if nodal_loads is None:
+            nodal_loads = np.zeros((n_nodes, DOF_PER_NODE))
+        if uniform is None:
+            uniform = np.zeros(n_members)
+        nodal_loads = np.asarray(nodal_loads, dtype=float)
+        uniform = np.asarray(uniform, dtype=float)
+        n_cases = max(
+            nodal_loads.shape[0] if nodal_loads.ndim == 3 else 1,
+            uniform.shape[0] if uniform.ndim == 2 else 1,
+        )
+        nodal_loads = np.broadcast_to(nodal_loads, (n_cases, n_nodes, DOF_PER_NODE))
+        uniform = np.broadcast_to(uniform, (n_cases, n_members))
+
+        equivalent_local = self._equivalent_loads(uniform)
+        equivalent_global = np.einsum(
+            "mji,cmj->cmi", self.transformation, equivalent_local
+        )
+        F = nodal_loads.reshape(n_cases, self.n_dof).copy()
+        for case in range(n_cases):
+            np.add.at(F[case], self.member_dofs, equivalent_global[case])
+
+        K, free, lu = self.factorize()
+        U = np.zeros((n_cases, self.n_dof))
+        U[:, free] = lu.solve(np.ascontiguousarray(F[:, free].T)).T
+
+        reactions = (K @ U.T).T - F
+        member_u = U[:, self.member_dofs]
+        local_u = np.einsum("mij,cmj->cmi", self.transformation, member_u)
+        end_forces = (
+            np.einsum("mij,cmj->cmi", self.local_stiffness, local_u) - equivalent_local
+        )
+
+        N1, V1, M1, M2 = (end_forces[..., i] for i in (0, 1, 2, 5))
+        V2 = end_forces[..., 4]
+        L = self.length
+        # Internal moment with sagging positive: M(x) = -M1 + V1 x + w x^2 / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x0 = np.clip(np.where(uniform != 0.0, -V1 / uniform, 0.0), 0.0, L)
+        span_moment = -M1 + V1 * x0 + uniform * x0**2 / 2.0
+        moment = np.max(np.abs(np.stack([M1, M2, span_moment])), axis=0)
+        shear = np.maximum(np.abs(V1), np.abs(V2))
+
+        return FrameResult(
+            U.reshape(n_cases, n_nodes, DOF_PER_NODE),
+            reactions.reshape(n_cases, n_nodes, DOF_PER_NODE)
+            * self.supports.reshape(1, n_nodes, DOF_PER_NODE),
+            end_forces,
+            -N1,
+            shear,
+            moment,
+        )
+
+
+def check_members(result, members, F_b_prime, F_v_prime, F_c_prime=None, checks=None):
+    """Feeds the governing frame forces into the member checks
+    Parameters
+    ----------
+    result : FrameResult
+    members : sequence of Beam or Column, one per frame member
+    F_b_prime, F_v_prime : array_like, shape (m,)
+        adjusted bending and shear stress of each member
+    F_c_prime : array_like, shape (m,), optional
+        adjusted compression stress of each member
+    checks : CheckLog, optional
+        Receives the bending, shear and compression checks of every member
+    """
+    if checks is None:
+        checks = CheckLog()
+    n_members = len(members)
+    F_b_prime = np.broadcast_to(F_b_prime, (n_members,))
+    F_v_prime = np.broadcast_to(F_v_prime, (n_members,))
+    moment = result.moment.max(axis=0)
+    shear = result.shear.max(axis=0)
+    compression = np.maximum(-result.axial.min(axis=0), 0.0)
+    for i, member in enumerate(members):
+        area = member.area()
+        checks.record(
+            "bending_stress", moment[i] / member.section_modulus(), F_b_prime[i]
+        )
+        checks.record("shear_stress", 1.5 * shear[i] / area, F_v_prime[i])
+        if F_c_prime is not None:
+            checks.record(
+                "compression_stress",
+                compression[i] / area,
+                np.broadcast_to(F_c_prime, (n_members,))[i],
+            )
+    return checks
@@ -0,0 +1,189 @@
+"""Bulk import of reference design values into ``Wood_Type``.
+
+Rows are read lazily from CSV (with a header row) or JSON Lines, validated
+``chunk_size`` at a time with the model field validators, and upserted on the
+natural key (wood_name, lumber_type, lumber_grade, size_class): the rows of a
+chunk that already exist are written with one ``bulk_update`` and the rest
+with one ``bulk_create``, so a chunk costs a handful of queries however many
+rows it holds. Invalid rows are reported with their line number and skipped.
+
+Bulk writes do not send ``post_save``, so the catalog is invalidated and the
+stored results of the updated wood types of a chunk are recomputed here
+instead, in one pass after the chunk is written.
+"""
+import csv
+import json
+import time
+from collections import namedtuple
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from . import catalog
+from .models import BeamColumnResult, Wood_Type
+
+FORMATS = ("csv", "jsonl")
+
+VALUE_COLUMNS = ("E", "E_min", "G", "F_v", "F_c", "F_c_perp", "F_b", "F_t")
+COLUMNS = Wood_Type.NATURAL_KEY + VALUE_COLUMNS
+OPTIONAL_COLUMNS = {"lumber_grade", "size_class"}
+
+RowError = namedtuple("RowError", ["line", "errors"])
+
+ImportReport = namedtuple(
+    "ImportReport", ["rows", "created", "updated", "invalid", "errors", "seconds"]
+)
+ImportReport.__doc__ = """Outcome of ``import_reference_values``
+Parameters
+----------
+rows : number of rows read
+created, updated : number of wood types inserted and changed
+invalid : number of rows skipped
+errors : [RowError] of the skipped rows
+seconds : wall time of the import
+"""
+
+
+def format_from_name(name):
+    """ "csv" or "jsonl" from a file name"""
+    suffix = name.rsplit(".", 1)[-1].lower()
+    if suffix in ("jsonl", "ndjson"):
+        return "jsonl"
+    if suffix == "csv":
+        return "csv"
+    raise ValueError(f"Can not tell the format of {name!r}, use one of {FORMATS}.")
+
+
+def read_rows(stream, format="csv"):
+    """Yields (line number, {column: value}) from a text stream"""
+    if format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif format == "jsonl":
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as error:
+                row = error
+            yield line_number, row
+    else:
+        raise ValueError(f"format can only be one of {FORMATS}.")
+
+
+def validate_row(row):
+    """Unsaved ``Wood_Type`` from one row
+
+    Raises
+    ------
+    ValidationError
+    """
+    if not isinstance(row, dict):
+        raise ValidationError(f"Not a JSON object: {row}")
+    missing = [
+        column
+        for column in COLUMNS
+        if column not in OPTIONAL_COLUMNS and row.get(column) in (None, "")
+    ]
+    if missing:
+        raise ValidationError(f"Missing {', '.join(missing)}.")
+    wood_type = Wood_Type(
+        **{
+            column: row[column]
+            for column in COLUMNS
+            if row.get(column) not in (None, "")
+        }
+    )
+    wood_type.full_clean(validate_unique=False)
+    return wood_type
+
+
+def natural_key(wood_type):
+    return tuple(getattr(wood_type, name) for name in Wood_Type.NATURAL_KEY)
+
+
+def upsert(wood_types, batch_size=1000):
+    """Inserts ``wood_types`` or updates the rows with the same natural key;
+    for a key given twice the last row wins
+
+    Returns
+    -------
+    (list of Wood_Type, list of Wood_Type)
+        the created and the updated wood types; a row that another import
+        inserted first is in neither
+    """
+    by_key = {natural_key(wood_type): wood_type for wood_type in wood_types}
+    existing = {
+        natural_key(wood_type): wood_type
+        for wood_type in Wood_Type.objects.filter(
+            wood_name__in={key[0] for key in by_key}
+        )
+    }
+    created = []
+    updated = []
+    for key, wood_type in by_key.items():
+        current = existing.get(key)
+        if current is None:
+            created.append(wood_type)
+        elif any(
+            getattr(current, name) != getattr(wood_type, name) for name in VALUE_COLUMNS
+        ):
+            wood_type.pk = current.pk
+            updated.append(wood_type)
+    Wood_Type.objects.bulk_update(updated, VALUE_COLUMNS, batch_size=batch_size)
+    try:
+        with transaction.atomic():
+            Wood_Type.objects.bulk_create(created, batch_size=batch_size)
+    except IntegrityError:
+        # A row inserted concurrently by another import wins over ours; insert
+        # the rest one at a time to know which of them were written
+        created = [wood_type for wood_type in created if _insert(wood_type)]
+    return created, updated
+
+
+def _insert(wood_type):
+    try:
+        with transaction.atomic():
+            Wood_Type.objects.bulk_create([wood_type])
+    except IntegrityError:
+        return False
+    return True
+
+
+def import_reference_values(stream, format="csv", chunk_size=1000, dry_run=False):
+    """Validates and upserts every row of ``stream``, one transaction per
+    chunk
+
+    Returns
+    -------
+    ImportReport
+    """
+    start = time.perf_counter()
+    rows = read_rows(stream, format)
+    count = created = updated = 0
+    errors = []
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        count += len(chunk)
+        wood_types = []
+        for line_number, row in chunk:
+            try:
+                wood_types.append(validate_row(row))
+            except ValidationError as error:
+                errors.append(RowError(line_number, error.messages))
+        if dry_run or not wood_types:
+            continue
+        with transaction.atomic():
+            new, changed = upsert(wood_types, chunk_size)
+            BeamColumnResult.objects.refresh(*changed, batch_size=chunk_size)
+            transaction.on_commit(catalog.invalidate)
+        created += len(new)
+        updated += len(changed)
+    return ImportReport(
+        count, created, updated, len(errors), errors, time.perf_counter() - start
+    )
@@ -0,0 +1,171 @@
+"""Opt-in timing of the public methods of the engine classes.
+
+Nothing is wrapped until ``instrument()`` is entered, so the engine runs its
+plain methods with no overhead by default. Inside the context every public
+method of ``Support_Type``, ``Beam``, ``Column`` and ``Loads`` is replaced by a
+wrapper that records its call count, cumulative and max wall time and input
+size; the original methods are restored on exit.
+
+    with instrument() as profile:
+        beam.deflection(5.0)
+    print(profile.table())
+
+Times are inclusive: a method that calls another public method is charged
+for both. The methods stay wrapped for the whole process while any context is
+open, but a profile only records the calls made in its own context (thread
+or asyncio task), so concurrent requests do not see each other's calls.
+"""
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+
+from .beams_and_columns import Beam, Column, Loads, Support_Type
+
+INSTRUMENTED_CLASSES = (Support_Type, Beam, Column, Loads)
+
+_lock = threading.Lock()
+# Number of open contexts, the methods are wrapped while it is positive
+_contexts = 0
+_originals = {}
+# Profiles collecting in the current context
+_profiles = ContextVar("profiles", default=())
+
+
+class MethodStats:
+    __slots__ = ("calls", "total_time", "max_time", "total_size", "max_size")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.total_size = 0
+        self.max_size = 0
+
+    def record(self, elapsed, size):
+        self.calls += 1
+        self.total_time += elapsed
+        self.total_size += size
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        if size > self.max_size:
+            self.max_size = size
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Profile(dict):
+    """{"Class.method": MethodStats} collected by ``instrument``"""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def record(self, name, elapsed, size):
+        with self._lock:
+            stats = self.get(name)
+            if stats is None:
+                stats = self[name] = MethodStats()
+            stats.record(elapsed, size)
+
+    def as_dict(self):
+        return {name: stats.as_dict() for name, stats in sorted(self.items())}
+
+    def table(self):
+        """Plain text table, slowest cumulative time first"""
+        rows = [
+            f"{'method':40} {'calls':>10} {'total (s)':>12} {'max (s)':>12} "
+            f"{'mean size':>10} {'max size':>10}"
+        ]
+        for name, stats in sorted(
+            self.items(), key=lambda item: item[1].total_time, reverse=True
+        ):
+            rows.append(
+                f"{name:40} {stats.calls:10d} {stats.total_time:12.6f} "
+                f"{stats.max_time:12.6f} {stats.total_size / stats.calls:10.1f} "
+                f"{stats.max_size:10d}"
+            )
+        return "\n".join(rows)
+
+
+def input_size(args, kwargs):
+    """Number of input values: array elements, sequence or mapping entries,
+    and one per scalar"""
+    size = 0
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, np.ndarray):
+            size += value.size
+        elif isinstance(value, (list, tuple, dict)):
+            size += len(value)
+        else:
+            size += 1
+    return size
+
+
+def _timed(name, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiles = _profiles.get()
+        if not profiles:
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            size = input_size(args, kwargs)
+            for profile in profiles:
+                profile.record(name, elapsed, size)
+
+    return wrapper
+
+
+def _public_methods(cls):
+    for name, attribute in vars(cls).items():
+        if not name.startswith("_") and callable(attribute):
+            yield name, attribute
+
+
+def _wrap():
+    for cls in INSTRUMENTED_CLASSES:
+        for name, method in _public_methods(cls):
+            _originals[cls, name] = method
+            setattr(cls, name, _timed(f"{cls.__name__}.{name}", method))
+
+
+def _unwrap():
+    for (cls, name), method in _originals.items():
+        setattr(cls, name, method)
+    _originals.clear()
+
+
+@contextmanager
+def instrument():
+    """Records calls to the engine methods made in the current thread or task
+    while the context is active. Contexts may be nested, and each gets its own
+    ``Profile``; the methods are unwrapped when the last context in the
+    process exits.
+    """
+    global _contexts
+    profile = Profile()
+    with _lock:
+        if not _contexts:
+            _wrap()
+        _contexts += 1
+    token = _profiles.set(_profiles.get() + (profile,))
+    try:
+        yield profile
+    finally:
+        _profiles.reset(token)
+        with _lock:
+            _contexts -= 1
+            if not _contexts:
+                _unwrap()
+
+
+def is_instrumented():
+    return bool(_originals)
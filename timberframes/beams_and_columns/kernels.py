@@ -0,0 +1,136 @@
+"""Fused kernel for the combined bending and axial compression interaction
+equation (AITC Equation 3.9.2-3 / NDS Equation 3.9-3).
+
+``equations.interaction_terms`` is plain scalar arithmetic. It backs
+``Support_Type.general_eqn_for_beam_columns`` and, when Numba is installed,
+is compiled into a single loop over N members that makes no temporary arrays.
+Without Numba the same equation is evaluated with NumPy in cache-sized blocks.
+"""
+import numpy as np
+
+from .equations import interaction_terms
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+BLOCK_SIZE = 4096
+
+
+def _interaction_loop(out, *columns):
+    for i in range(out.shape[0]):
+        out[i] = _interaction_terms(
+            columns[0][i],
+            columns[1][i],
+            columns[2][i],
+            columns[3][i],
+            columns[4][i],
+            columns[5][i],
+            columns[6][i],
+            columns[7][i],
+            columns[8][i],
+            columns[9][i],
+            columns[10][i],
+            columns[11][i],
+            columns[12][i],
+            columns[13][i],
+            columns[14][i],
+        )[0]
+    return out
+
+
+if HAVE_NUMBA:
+    _interaction_terms = numba.njit(cache=True)(interaction_terms)
+    _interaction_loop = numba.njit(cache=True)(_interaction_loop)
+else:
+    _interaction_terms = interaction_terms
+
+
+def _interaction_numpy(out, d1, d2, l_e_c, l_e_b, e1, e2, f_c, f_b1, f_b2, *capacities):
+    F_c_prime, F_b1_prime, F_b2_prime, E_1, E_2, E_c = capacities
+    for start in range(0, out.shape[0], BLOCK_SIZE):
+        block = slice(start, start + BLOCK_SIZE)
+        fc = f_c[block]
+        eccentric = fc * (6.0 * e1[block] / d1[block])
+
+        F_cE1 = 0.822 * E_1[block] * (d1[block] / l_e_c[block]) ** 2
+        result = fc / F_c_prime[block]
+        result *= result
+        result += (f_b1[block] + eccentric * (1.0 + 0.234 * fc / F_cE1)) / (
+            F_b1_prime[block] * (1.0 - fc / F_cE1)
+        )
+
+        F_bE = 1.2 * E_c[block] * d2[block] ** 2 / (l_e_b[block] * d1[block])
+        subfactor = (f_b1[block] + eccentric) / F_bE
+        subfactor *= subfactor
+
+        F_cE2 = 0.822 * E_2[block] * (d2[block] / l_e_c[block]) ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weak_ratio = np.where(F_cE2 != 0.0, fc / F_cE2, 0.0)
+            bottom = F_b2_prime[block] * (1.0 - weak_ratio - subfactor)
+            top = f_b2[block] + fc * (6.0 * e2[block] / d2[block]) * (
+                1.0 + 0.234 * weak_ratio + 0.234 * subfactor
+            )
+            result += np.where((F_cE2 != 0.0) & (bottom != 0.0), top / bottom, 0.0)
+        out[block] = result
+    return out
+
+
+def beam_column_interaction(
+    d1,
+    d2,
+    l_e_c,
+    l_e_b,
+    e1,
+    e2,
+    f_c,
+    f_b1,
+    f_b2,
+    F_c_prime,
+    F_b1_prime,
+    F_b2_prime,
+    E_min_prime_1,
+    E_min_prime_2,
+    E_min_prime_c,
+    use_numba=None,
+):
+    """Beam-column interaction value for N members in a single pass.
+    All inputs are broadcast to a common 1D shape; see
+    ``Support_Type.general_eqn_for_beam_columns`` for their meaning.
+
+    Parameters
+    ----------
+    use_numba : bool or None
+        Force the Numba or NumPy path; None uses Numba when it is installed
+    """
+    columns = [
+        np.ascontiguousarray(column, dtype=float).ravel()
+        for column in np.broadcast_arrays(
+            d1,
+            d2,
+            l_e_c,
+            l_e_b,
+            e1,
+            e2,
+            f_c,
+            f_b1,
+            f_b2,
+            F_c_prime,
+            F_b1_prime,
+            F_b2_prime,
+            E_min_prime_1,
+            E_min_prime_2,
+            E_min_prime_c,
+        )
+    ]
+    out = np.empty(columns[0].shape[0])
+    if use_numba is None:
+        use_numba = HAVE_NUMBA
+    if use_numba:
+        if not HAVE_NUMBA:
+            raise ImportError("numba is not installed.")
+        return _interaction_loop(out, *columns)
+    return _interaction_numpy(out, *columns)
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from timberframes.beams_and_columns import benchmarks
+
+DEFAULT_BASELINE = Path(settings.ROOT_DIR) / "benchmarks" / "beams_and_columns.json"
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the beams_and_columns engine at several problem sizes and fails "
+        "when a benchmark is slower than its JSON baseline by more than the threshold."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=list(benchmarks.SIZES),
+            help="Numbers of members to benchmark (default: %(default)s)",
+        )
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "-k", "--pattern", help="Only run benchmarks whose name matches this regex"
+        )
+        parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=10.0,
+            help="Allowed slowdown against the baseline, in percent",
+        )
+        parser.add_argument(
+            "--save",
+            action="store_true",
+            help="Write the results as the new baseline instead of comparing",
+        )
+
+    def handle(self, *args, **options):
+        results = benchmarks.run_benchmarks(
+            options["sizes"], options["repeat"], options["pattern"]
+        )
+        baseline_path = options["baseline"]
+        baseline = {}
+        if not options["save"] and baseline_path.exists():
+            baseline = benchmarks.load_baseline(baseline_path)
+
+        for name, timings in results.items():
+            for size, seconds in timings.items():
+                reference = baseline.get(name, {}).get(size)
+                change = (
+                    f"{100.0 * (seconds - reference) / reference:+8.1f}%"
+                    if reference
+                    else ""
+                )
+                self.stdout.write(f"{name:32} {size:>8} {seconds:12.6f}s {change}")
+
+        if options["save"]:
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            benchmarks.save_baseline(baseline_path, results)
+            self.stdout.write(self.style.SUCCESS(f"Saved baseline to {baseline_path}"))
+            return
+        if not baseline:
+            self.stdout.write(
+                self.style.WARNING(f"No baseline at {baseline_path}, run with --save")
+            )
+            return
+
+        regressions = benchmarks.compare(results, baseline, options["threshold"])
+        if regressions:
+            raise CommandError(
+                "Benchmarks regressed by more than {}%: {}".format(
+                    options["threshold"],
+                    ", ".join(
+                        f"{regression.name}[{regression.size}] {regression.change:+.1f}%"
+                        for regression in regressions
+                    ),
+                )
+            )
+        self.stdout.write(self.style.SUCCESS("No regressions"))
@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from timberframes.beams_and_columns.models import Beams_and_Columns
+
+
+def _batches(items, size):
+    for start in range(0, len(items), size):
+        end = start + size
+        yield items[start:end]
+
+
+class Command(BaseCommand):
+    help = (
+        "Fingerprints every Beams_and_Columns row and deletes the rows whose "
+        "inputs repeat an earlier row, keeping the oldest of each."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the duplicates without changing the table",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        kept = {}
+        duplicates = []
+        stale = []
+        calculations = Beams_and_Columns.objects.order_by("pk").only(
+            "pk",
+            "user_selected_support_type",
+            "wood_type_id",
+            "breadth",
+            "depth",
+            "length",
+            *Beams_and_Columns.INPUT_LOADS,
+            "fingerprint",
+        )
+        for calculation in calculations.iterator(chunk_size=batch_size):
+            fingerprint = calculation.input_fingerprint()
+            if fingerprint in kept:
+                duplicates.append(calculation.pk)
+            else:
+                kept[fingerprint] = calculation.pk
+                if calculation.fingerprint != fingerprint:
+                    calculation.fingerprint = fingerprint
+                    stale.append(calculation)
+
+        self.stdout.write(
+            f"{len(kept)} distinct calculations, {len(duplicates)} duplicates, "
+            f"{len(stale)} fingerprints to update"
+        )
+        if options["dry_run"]:
+            return
+
+        with transaction.atomic():
+            for batch in _batches(duplicates, batch_size):
+                Beams_and_Columns.objects.filter(pk__in=batch).delete()
+            # Cleared first so an outdated fingerprint cannot collide with
+            # another row's new one partway through the update
+            for batch in _batches(stale, batch_size):
+                Beams_and_Columns.objects.filter(
+                    pk__in=[calculation.pk for calculation in batch]
+                ).update(fingerprint=None)
+            Beams_and_Columns.objects.bulk_update(
+                stale, ["fingerprint"], batch_size=batch_size
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {len(duplicates)} duplicate calculations")
+        )
@@ -0,0 +1,35 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from timberframes.beams_and_columns import benchmarks
+from timberframes.beams_and_columns.instrument import instrument
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs engine workloads with the Support_Type, Beam, Column and Loads "
+        "methods instrumented and prints call counts, times and input sizes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-k",
+            "--pattern",
+            default=r"^scalar\.",
+            help="Regex of the benchmark workloads to run (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--size", type=int, default=1000, help="Members per workload"
+        )
+        parser.add_argument("--format", choices=["table", "json"], default="table")
+
+    def handle(self, *args, **options):
+        with instrument() as profile:
+            benchmarks.run_benchmarks(
+                [options["size"]], repeat=1, pattern=options["pattern"]
+            )
+        if options["format"] == "json":
+            self.stdout.write(json.dumps(profile.as_dict(), indent=2))
+        else:
+            self.stdout.write(profile.table())
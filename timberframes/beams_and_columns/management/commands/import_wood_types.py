@@ -0,0 +1,61 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from timberframes.beams_and_columns import importer
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports reference design values from a CSV or JSON Lines file into "
+        "Wood_Type, updating the rows with the same wood name, lumber type, "
+        "grade and size class."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - for stdin")
+        parser.add_argument(
+            "--format",
+            choices=importer.FORMATS,
+            help="Format of the file (default: from its extension)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only validate the rows"
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = options["format"]
+        if format is None:
+            if path == "-":
+                raise CommandError("--format is required when reading from stdin")
+            try:
+                format = importer.format_from_name(path)
+            except ValueError as error:
+                raise CommandError(error)
+
+        if path == "-":
+            report = self._import(sys.stdin, format, options)
+        else:
+            try:
+                with open(path, newline="", encoding="utf-8-sig") as stream:
+                    report = self._import(stream, format, options)
+            except OSError as error:
+                raise CommandError(error)
+
+        for error in report.errors:
+            self.stderr.write(f"line {error.line}: {' '.join(error.errors)}")
+        rate = report.rows / report.seconds if report.seconds else 0.0
+        self.stdout.write(
+            f"{report.rows} rows in {report.seconds:.2f}s ({rate:.0f} rows/s): "
+            f"{report.created} created, {report.updated} updated, "
+            f"{report.invalid} invalid"
+        )
+        if report.invalid:
+            raise CommandError(f"{report.invalid} rows were invalid and skipped")
+
+    def _import(self, stream, format, options):
+        return importer.import_reference_values(
+            stream, format, options["chunk_size"], options["dry_run"]
+        )
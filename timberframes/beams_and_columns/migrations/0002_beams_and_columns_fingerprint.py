@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("beams_and_columns", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="beams_and_columns",
+            name="fingerprint",
+            field=models.CharField(
+                editable=False, max_length=64, null=True, unique=True
+            ),
+        ),
+    ]
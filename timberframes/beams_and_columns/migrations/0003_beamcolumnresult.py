@@ -0,0 +1,37 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("beams_and_columns", "0002_beams_and_columns_fingerprint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BeamColumnResult",
+            fields=[
+                (
+                    "calculation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="result",
+                        serialize=False,
+                        to="beams_and_columns.beams_and_columns",
+                    ),
+                ),
+                ("governing", models.FloatField(db_index=True, null=True)),
+                ("governing_check", models.CharField(blank=True, max_length=20)),
+                ("breakdown", models.JSONField(default=dict)),
+                ("engine_version", models.CharField(max_length=20)),
+                ("wood_type_revision", models.CharField(max_length=16)),
+            ],
+            options={
+                "verbose_name": "Beam and Column Result",
+                "verbose_name_plural": "Beam and Column Results",
+            },
+        ),
+    ]
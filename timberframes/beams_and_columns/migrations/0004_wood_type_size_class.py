@@ -0,0 +1,50 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:35
+
+from django.db import migrations, models
+
+
+def rename_duplicates(apps, schema_editor):
+    """Every row has size_class "dimension" at this point, so rows that share a
+    wood name, lumber type and grade would break the new constraint. Keep the
+    oldest row's name and append the id to the others' rather than merging,
+    since calculations point at them."""
+    Wood_Type = apps.get_model("beams_and_columns", "Wood_Type")
+    seen = set()
+    for wood_type in Wood_Type.objects.order_by("pk"):
+        key = (wood_type.wood_name, wood_type.lumber_type, wood_type.lumber_grade)
+        if key in seen:
+            suffix = f" ({wood_type.pk})"
+            wood_type.wood_name = wood_type.wood_name[: 200 - len(suffix)] + suffix
+            wood_type.save(update_fields=["wood_name"])
+        else:
+            seen.add(key)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("beams_and_columns", "0003_beamcolumnresult"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="wood_type",
+            name="size_class",
+            field=models.CharField(
+                choices=[
+                    ("dimension", 'Dimension Lumber (2" to 4" thick)'),
+                    ("timber", 'Timbers (5" x 5" and larger)'),
+                ],
+                default="dimension",
+                max_length=20,
+                verbose_name="Size Class",
+            ),
+        ),
+        migrations.RunPython(rename_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="wood_type",
+            constraint=models.UniqueConstraint(
+                fields=("wood_name", "lumber_type", "lumber_grade", "size_class"),
+                name="unique_wood_type_reference_row",
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 3.2.25 on 2026-10-17 22:03
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def refingerprint(apps, schema_editor):
+    """The loads are part of the fingerprint now, so recompute it for every
+    row; they are all 0 here, so rows that were distinct stay distinct"""
+    from timberframes.beams_and_columns.calculations import input_fingerprint
+
+    Beams_and_Columns = apps.get_model("beams_and_columns", "Beams_and_Columns")
+    calculations = list(Beams_and_Columns.objects.exclude(fingerprint=None))
+    for calculation in calculations:
+        calculation.fingerprint = input_fingerprint(
+            calculation.user_selected_support_type,
+            calculation.wood_type_id,
+            calculation.breadth,
+            calculation.depth,
+            calculation.length,
+            uniform=calculation.uniform,
+            axial=calculation.axial,
+        )
+    Beams_and_Columns.objects.bulk_update(
+        calculations, ["fingerprint"], batch_size=2000
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("beams_and_columns", "0004_wood_type_size_class"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="beams_and_columns",
+            name="axial",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                max_digits=9,
+                validators=[django.core.validators.MinValueValidator(0)],
+                verbose_name="Axial compression load on the column (lb)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="beams_and_columns",
+            name="uniform",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                max_digits=9,
+                validators=[django.core.validators.MinValueValidator(0)],
+                verbose_name="Uniform load on the beam (lb/in)",
+            ),
+        ),
+        migrations.RunPython(refingerprint, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,20 @@
-from django.db import models
+import hashlib
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
+from django.db import IntegrityError, models, transaction
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
-from . import beams_and_columns as bac
+from . import catalog
+from .calculations import (
+    ENGINE_VERSION,
+    evaluate_members,
+    governing_check,
+    input_fingerprint,
+    member_results,
+)
 
 # from .fields import BreadthDepthField
 
@@ -20,7 +32,7 @@ class Wood_Type(models.Model):
         Drop-down or Radial button
     grade
         Drop-down or Radial button
-    size : Different tables for (2-4") and (5"x5" or larger)
+    size_class : Different tables for (2-4") and (5"x5" or larger)
         Drop-down or Radial button
     E : modulus of elasticity (psi)
         * Short Float
@@ -63,6 +75,11 @@ class Wood_Type(models.Model):
         # ("standard", _("Standard")),
         # ("utility", _("Utility")),
     )
+    # NDS Supplement tables the design values come from
+    SIZE_CLASS_CHOICES = (
+        ("dimension", _('Dimension Lumber (2" to 4" thick)')),
+        ("timber", _('Timbers (5" x 5" and larger)')),
+    )
 
     wood_name = models.CharField(max_length=200)
     # lumber_type = models.ForeignKey("Lumber_Type", on_delete=models.CASCADE)
@@ -78,6 +95,12 @@ class Wood_Type(models.Model):
     lumber_grade = models.CharField(
         max_length=20, choices=LUMBER_GRADE, default="no_2", verbose_name="Lumber Grade"
     )
+    size_class = models.CharField(
+        max_length=20,
+        choices=SIZE_CLASS_CHOICES,
+        default="dimension",
+        verbose_name="Size Class",
+    )
     E = models.DecimalField(
         max_digits=9, decimal_places=2, verbose_name="Modulus of Elasticity (psi)"
     )
@@ -113,9 +136,32 @@ class Wood_Type(models.Model):
         verbose_name="Design Tension Parallel to Grain (psi)",
     )
 
+    # Fields the engine results depend on
+    REFERENCE_FIELDS = (
+        "lumber_type",
+        "E",
+        "E_min",
+        "G",
+        "F_v",
+        "F_c",
+        "F_c_perp",
+        "F_b",
+        "F_t",
+        "size_class",
+    )
+
+    # Identifies a row of the reference value tables, see importer.py
+    NATURAL_KEY = ("wood_name", "lumber_type", "lumber_grade", "size_class")
+
     class Meta:
         verbose_name = _("Wood Type")
         verbose_name_plural = _("Wood Types")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["wood_name", "lumber_type", "lumber_grade", "size_class"],
+                name="unique_wood_type_reference_row",
+            )
+        ]
 
     def __str__(self):
         return str(self.wood_name)
@@ -128,6 +174,22 @@ class Wood_Type(models.Model):
             (field.name, field.value_to_string(self)) for field in self._meta.fields
         ]
 
+    def validate_unique(self, exclude=None):
+        # Check the natural key even when a form leaves part of it out, such as
+        # WoodTypeUpdateView without wood_name, instead of failing on insert
+        if exclude:
+            exclude = [name for name in exclude if name not in self.NATURAL_KEY]
+        super().validate_unique(exclude)
+
+    @property
+    def revision(self):
+        """Digest of the reference design values, changes whenever they do"""
+        values = [
+            value if isinstance(value, str) else repr(float(value))
+            for value in (getattr(self, name) for name in self.REFERENCE_FIELDS)
+        ]
+        return hashlib.blake2b("|".join(values).encode(), digest_size=8).hexdigest()
+
 
 """
 class BreadthDepthModelField(models.Field):
@@ -143,6 +205,36 @@ class BreadthDepthModelField(models.Field):
 """
 
 
+class CalculationManager(models.Manager):
+    def get_or_create_calculation(self, calculation):
+        """The saved calculation with the same inputs as the unsaved
+        ``calculation``, which is only inserted when there is none
+
+        Concurrent submissions of the same inputs race on the unique
+        fingerprint: the losing insert fails and reads the winner's row.
+
+        Returns
+        -------
+        (Beams_and_Columns, bool)
+            the calculation and whether it was created
+        """
+        fingerprint = calculation.input_fingerprint()
+        try:
+            return self.get(fingerprint=fingerprint), False
+        except self.model.DoesNotExist:
+            pass
+        try:
+            with transaction.atomic(using=self.db):
+                calculation.save(force_insert=True, using=self.db)
+            return calculation, True
+        except IntegrityError:
+            try:
+                return self.get(fingerprint=fingerprint), False
+            except self.model.DoesNotExist:
+                pass
+            raise
+
+
 class Beams_and_Columns(models.Model):
     """
     Parameters
@@ -160,6 +252,8 @@ class Beams_and_Columns(models.Model):
         - depth
             * Short Float
             * Include units with drop-down
+    uniform : uniform load on the beam (lb/in), 0 for a column
+    axial : axial compression load on the column (lb), 0 for a beam
     """
 
     SUPPORT_TYPE_CHOICES = (
@@ -203,6 +297,33 @@ class Beams_and_Columns(models.Model):
         default=1.0,
         verbose_name="Unsupported span length (vertical or horizontal)",
     )
+    uniform = models.DecimalField(
+        max_digits=9,
+        decimal_places=2,
+        default=0,
+        validators=[MinValueValidator(0)],
+        verbose_name="Uniform load on the beam (lb/in)",
+    )
+    axial = models.DecimalField(
+        max_digits=9,
+        decimal_places=2,
+        default=0,
+        validators=[MinValueValidator(0)],
+        verbose_name="Axial compression load on the column (lb)",
+    )
+    # Hash of the inputs, see input_fingerprint. Null on rows saved before it
+    # existed until collapse_duplicate_calculations has run
+    fingerprint = models.CharField(
+        max_length=64, unique=True, null=True, editable=False
+    )
+
+    # Fields rounded to their decimal places before fingerprinting, so the
+    # fingerprint matches the values as stored
+    INPUT_DIMENSIONS = ("breadth", "depth", "length")
+    # Keyword arguments of calculations.evaluate, rounded the same way
+    INPUT_LOADS = ("uniform", "axial")
+
+    objects = CalculationManager()
 
     class Meta:
         verbose_name = _("Beam and Column Calculation")
@@ -219,26 +340,267 @@ class Beams_and_Columns(models.Model):
             (field.name, field.value_to_string(self)) for field in self._meta.fields
         ]
 
+    def get_wood_type(self):
+        """The wood type, from ``catalog`` unless it is already loaded"""
+        field = self._meta.get_field("wood_type")
+        if not field.is_cached(self):
+            field.set_cached_value(self, catalog.get_wood_type(self.wood_type_id))
+        return self.wood_type
+
     @property
     def support_type(self):
+        # Imported here so loading the models (migrate, worker boot) does not
+        # pull in the engine
+        from . import beams_and_columns as bac
+
+        wood_type = self.get_wood_type()
         if self.user_selected_support_type == "beam":
             return bac.Beam(
                 self.user_selected_support_type,
-                self.wood_type.lumber_type,
+                wood_type.lumber_type,
                 self.depth,
                 self.breadth,
                 self.length,
-                self.wood_type.E,
+                wood_type.E,
             )
         else:
             return bac.Column(
-                self.user_selected_support_type,
-                self.wood_type.lumber_type,
+                "column"
+                if self.user_selected_support_type == "column"
+                else "beam_column",
+                wood_type.lumber_type,
                 self.depth,
                 self.breadth,
                 self.length,
-                self.wood_type.E,
+                wood_type.E,
+            )
+
+    def save(self, *args, **kwargs):
+        self.fingerprint = self.input_fingerprint()
+        super().save(*args, **kwargs)
+
+    def validate_unique(self, exclude=None):
+        # The fingerprint is not editable, so forms never check it. New
+        # calculations reuse the row with the same inputs through
+        # get_or_create_calculation; an edit that makes a saved calculation
+        # match another one is reported here instead of failing on update
+        super().validate_unique(exclude)
+        if self._state.adding:
+            return
+        clashes = (
+            type(self)
+            ._default_manager.filter(fingerprint=self.input_fingerprint())
+            .exclude(pk=self.pk)
+        )
+        if clashes.exists():
+            raise ValidationError(
+                _("A calculation with the same inputs already exists."),
+                code="unique",
             )
 
+    def input_fingerprint(self):
+        """Identifies the calculation by its inputs, see
+        ``calculations.input_fingerprint``"""
+        return input_fingerprint(
+            self.user_selected_support_type,
+            self.wood_type_id,
+            *(self._stored_value(name) for name in self.INPUT_DIMENSIONS),
+            **self.calculation_options(),
+        )
+
+    def _stored_value(self, name):
+        field = self._meta.get_field(name)
+        value = field.to_python(getattr(self, name))
+        return value.quantize(Decimal(1).scaleb(-field.decimal_places))
+
+    def calculation_options(self):
+        """Loads passed to the engine besides the member itself"""
+        return {name: self._stored_value(name) for name in self.INPUT_LOADS}
+
+    def engine_inputs(self):
+        """(support type, breadth, depth, length, options), see
+        ``calculations.evaluate_members``"""
+        return (
+            self.user_selected_support_type,
+            self.breadth,
+            self.depth,
+            self.length,
+            self.calculation_options(),
+        )
+
+    def results(self):
+        """Capacities and utilizations from the stored result when it is
+        current, otherwise from ``calculations.member_results``"""
+        try:
+            stored = self.result
+        except BeamColumnResult.DoesNotExist:
+            stored = None
+        wood_type = self.get_wood_type()
+        if stored is not None and stored.is_current(wood_type):
+            return stored.breakdown or None
+        support_type, breadth, depth, length, options = self.engine_inputs()
+        return member_results(
+            support_type, wood_type, breadth, depth, length, **options
+        )
+
     # @property
     # def support_analysis(self):
+
+
+class BeamColumnResultQuerySet(models.QuerySet):
+    def current(self):
+        return self.filter(engine_version=ENGINE_VERSION)
+
+    def failing(self):
+        """Results with a check over its capacity"""
+        return self.filter(governing__gt=1.0)
+
+
+class BeamColumnResultManager(models.Manager.from_queryset(BeamColumnResultQuerySet)):
+    def store(self, calculations, batch_size=1000):
+        """Evaluates ``calculations`` with one engine call per wood type and
+        creates or updates their results
+
+        The wood type of every calculation should already be loaded.
+        """
+        by_wood_type = {}
+        for calculation in calculations:
+            by_wood_type.setdefault(calculation.wood_type_id, []).append(calculation)
+
+        results = []
+        for group in by_wood_type.values():
+            wood_type = group[0].wood_type
+            revision = wood_type.revision
+            breakdowns = evaluate_members(
+                wood_type, [calculation.engine_inputs() for calculation in group]
+            )
+            if breakdowns is None:
+                breakdowns = [{}] * len(group)
+            for calculation, breakdown in zip(group, breakdowns):
+                results.append(
+                    self.model(
+                        calculation=calculation,
+                        governing=breakdown.get("governing"),
+                        governing_check=(
+                            governing_check(breakdown) if breakdown else ""
+                        ),
+                        breakdown=breakdown,
+                        engine_version=ENGINE_VERSION,
+                        wood_type_revision=revision,
+                    )
+                )
+
+        existing = set(
+            self.filter(pk__in=[result.pk for result in results]).values_list(
+                "pk", flat=True
+            )
+        )
+        # Another request storing the same new calculation wrote the same
+        # values, so losing that race is harmless
+        self.bulk_create(
+            [result for result in results if result.pk not in existing],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        self.bulk_update(
+            [result for result in results if result.pk in existing],
+            BeamColumnResult.UPDATED_FIELDS,
+            batch_size=batch_size,
+        )
+        return results
+
+    def refresh(self, *wood_types, batch_size=1000):
+        """Recomputes the results of the calculations of ``wood_types`` that
+        are missing or were computed from other design values or engine
+        version, in one pass over their calculations ``batch_size`` at a time
+
+        Returns
+        -------
+        int
+            number of results recomputed
+        """
+        by_pk = {wood_type.pk: wood_type for wood_type in wood_types}
+        if not by_pk:
+            return 0
+        # Rows already at one of the revisions are left out by the query, the
+        # loop checks that it is the revision of their own wood type
+        calculations = (
+            Beams_and_Columns.objects.filter(wood_type__in=by_pk)
+            .exclude(
+                result__wood_type_revision__in={
+                    wood_type.revision for wood_type in by_pk.values()
+                },
+                result__engine_version=ENGINE_VERSION,
+            )
+            .annotate(
+                stored_revision=models.F("result__wood_type_revision"),
+                stored_engine_version=models.F("result__engine_version"),
+            )
+            .order_by("pk")
+        )
+        count = 0
+        batch = []
+        for calculation in calculations.iterator(chunk_size=batch_size):
+            wood_type = by_pk[calculation.wood_type_id]
+            if (
+                calculation.stored_revision == wood_type.revision
+                and calculation.stored_engine_version == ENGINE_VERSION
+            ):
+                continue
+            calculation.wood_type = wood_type
+            batch.append(calculation)
+            if len(batch) == batch_size:
+                count += len(self.store(batch, batch_size))
+                batch = []
+        if batch:
+            count += len(self.store(batch, batch_size))
+        return count
+
+
+class BeamColumnResult(models.Model):
+    """Stored results of a calculation, so listing and filtering them is a
+    query instead of an engine run per row
+
+    Parameters
+    ----------
+    governing : highest utilization of any check, null without design values
+    governing_check : name of the check with the highest utilization
+    breakdown : {name: value} of ``calculations.RESULT_FIELDS``
+    engine_version : ``calculations.ENGINE_VERSION`` the results come from
+    wood_type_revision : ``Wood_Type.revision`` the results come from
+    """
+
+    calculation = models.OneToOneField(
+        Beams_and_Columns,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="result",
+    )
+    governing = models.FloatField(null=True, db_index=True)
+    governing_check = models.CharField(max_length=20, blank=True)
+    breakdown = models.JSONField(default=dict)
+    engine_version = models.CharField(max_length=20)
+    wood_type_revision = models.CharField(max_length=16)
+
+    UPDATED_FIELDS = (
+        "governing",
+        "governing_check",
+        "breakdown",
+        "engine_version",
+        "wood_type_revision",
+    )
+
+    objects = BeamColumnResultManager()
+
+    class Meta:
+        verbose_name = _("Beam and Column Result")
+        verbose_name_plural = _("Beam and Column Results")
+
+    def __str__(self):
+        return f"{self.calculation_id}: {self.governing_check} {self.governing}"
+
+    def is_current(self, wood_type):
+        return (
+            self.engine_version == ENGINE_VERSION
+            and self.wood_type_revision == wood_type.revision
+        )
@@ -0,0 +1,195 @@
+"""Monte Carlo reliability of a member's capacity.
+
+The modulus of elasticity and the reference strengths are sampled around their
+published values, and the column stability, beam stability and beam-column
+interaction checks are evaluated on all samples of a chunk at once. Samples
+are drawn in fixed-size chunks, so memory stays bounded however many samples
+are requested. Every chunk gets its own child of one ``SeedSequence``, so
+results are the same whether chunks run serially or across a process pool.
+"""
+import math
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from .batch import (
+    COLUMN_STABILITY_C,
+    COV_E,
+    LUMBER_TYPES,
+    beam_stability_factor,
+    column_stability_factor,
+)
+
+ReliabilityModel = namedtuple(
+    "ReliabilityModel",
+    [
+        "lumber_type",
+        "E",
+        "F_c",
+        "F_b",
+        "f_c",
+        "f_b",
+        "column_slenderness",
+        "beam_slenderness",
+        "strength_cov",
+    ],
+    defaults=[0.0, 0.0, 0.0, 0.0, 0.2],
+)
+ReliabilityModel.__doc__ = """Mean properties and demands of one member
+Parameters
+----------
+lumber_type : "lumber" or "glulam", selects CoVE and the column "c"
+E : mean modulus of elasticity (psi)
+F_c : mean compression strength parallel to grain (psi)
+F_b : mean bending strength (psi)
+f_c : applied axial compression stress (psi)
+f_b : applied bending stress (psi)
+column_slenderness : l_e / d of the member as a column, 0 if fully braced
+beam_slenderness : R_B of the member as a beam, 0 if fully braced
+strength_cov : coefficient of variation of F_c and F_b
+"""
+
+ReliabilityResult = namedtuple(
+    "ReliabilityResult", ["probability", "lower", "upper", "failures", "samples"]
+)
+
+
+def _lognormal(rng, mean, cov, size):
+    sigma = math.sqrt(math.log1p(cov**2))
+    return rng.lognormal(math.log(mean) - sigma**2 / 2.0, sigma, size)
+
+
+def failures_in_chunk(model, size, seed):
+    """Number of failed samples out of ``size`` drawn from ``seed``"""
+    rng = np.random.default_rng(seed)
+    lumber_code = LUMBER_TYPES.index(model.lumber_type)
+    E = rng.normal(model.E, COV_E[lumber_code] * model.E, size)
+    np.maximum(E, 1.0, out=E)
+
+    interaction = np.zeros(size)
+    failed = np.zeros(size, dtype=bool)
+    F_cE = np.inf
+    if model.f_c:
+        F_c = _lognormal(rng, model.F_c, model.strength_cov, size)
+        if model.column_slenderness:
+            F_cE = 0.822 * E / model.column_slenderness**2
+            F_c *= column_stability_factor(F_cE / F_c, COLUMN_STABILITY_C[lumber_code])
+            failed |= model.f_c >= F_cE
+        interaction += (model.f_c / F_c) ** 2
+    if model.f_b:
+        F_b = _lognormal(rng, model.F_b, model.strength_cov, size)
+        if model.beam_slenderness:
+            F_b *= beam_stability_factor(1.2 * E / model.beam_slenderness**2 / F_b)
+        interaction += model.f_b / (F_b * (1.0 - model.f_c / F_cE))
+    failed |= interaction > 1.0
+    return int(np.count_nonzero(failed))
+
+
+def _chunk_failures(args):
+    return failures_in_chunk(*args)
+
+
+def iter_chunk_failures(
+    model, n_samples, chunk_size=2**20, seed=None, processes=None
+):
+    """Streams (samples, failures) per chunk, in chunk order
+
+    Parameters
+    ----------
+    model : ReliabilityModel
+    n_samples : int
+        total number of samples
+    chunk_size : int
+        samples held in memory at once per worker
+    seed : int or None
+        entropy of the root SeedSequence
+    processes : int or None
+        worker processes; None or 1 evaluates the chunks in this process
+
+    Raises
+    ------
+    ValueError
+        for log members, or when ``n_samples`` or ``chunk_size`` is less than 1,
+        before any chunk is evaluated
+    """
+    if model.lumber_type == "log":
+        # No published CoVE for round timbers, as in Support_Type.modulus_of_elasticity
+        raise ValueError("No design values are available for log members.")
+    if n_samples < 1:
+        raise ValueError("n_samples must be at least 1.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    return _iter_chunk_failures(model, n_samples, chunk_size, seed, processes)
+
+
+def _iter_chunk_failures(model, n_samples, chunk_size, seed, processes):
+    sizes = [chunk_size] * (n_samples // chunk_size)
+    if n_samples % chunk_size:
+        sizes.append(n_samples % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(model, size, child) for size, child in zip(sizes, seeds)]
+
+    if processes is None or processes == 1:
+        for size, task in zip(sizes, tasks):
+            yield size, _chunk_failures(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for size, failures in zip(sizes, executor.map(_chunk_failures, tasks)):
+            yield size, failures
+
+
+def probability_of_failure(
+    model,
+    n_samples=10**6,
+    chunk_size=2**20,
+    seed=None,
+    processes=None,
+    confidence=0.95,
+):
+    """Probability of failure with a Wilson score confidence interval
+
+    Parameters
+    ----------
+    model : ReliabilityModel
+    n_samples : int
+        total number of samples, e.g. 10**7
+    chunk_size : int
+        samples held in memory at once per worker
+    seed : int or None
+        entropy of the root SeedSequence, for reproducible runs
+    processes : int or None
+        worker processes; None or 1 evaluates the chunks in this process
+    confidence : float
+        two-sided confidence level of the interval
+
+    Raises
+    ------
+    ValueError
+        for log members, or when ``n_samples`` or ``chunk_size`` is less than 1
+    """
+    samples = failures = 0
+    for size, chunk_failures in iter_chunk_failures(
+        model, n_samples, chunk_size=chunk_size, seed=seed, processes=processes
+    ):
+        samples += size
+        failures += chunk_failures
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    p = failures / samples
+    denominator = 1.0 + z**2 / samples
+    center = (p + z**2 / 2.0 / samples) / denominator
+    half_width = (
+        z
+        * math.sqrt(p * (1.0 - p) / samples + z**2 / 4.0 / samples**2)
+        / denominator
+    )
+    return ReliabilityResult(
+        p,
+        max(center - half_width, 0.0),
+        min(center + half_width, 1.0),
+        failures,
+        samples,
+    )
@@ -0,0 +1,154 @@
+"""Shrinkage of green timber members over a drying schedule.
+
+``Support_Type.estimated_shrinkage`` gives the shrinkage between two moisture
+contents. Here a moisture time series is consumed lazily, a chunk of time
+steps at a time, and the cumulative change in breadth and depth of every
+member is yielded per chunk. Only one (chunk, members) block is ever held in
+memory, so long schedules and large frames can be streamed from a sensor log
+or a file.
+"""
+from collections import namedtuple
+from itertools import islice
+
+import numpy as np
+
+# Wood does not shrink above the fiber saturation point
+FIBER_SATURATION = 0.3
+
+ShrinkageChunk = namedtuple(
+    "ShrinkageChunk",
+    ["start", "stop", "breadth_change", "depth_change", "exceeded", "first_exceeded"],
+)
+ShrinkageChunk.__doc__ = """Cumulative shrinkage for time steps start:stop
+Parameters
+----------
+start, stop : time step indices of the chunk
+breadth_change, depth_change : (stop - start, N) shrinkage since the first
+    time step (inches)
+exceeded : (N,) members whose shrinkage has passed the tolerance so far
+first_exceeded : (N,) first time step past the tolerance, -1 if none yet
+"""
+
+ShrinkageSummary = namedtuple(
+    "ShrinkageSummary",
+    [
+        "breadth_change",
+        "depth_change",
+        "max_breadth_change",
+        "max_depth_change",
+        "exceeded",
+        "first_exceeded",
+        "steps",
+    ],
+)
+
+
+def _effective_moisture(moisture, shape):
+    return np.clip(
+        np.broadcast_to(np.asarray(moisture, dtype=float), shape),
+        0.0,
+        FIBER_SATURATION,
+    )
+
+
+def iter_shrinkage(
+    moisture,
+    breadth,
+    depth,
+    S_0_breadth,
+    S_0_depth,
+    tolerance=np.inf,
+    chunk_size=1024,
+):
+    """Streams cumulative shrinkage, chunk by chunk of time steps
+
+    Parameters
+    ----------
+    moisture : iterable
+        moisture content (fraction, e.g. 0.25) per time step, either one value
+        for all members or one value per member; the first step is the
+        installed condition
+    breadth, depth : array_like
+        green dimensions of the members (inches)
+    S_0_breadth, S_0_depth : array_like
+        total shrinkage across the breadth and the depth from Table 2.3.1-1
+        (fraction, e.g. 0.04 for 4%)
+    tolerance : float or array_like
+        shrinkage at a joint (inches) past which a member is flagged
+    chunk_size : int
+        time steps held in memory at once
+    """
+    moisture = iter(moisture)
+    rows = list(islice(moisture, chunk_size))
+    if not rows:
+        return
+    # Members are given by the dimensions, or by per-member moisture contents
+    breadth, depth, S_0_breadth, S_0_depth, tolerance, _ = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(breadth, dtype=float)),
+        np.asarray(depth, dtype=float),
+        np.asarray(S_0_breadth, dtype=float),
+        np.asarray(S_0_depth, dtype=float),
+        np.asarray(tolerance, dtype=float),
+        np.asarray(rows[0], dtype=float),
+    )
+    shape = breadth.shape
+    # inches of shrinkage per unit of moisture content lost
+    breadth_rate = breadth * S_0_breadth / FIBER_SATURATION
+    depth_rate = depth * S_0_depth / FIBER_SATURATION
+
+    exceeded = np.zeros(shape, dtype=bool)
+    first_exceeded = np.full(shape, -1)
+    initial = None
+    start = 0
+    while rows:
+        stop = start + len(rows)
+        block = _effective_moisture(
+            [np.broadcast_to(row, shape) for row in rows], (len(rows),) + shape
+        )
+        if initial is None:
+            initial = block[0].copy()
+        lost = initial - block
+        breadth_change = lost * breadth_rate
+        depth_change = lost * depth_rate
+
+        past = (np.abs(breadth_change) > tolerance) | (np.abs(depth_change) > tolerance)
+        new = past.any(axis=0) & ~exceeded
+        first_exceeded[new] = start + np.argmax(past[:, new], axis=0)
+        exceeded |= new
+
+        yield ShrinkageChunk(
+            start,
+            stop,
+            breadth_change,
+            depth_change,
+            exceeded.copy(),
+            first_exceeded.copy(),
+        )
+        start = stop
+        rows = list(islice(moisture, chunk_size))
+
+
+def shrinkage_summary(*args, **kwargs):
+    """Final and peak shrinkage over the whole schedule; takes the same
+    arguments as ``iter_shrinkage``"""
+    chunk = None
+    max_breadth_change = max_depth_change = None
+    for chunk in iter_shrinkage(*args, **kwargs):
+        peak_breadth = chunk.breadth_change.max(axis=0)
+        peak_depth = chunk.depth_change.max(axis=0)
+        if max_breadth_change is None:
+            max_breadth_change, max_depth_change = peak_breadth, peak_depth
+        else:
+            np.maximum(max_breadth_change, peak_breadth, out=max_breadth_change)
+            np.maximum(max_depth_change, peak_depth, out=max_depth_change)
+    if chunk is None:
+        raise ValueError("moisture must have at least one time step.")
+    return ShrinkageSummary(
+        chunk.breadth_change[-1],
+        chunk.depth_change[-1],
+        max_breadth_change,
+        max_depth_change,
+        chunk.exceeded,
+        chunk.first_exceeded,
+        chunk.stop,
+    )
@@ -0,0 +1,28 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import catalog
+from .models import BeamColumnResult, Beams_and_Columns, Wood_Type
+
+
+@receiver(post_save, sender=Beams_and_Columns)
+def store_result(sender, instance, raw, **kwargs):
+    if not raw:
+        BeamColumnResult.objects.store([instance])
+
+
+@receiver(post_save, sender=Wood_Type)
+def refresh_results(sender, instance, raw, **kwargs):
+    # Covers WoodTypeUpdateView and the admin; a save that leaves the design
+    # values unchanged finds nothing stale
+    if not raw:
+        BeamColumnResult.objects.refresh(instance)
+
+
+@receiver(post_save, sender=Wood_Type)
+@receiver(post_delete, sender=Wood_Type)
+def invalidate_catalog(sender, **kwargs):
+    # After the commit, or another worker could reload the old rows under the
+    # new version
+    transaction.on_commit(catalog.invalidate)
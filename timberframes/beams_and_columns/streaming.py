@@ -0,0 +1,182 @@
+"""Batch calculations for the NDJSON endpoint.
+
+Members are read lazily, ``chunk_size`` at a time. The members of a chunk are
+validated, grouped by wood type and evaluated with one ``evaluate`` call per
+group, and a chunk's results are yielded as NDJSON lines in input order
+before the next chunk is read. A member that fails validation or has no
+design values gets an error line and does not stop the others.
+
+    {"index": 0, "results": {"F_b_prime": 990.0, ...}}
+    {"index": 1, "error": "length must be a positive number."}
+"""
+import json
+import math
+from collections import namedtuple
+from itertools import islice
+
+from django.core.exceptions import ObjectDoesNotExist
+
+from . import catalog
+from .calculations import SUPPORT_TYPES, as_dict, evaluate
+
+CHUNK_SIZE = 1000
+
+Member = namedtuple(
+    "Member",
+    [
+        "wood_type",
+        "support_type",
+        "breadth",
+        "depth",
+        "length",
+        "uniform",
+        "axial",
+        "duration",
+        "column_bracing",
+    ],
+)
+Member.__doc__ = """One member of a batch request
+Parameters
+----------
+wood_type : id of the wood type
+support_type : one of calculations.SUPPORT_TYPES
+breadth, depth, length : member dimensions (inches)
+uniform : uniform load on the beam (lb/in), default 0
+axial : concentric axial compression load (lb), default 0
+duration : load duration, see adjustments.LOAD_DURATIONS, default "ten_years"
+column_bracing : see batch.COLUMN_BRACINGS, default "both_trans_fixed_rot_free"
+"""
+
+DEFAULTS = {
+    "uniform": 0.0,
+    "axial": 0.0,
+    "duration": "ten_years",
+    "column_bracing": "both_trans_fixed_rot_free",
+}
+
+
+class InvalidLine:
+    """Placeholder for a line of an NDJSON stream that is not JSON"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def read_ndjson(lines):
+    """Yields the decoded lines of an NDJSON stream, skipping blank ones"""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as error:
+            yield InvalidLine(f"Invalid JSON: {error}")
+
+
+def _number(member, name, positive):
+    value = member.get(name, DEFAULTS.get(name))
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{name} must be a number.")
+    if not math.isfinite(value) or value < 0 or (positive and value == 0):
+        raise ValueError(
+            f"{name} must be a {'positive' if positive else 'non-negative'} number."
+        )
+    return float(value)
+
+
+def _choice(member, name, choices):
+    value = member.get(name, DEFAULTS.get(name))
+    if value not in choices:
+        raise ValueError(f"{name} can only be one of {choices}.")
+    return value
+
+
+def validate_member(member):
+    """``Member`` from one decoded member of a request
+
+    Raises
+    ------
+    ValueError
+    """
+    from .adjustments import LOAD_DURATIONS
+    from .batch import COLUMN_BRACINGS
+
+    if isinstance(member, InvalidLine):
+        raise ValueError(member.error)
+    if not isinstance(member, dict):
+        raise ValueError("A member must be a JSON object.")
+    if "wood_type" not in member:
+        raise ValueError("wood_type is required.")
+    wood_type = member["wood_type"]
+    if isinstance(wood_type, bool) or not isinstance(wood_type, int):
+        raise ValueError("wood_type must be an integer id.")
+    return Member(
+        wood_type,
+        _choice(member, "support_type", SUPPORT_TYPES),
+        _number(member, "breadth", True),
+        _number(member, "depth", True),
+        _number(member, "length", True),
+        _number(member, "uniform", False),
+        _number(member, "axial", False),
+        _choice(member, "duration", LOAD_DURATIONS),
+        _choice(member, "column_bracing", COLUMN_BRACINGS),
+    )
+
+
+def _evaluate_group(wood_type, members):
+    from .adjustments import reference_values
+
+    columns = Member(*zip(*members))
+    record = evaluate(
+        reference_values(wood_type),
+        list(columns.support_type),
+        columns.breadth,
+        columns.depth,
+        columns.length,
+        uniform=columns.uniform,
+        axial=columns.axial,
+        duration=list(columns.duration),
+        column_bracing=list(columns.column_bracing),
+    )
+    # JSON has no infinity, e.g. for an interaction past the buckling load
+    return [
+        {
+            name: value if math.isfinite(value) else None
+            for name, value in as_dict(result).items()
+        }
+        for result in record
+    ]
+
+
+def calculate(members, chunk_size=CHUNK_SIZE):
+    """Yields the NDJSON lines of the iterable ``members``, one string per
+    chunk"""
+    members = enumerate(members)
+    while True:
+        chunk = list(islice(members, chunk_size))
+        if not chunk:
+            return
+        lines = {}
+        groups = {}
+        for index, member in chunk:
+            try:
+                member = validate_member(member)
+                wood_type = catalog.get_wood_type(member.wood_type)
+            except (ValueError, ObjectDoesNotExist) as error:
+                lines[index] = {"index": index, "error": str(error)}
+            else:
+                group = groups.setdefault(wood_type.pk, (wood_type, [], []))
+                group[1].append(index)
+                group[2].append(member)
+
+        for wood_type, indices, group in groups.values():
+            try:
+                results = _evaluate_group(wood_type, group)
+            except ValueError as error:
+                for index in indices:
+                    lines[index] = {"index": index, "error": str(error)}
+            else:
+                for index, result in zip(indices, results):
+                    lines[index] = {"index": index, "results": result}
+
+        yield "".join(json.dumps(lines[index]) + "\n" for index, _ in chunk)
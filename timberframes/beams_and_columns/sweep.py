@@ -0,0 +1,183 @@
+"""Capacity sweeps over grids of section sizes and spans.
+
+The breadth, depth and length axes are broadcast into a 3D grid and
+evaluated in shards with the batch engine, so no per-point ``Beam`` or
+``Column`` is ever built. Large grids can be spread across a process pool.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .batch import BeamBatch, ColumnBatch
+
+SWEEP_DTYPE = np.dtype(
+    [
+        ("breadth", float),
+        ("depth", float),
+        ("length", float),
+        ("bending", float),
+        ("shear", float),
+        ("deflection", float),
+        ("compression", float),
+        ("interaction", float),
+        ("governing", float),
+    ]
+)
+
+DESIGN_VALUES = ("lumber_type", "E", "E_min", "F_v", "F_c", "F_b")
+
+
+def design_values(wood_type):
+    """Reference design values of a ``Wood_Type`` (or any object with the same
+    attributes) as plain Python values that can be sent to worker processes."""
+    values = {name: getattr(wood_type, name) for name in DESIGN_VALUES}
+    for name in DESIGN_VALUES[1:]:
+        values[name] = float(values[name])
+    return values
+
+
+def utilization(
+    values, breadth, depth, length, uniform=0.0, axial=0.0, deflection_limit=360.0
+):
+    """Demand to capacity ratios for broadcastable arrays of members
+
+    Beams are taken as single spans under a uniform load, laterally unbraced
+    over their length; columns are pinned at both ends (K_e = 1.0) and buckle
+    about their weaker axis.
+
+    Parameters
+    ----------
+    values : dict
+        Output of ``design_values``
+    breadth, depth, length : array_like
+        member dimensions (inches)
+    uniform : float
+        uniform load on the beam (lb/in)
+    axial : float
+        concentric axial compression load (lb)
+    deflection_limit : float
+        allowable deflection is length / deflection_limit
+    """
+    breadth, depth, length = np.broadcast_arrays(
+        np.asarray(breadth, dtype=float),
+        np.asarray(depth, dtype=float),
+        np.asarray(length, dtype=float),
+    )
+    result = np.zeros(breadth.shape, dtype=SWEEP_DTYPE)
+    result["breadth"], result["depth"], result["length"] = breadth, depth, length
+    area = breadth * depth
+
+    F_b_prime = np.full(breadth.shape, values["F_b"])
+    f_b = np.zeros(breadth.shape)
+    if uniform:
+        beams = BeamBatch(values["lumber_type"], depth, breadth, length, values["E"])
+        R_B = beams.slenderness_ratio(beams.effective_length("uniform", True))
+        F_bE = beams.critical_buckling_design_value(R_B, E_min_prime=values["E_min"])
+        F_b_prime = values["F_b"] * beams.stability_factor(F_bE, values["F_b"])
+        f_b = uniform * length**2 / 8.0 / (breadth * depth**2 / 6.0)
+        f_v = 1.5 * uniform * (length / 2.0 - depth) / area
+        deflection = (
+            5.0
+            * uniform
+            * length**4
+            / 384.0
+            / values["E"]
+            / beams.moment_of_inertia()
+        )
+        result["bending"] = f_b / F_b_prime
+        result["shear"] = f_v / values["F_v"]
+        result["deflection"] = deflection / (length / deflection_limit)
+
+    if axial:
+        columns = ColumnBatch(
+            values["lumber_type"], depth, breadth, length, values["E"]
+        )
+        s_r = columns.effective_length("both_trans_fixed_rot_free") / np.minimum(
+            breadth, depth
+        )
+        F_cE = columns.critical_buckling_design_value(s_r, E_min_prime=values["E_min"])
+        F_c_prime = values["F_c"] * columns.stability_factor(F_cE, values["F_c"])
+        f_c = axial / area
+        result["compression"] = f_c / F_c_prime
+        amplification = np.where(f_c < F_cE, 1.0 - f_c / F_cE, 0.0)
+        # Only members in bending have a bending term; past the buckling load
+        # it is infinite
+        with np.errstate(divide="ignore"):
+            bending = np.divide(
+                f_b,
+                F_b_prime * amplification,
+                out=np.zeros(breadth.shape),
+                where=f_b > 0.0,
+            )
+        result["interaction"] = (f_c / F_c_prime) ** 2 + bending
+
+    result["governing"] = np.max(
+        [result[name] for name in SWEEP_DTYPE.names[3:-1]], axis=0
+    )
+    return result
+
+
+def _sweep_shard(args):
+    values, axes, start, stop, kwargs = args
+    shape = tuple(len(axis) for axis in axes)
+    i, j, k = np.unravel_index(np.arange(start, stop), shape)
+    breadth, depth, length = axes
+    return start, stop, utilization(values, breadth[i], depth[j], length[k], **kwargs)
+
+
+def sweep(
+    wood_type,
+    breadth,
+    depth,
+    length,
+    uniform=0.0,
+    axial=0.0,
+    deflection_limit=360.0,
+    shard_size=2**18,
+    processes=None,
+):
+    """Utilization over every combination of breadth, depth and length
+
+    Parameters
+    ----------
+    wood_type : Wood_Type
+        supplies lumber_type, E, E_min, F_v, F_c and F_b
+    breadth, depth, length : array_like, 1D
+        grid axes (inches)
+    uniform, axial, deflection_limit :
+        see ``utilization``
+    shard_size : int
+        grid points evaluated per task
+    processes : int or None
+        worker processes; None or 1 evaluates the shards in this process
+
+    Returns
+    -------
+    ndarray of SWEEP_DTYPE, shape (len(breadth), len(depth), len(length))
+    """
+    values = design_values(wood_type)
+    axes = tuple(
+        np.atleast_1d(np.asarray(axis, dtype=float))
+        for axis in (breadth, depth, length)
+    )
+    shape = tuple(len(axis) for axis in axes)
+    n_points = int(np.prod(shape))
+    kwargs = {
+        "uniform": uniform,
+        "axial": axial,
+        "deflection_limit": deflection_limit,
+    }
+    tasks = [
+        (values, axes, start, min(start + shard_size, n_points), kwargs)
+        for start in range(0, n_points, shard_size)
+    ]
+
+    result = np.empty(n_points, dtype=SWEEP_DTYPE)
+    if processes is None or processes == 1:
+        for start, stop, shard in map(_sweep_shard, tasks):
+            result[start:stop] = shard
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for start, stop, shard in executor.map(_sweep_shard, tasks):
+                result[start:stop] = shard
+    return result.reshape(shape)
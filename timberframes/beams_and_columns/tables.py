@@ -0,0 +1,129 @@
+"""Coefficient tables for the stability checks, indexed by integer enums.
+
+The tables are plain tuples so the scalar classes can use them without NumPy;
+``batch.py`` wraps them in arrays and resolves a whole batch of mixed
+conditions with one fancy-indexing operation.
+"""
+from enum import IntEnum
+
+nan = float("nan")
+
+
+class LumberType(IntEnum):
+    lumber = 0
+    glulam = 1
+    log = 2
+
+
+class LoadPlacement(IntEnum):
+    uniform = 0
+    concentrated_end = 1
+    concentrated_center_no_support = 2
+    concentrated_center_with_support = 3
+
+
+class ColumnBracing(IntEnum):
+    both_trans_fixed_rot_fixed = 0
+    both_trans_fixed_rot_free = 1
+    top_trans_fixed_rot_free = 2
+    top_trans_free_rot_fixed = 3
+    top_trans_free_rot_free = 4
+    top_trans_free_rot_fixed_bot_rot_free_trans_fixed = 5
+
+
+class DesignKe(IntEnum):
+    recommended = 0
+    theoretical = 1
+
+
+# Effective length l_e = (length coefficient) * l_u + (depth coefficient) * d
+# from Table 3.4.3.1.1-1 pg. 80 of American Institute of Timber Construction
+# Wiley (2012), indexed [LoadPlacement][single_span_beam][l_u / d < 7].
+# NaN marks placements that are only tabulated for single span beams.
+BEAM_EFFECTIVE_LENGTH = (
+    # uniform
+    (((0.9, 3.0), (1.33, 0.0)), ((1.63, 3.0), (2.06, 0.0))),
+    # concentrated_end
+    (((1.44, 3.0), (1.87, 0.0)), ((1.44, 3.0), (1.87, 0.0))),
+    # concentrated_center_no_support
+    (((nan, nan), (nan, nan)), ((1.37, 3.0), (1.8, 0.0))),
+    # concentrated_center_with_support
+    (((nan, nan), (nan, nan)), ((1.11, 0.0), (1.11, 0.0))),
+)
+
+# Effective column length factor K_e from Table 3.4.3.9.2-1 pg. 89 of
+# American Institute of Timber Construction Wiley (2012),
+# indexed [ColumnBracing][DesignKe].
+K_E = (
+    (0.65, 0.5),
+    (1.0, 1.0),
+    (0.8, 0.7),
+    (1.2, 1.0),
+    (2.1, 2.0),
+    (2.4, 2.0),
+)
+
+
+LIVE_LOAD_STRUCTURE_TYPES = ("roof", "floor")
+
+LOAD_TYPES = ("D", "L", "Lr", "S", "R", "W", "E")
+
+# ASCE 7 allowable stress design combinations, one row per combination and
+# one column per entry of LOAD_TYPES.
+ASD_COMBINATIONS = (
+    "D",
+    "D+L",
+    "D+Lr",
+    "D+S",
+    "D+R",
+    "D+WL",
+    "D+EL",
+    "D+L+Lr",
+    "D+L+S",
+    "D+L+R",
+    "D+W+L+Lr",
+    "D+W+L+S",
+    "D+W+L+R",
+    "D+E+L+Lr",
+    "D+E+L+S",
+    "D+E+L+R",
+    "D+W",
+    "D+E",
+)
+ASD_COEFFICIENTS = (
+    # D    L     Lr    S     R     W     E
+    (1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+    (1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+    (1.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0),
+    (1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0),
+    (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0),
+    (1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0),
+    (1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.7),
+    (1.0, 0.75, 0.75, 0.0, 0.0, 0.0, 0.0),
+    (1.0, 0.75, 0.0, 0.75, 0.0, 0.0, 0.0),
+    (1.0, 0.75, 0.0, 0.0, 0.75, 0.0, 0.0),
+    (1.0, 0.75, 0.75, 0.0, 0.0, 0.75, 0.0),
+    (1.0, 0.75, 0.0, 0.75, 0.0, 0.75, 0.0),
+    (1.0, 0.75, 0.0, 0.0, 0.75, 0.75, 0.0),
+    (1.0, 0.75, 0.75, 0.0, 0.0, 0.0, 0.525),
+    (1.0, 0.75, 0.0, 0.75, 0.0, 0.0, 0.525),
+    (1.0, 0.75, 0.0, 0.0, 0.75, 0.0, 0.525),
+    (0.6, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0),
+    (0.6, 0.0, 0.0, 0.0, 0.0, 0.0, 0.7),
+)
+# Loads that must be non-zero for Loads.allowable_stress_design to report a
+# combination. Dead load and the 0.75 L companion load are optional.
+ASD_REQUIRED = tuple(
+    (False, row[1] == 1.0) + tuple(coefficient != 0.0 for coefficient in row[2:])
+    for row in ASD_COEFFICIENTS
+)
+
+
+def code(enum, value, name):
+    """Integer code of ``value``, given either as a label or a code"""
+    try:
+        if isinstance(value, str):
+            return enum[value]
+        return enum(value)
+    except (KeyError, ValueError):
+        raise ValueError(f"{name} must be a value in: {tuple(enum.__members__)}.")
@@ -0,0 +1,122 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.adjustments import (
+    ReferenceValues,
+    adjusted_values,
+    reference_values,
+    service_values,
+    size_stage,
+)
+from timberframes.beams_and_columns.batch import BeamBatch
+
+DOUGLAS_FIR = SimpleNamespace(
+    lumber_type="lumber",
+    E=1.6e6,
+    E_min=5.8e5,
+    F_v=180,
+    F_c=1350,
+    F_c_perp=625,
+    F_b=900,
+    F_t=575,
+)
+GLULAM = ReferenceValues("glulam", 2400, 1650, 265, 650, 1600, 1.8e6, 9.5e5)
+
+
+def test_reference_values_are_hashable_floats():
+    reference = reference_values(DOUGLAS_FIR)
+    assert reference.lumber_type == "lumber"
+    assert reference.F_b == 900.0
+    assert hash(reference) == hash(reference_values(DOUGLAS_FIR))
+
+
+def test_service_values_are_cached_per_key():
+    service_values.cache_clear()
+    reference = reference_values(DOUGLAS_FIR)
+    first = service_values(reference, "dimension", "seven_days", True, "normal", False)
+    second = service_values(reference, "dimension", "seven_days", True, "normal", False)
+    assert first is second
+    assert not first.flags.writeable
+    assert service_values.cache_info().hits == 1
+    # C_D * C_M on F_b, C_M alone on F_c_perp and E
+    assert first[0] == pytest.approx(900 * 1.25 * 0.85)
+    assert first[3] == pytest.approx(625 * 0.67)
+    assert first[5] == pytest.approx(1.6e6 * 0.9)
+
+
+def test_short_braced_members_only_get_service_factors():
+    result = adjusted_values(
+        DOUGLAS_FIR,
+        breadth=[1.5, 5.5],
+        depth=[3.5, 5.5],
+        length=[1e-6, 1e-6],
+        duration=["ten_years", "permanent"],
+        incised=True,
+    )
+    np.testing.assert_allclose(result.F_b, [900 * 0.8, 900 * 0.9 * 0.8])
+    np.testing.assert_allclose(result.F_v, [180 * 0.8, 180 * 0.9 * 0.8])
+    np.testing.assert_allclose(result.E_min, 5.8e5 * 0.95)
+    np.testing.assert_allclose(result.C_L, 1.0, rtol=1e-6)
+    np.testing.assert_allclose(result.C_P, 1.0, rtol=1e-6)
+
+
+def test_stability_factors_match_batch_engine():
+    breadth, depth, length = 1.5, 9.25, 144.0
+    result = adjusted_values(DOUGLAS_FIR, breadth, depth, length)
+    beams = BeamBatch("lumber", depth, breadth, length, 1.6e6)
+    R_B = beams.slenderness_ratio(beams.effective_length("uniform", True))
+    F_bE = beams.critical_buckling_design_value(R_B, E_min_prime=5.8e5)
+    assert result.C_L == pytest.approx(beams.stability_factor(F_bE, 900.0))
+    assert result.F_b == pytest.approx(900.0 * result.C_L)
+    assert 0.0 < result.C_P < 1.0
+    assert result.F_c == pytest.approx(1350.0 * result.C_P)
+
+
+def test_timber_size_factor_and_flat_use():
+    result = adjusted_values(
+        DOUGLAS_FIR, [6.0, 6.0], [12.0, 16.0], 1e-6, C_fu=[1.0, 1.1]
+    )
+    np.testing.assert_allclose(result.C_F, [1.0, (12.0 / 16.0) ** (1 / 9)])
+    assert result.F_b[1] == pytest.approx(900 * 1.1 * result.C_F[1], rel=1e-6)
+
+
+def test_dimension_lumber_has_no_timber_size_factor():
+    # A 2x14 is deeper than 12" but not a timber
+    result = adjusted_values(DOUGLAS_FIR, [1.5, 5.5], 13.25, 1e-6)
+    np.testing.assert_allclose(result.C_F, [1.0, (12.0 / 13.25) ** (1 / 9)])
+    assert result.F_b[0] == pytest.approx(900 * 1.0, rel=1e-6)
+
+
+def test_size_class_of_the_reference_row():
+    timber = SimpleNamespace(**{**vars(DOUGLAS_FIR), "size_class": "timber"})
+    dimension = SimpleNamespace(**{**vars(DOUGLAS_FIR), "size_class": "dimension"})
+    # A 4x14 read from a timber row gets the timber size and wet service factors
+    result = adjusted_values(timber, 3.5, 13.25, 1e-6, wet_service=True)
+    assert result.C_F == pytest.approx((12.0 / 13.25) ** (1 / 9))
+    assert result.F_c_perp == pytest.approx(625 * 0.67)
+    assert result.F_c == pytest.approx(1350 * 0.91, rel=1e-6)
+    # and a 6x14 read from a dimension lumber row does not
+    result = adjusted_values(dimension, 5.5, 13.25, 1e-6, wet_service=True)
+    assert result.C_F == 1.0
+    assert result.F_c == pytest.approx(1350 * 0.8, rel=1e-6)
+
+
+def test_glulam_takes_lesser_of_volume_and_stability_factor():
+    result = adjusted_values(GLULAM, 6.75, 24.0, 480.0, wet_service=True)
+    assert result.C_V < 1.0
+    assert result.C_F == 1.0
+    F_b_star = 2400 * 0.8
+    assert result.F_b == pytest.approx(F_b_star * min(result.C_V, result.C_L))
+
+
+def test_custom_stages():
+    result = adjusted_values(GLULAM, 6.75, 24.0, 480.0, stages=[size_stage])
+    assert result.C_L == 1.0
+    assert result.F_b == 2400.0
+
+
+def test_invalid_duration():
+    with pytest.raises(ValueError):
+        adjusted_values(DOUGLAS_FIR, 1.5, 3.5, 96.0, duration="forever")
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.batch import BeamBatch, ColumnBatch, encode
+
+
+def test_encode_labels_and_codes():
+    codes = encode(["log", "lumber", "log"], ("lumber", "glulam", "log"))
+    np.testing.assert_array_equal(codes, [2, 0, 2])
+    np.testing.assert_array_equal(encode([1, 2], ("a", "b", "c")), [1, 2])
+    with pytest.raises(ValueError):
+        encode(["oak"], ("lumber", "glulam", "log"))
+    with pytest.raises(ValueError):
+        encode([3], ("lumber", "glulam", "log"))
+
+
+class TestBeamBatch:
+    def setup_method(self):
+        # A short (l/d < 7) and a long beam
+        self.beams = BeamBatch(
+            ["lumber", "glulam"], [7.25, 12.0], [1.5, 5.125], [48.0, 240.0], 1.6e6
+        )
+
+    def test_effective_length(self):
+        np.testing.assert_allclose(
+            self.beams.effective_length(), [1.33 * 48.0, 0.9 * 240.0 + 36.0]
+        )
+        np.testing.assert_allclose(
+            self.beams.effective_length(
+                ["concentrated_end", "concentrated_center_with_support"], True
+            ),
+            [1.87 * 48.0, 1.11 * 240.0],
+        )
+
+    def test_effective_length_requires_single_span(self):
+        with pytest.raises(ValueError):
+            self.beams.effective_length("concentrated_center_no_support", False)
+
+    def test_stability_factor(self):
+        R_B = self.beams.slenderness_ratio()
+        np.testing.assert_allclose(
+            R_B, np.sqrt(self.beams.effective_length() * [7.25, 12.0]) / [1.5, 5.125]
+        )
+        F_bE = self.beams.critical_buckling_design_value(R_B, E_min_prime=5.8e5)
+        C_L = self.beams.stability_factor(F_bE, 1000.0)
+        assert np.all((C_L > 0.0) & (C_L <= 1.0))
+        ratio = F_bE[0] / 1000.0
+        expected = (1 + ratio) / 1.9 - np.sqrt(((1 + ratio) / 1.9) ** 2 - ratio / 0.95)
+        assert C_L[0] == pytest.approx(expected)
+
+
+class TestColumnBatch:
+    def setup_method(self):
+        self.columns = ColumnBatch(["lumber", "log"], 7.5, 7.5, [96.0, 480.0], 1.3e6)
+
+    def test_effective_length(self):
+        np.testing.assert_allclose(
+            self.columns.effective_length(
+                ["both_trans_fixed_rot_free", "top_trans_free_rot_free"],
+                ["recommended", "theoretical"],
+            ),
+            [96.0, 2.0 * 480.0],
+        )
+
+    def test_critical_buckling_and_stability(self):
+        s_r = self.columns.slenderness_ratio(self.columns.length)
+        np.testing.assert_array_equal(
+            self.columns.slenderness_exceeded(s_r), [False, True]
+        )
+        F_cE = self.columns.critical_buckling_design_value(s_r, E_min_prime=4.7e5)
+        np.testing.assert_allclose(
+            F_cE,
+            np.array([0.822, 0.617]) * 4.7e5 / (np.array([96.0, 480.0]) / 7.5) ** 2,
+        )
+        C_P = self.columns.stability_factor(F_cE, 1000.0)
+        ratio = F_cE[0] / 1000.0
+        first = (1 + ratio) / 2.0 / 0.8
+        assert C_P[0] == pytest.approx(first - np.sqrt(first**2 - ratio / 0.8))
@@ -0,0 +1,104 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.beams_and_columns import (
+    ASD_COMBINATIONS,
+    Beam,
+    Column,
+    Loads,
+)
+from timberframes.beams_and_columns.checks import CheckLog
+
+
+class TestMemberValueObjects:
+    def setup_method(self):
+        self.beam = Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6)
+
+    def test_section_properties(self):
+        assert self.beam.area() == pytest.approx(1.5 * 7.25)
+        assert self.beam.moment_of_inertia() == pytest.approx(1.5 * 7.25**3 / 12.0)
+        assert self.beam.section_modulus() == pytest.approx(1.5 * 7.25**2 / 6.0)
+
+    def test_immutable_and_slotted(self):
+        with pytest.raises(AttributeError):
+            self.beam.depth = 9.25
+        assert not hasattr(self.beam, "__dict__")
+
+    def test_replace(self):
+        deeper = self.beam.replace(depth=9.25)
+        assert isinstance(deeper, Beam)
+        assert deeper.depth == 9.25
+        assert self.beam.depth == 7.25
+        assert deeper.moment_of_inertia() == pytest.approx(1.5 * 9.25**3 / 12.0)
+        assert deeper.replace(depth=7.25) == self.beam
+        with pytest.raises(TypeError):
+            self.beam.replace(colour="red")
+
+    def test_pickle_round_trip(self):
+        assert pickle.loads(pickle.dumps(self.beam)) == self.beam
+
+    def test_modulus_of_elasticity_is_cached(self):
+        E_min = self.beam.modulus_of_elasticity()
+        assert E_min == pytest.approx(1.03 * 1.6e6 * (1 - 1.645 * 0.25) / 1.66)
+        assert self.beam.mod_of_elast_min == E_min
+
+    def test_deflection_uses_moment_of_inertia(self):
+        mom_of_inert = self.beam.moment_of_inertia()
+        assert self.beam.deflection(100.0, load_case=0) == pytest.approx(
+            100.0 * 144.0**3 / 3.0 / 1.6e6 / mom_of_inert
+        )
+
+
+def test_bending_and_shear_checks():
+    beam = Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6)
+    checks = CheckLog()
+    f_b = beam.bending_stress(20000.0, F_b_prime=900.0, checks=checks)
+    beam.shear_stress(1000.0, F_v_prime=180.0, checks=checks)
+    assert f_b == pytest.approx(6 * 20000.0 / 1.5 / 7.25**2)
+    assert [result.name for result in checks] == ["bending_stress", "shear_stress"]
+    assert [result.passed for result in checks] == [False, True]
+
+
+def test_column_design_criteria():
+    column = Column("column", "lumber", 5.5, 5.5, 96.0, 1.3e6)
+    checks = column.column_design_criteria(10000.0, 30.25, 28.0, 500.0, 340.0)
+    assert [result.passed for result in checks] == [True, False]
+
+
+class TestLoads:
+    def test_allowable_stress_design(self):
+        ASD = Loads().allowable_stress_design(10.0, L=40.0, Lr=20.0, W=-30.0)
+        assert ASD["D+Lr"] == pytest.approx(30.0)
+        assert ASD["D+L+Lr"] == pytest.approx(10.0 + 0.75 * 40.0 + 0.75 * 20.0)
+        assert ASD["D+W"] == pytest.approx(0.6 * 10.0 - 30.0)
+        assert "D+S" not in ASD
+        assert "D+E+L+Lr" not in ASD
+
+    def test_load_combinations_match_scalar(self):
+        loads = np.array(
+            [
+                [10.0, 40.0, 20.0, 0.0, 0.0, -30.0, 0.0],
+                [15.0, 0.0, 0.0, 30.0, 0.0, 0.0, 25.0],
+            ]
+        )
+        combinations, governing, governing_index = Loads().load_combinations(loads)
+        assert combinations.shape == (2, len(ASD_COMBINATIONS))
+        for row, member_loads in zip(combinations, loads):
+            ASD = Loads().allowable_stress_design(*member_loads)
+            for name, value in ASD.items():
+                assert row[ASD_COMBINATIONS.index(name)] == pytest.approx(value)
+        np.testing.assert_allclose(governing, [55.0, 15.0 + 0.75 * 30.0 + 0.525 * 25.0])
+        assert [ASD_COMBINATIONS[i] for i in governing_index] == ["D+L+Lr", "D+E+L+S"]
+
+    def test_live_loads_match_scalar(self):
+        A_f = np.array([150.0, 400.0, 800.0, 150.0, 400.0])
+        F = np.array([2.0, 6.0, 14.0, 0.0, 0.0])
+        structure_type = ["roof", "roof", "roof", "floor", "floor"]
+        reduced = Loads().live_loads(20.0, A_f, F, structure_type)
+        expected = [
+            Loads().live_load(20.0, area, rise, kind)
+            for area, rise, kind in zip(A_f, F, structure_type)
+        ]
+        np.testing.assert_allclose(reduced, expected)
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from timberframes.beams_and_columns.benchmarks import (
+    BENCHMARKS,
+    compare,
+    run_benchmarks,
+)
+
+
+def test_every_benchmark_runs():
+    results = run_benchmarks(sizes=[1, 10], repeat=1)
+    assert set(results) == {benchmark.name for benchmark in BENCHMARKS}
+    for timings in results.values():
+        assert set(timings) == {"1", "10"}
+        assert all(seconds >= 0.0 for seconds in timings.values())
+
+
+def test_scalar_benchmarks_stop_at_max_size():
+    results = run_benchmarks(sizes=[10**6], repeat=1, pattern=r"^scalar\.")
+    assert results == {"scalar.beam": {}, "scalar.column": {}, "scalar.loads": {}}
+
+
+def test_compare_threshold():
+    baseline = {"batch.beam": {"1000": 1.0, "100000": 2.0}}
+    results = {"batch.beam": {"1000": 1.05, "100000": 2.5}, "new": {"1": 9.0}}
+    (regression,) = compare(results, baseline, threshold=10.0)
+    assert regression.name == "batch.beam"
+    assert regression.size == 100000
+    assert regression.change == pytest.approx(25.0)
+    assert compare(results, baseline, threshold=30.0) == []
+
+
+def test_command_saves_and_compares_baseline(tmp_path):
+    path = tmp_path / "baseline.json"
+    options = {"sizes": [10], "repeat": 1, "pattern": "batch.loads", "baseline": path}
+    call_command("benchmark_engine", save=True, **options)
+    assert "batch.loads" in json.loads(path.read_text())["results"]
+
+    call_command("benchmark_engine", threshold=1e6, **options)
+
+    # A baseline far faster than anything achievable must fail the run
+    data = json.loads(path.read_text())
+    data["results"]["batch.loads"]["10"] = 1e-12
+    path.write_text(json.dumps(data))
+    with pytest.raises(CommandError, match=r"batch\.loads\[10\]"):
+        call_command("benchmark_engine", threshold=10.0, **options)
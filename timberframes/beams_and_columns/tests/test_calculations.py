@@ -0,0 +1,117 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from django.core.cache import cache
+from django.test import TestCase
+
+from timberframes.beams_and_columns.adjustments import ReferenceValues, adjusted_values
+from timberframes.beams_and_columns.calculations import (
+    RESULT_FIELDS,
+    evaluate,
+    member_results,
+    result_key,
+)
+from timberframes.beams_and_columns.models import Beams_and_Columns, Wood_Type
+
+pytestmark = pytest.mark.django_db
+
+DOUGLAS_FIR = ReferenceValues("lumber", 900, 575, 180, 625, 1350, 1.6e6, 5.8e5)
+
+
+def test_evaluate_checks_by_support_type():
+    result = evaluate(
+        DOUGLAS_FIR,
+        ["beam", "column", "beam_and_column"],
+        1.5,
+        9.25,
+        144.0,
+        uniform=10.0,
+        axial=2000.0,
+    )
+    beam, column, beam_column = result
+    assert beam["bending"] > 0.0 and beam["compression"] == 0.0
+    assert column["bending"] == 0.0 and column["compression"] > 0.0
+    assert beam_column["interaction"] > beam_column["compression"] ** 2
+    for record in result:
+        assert record["governing"] == max(
+            record[name]
+            for name in ("bending", "shear", "deflection", "compression", "interaction")
+        )
+
+
+def test_evaluate_matches_adjusted_values():
+    (record,) = evaluate(DOUGLAS_FIR, "beam", [3.5], [11.25], [192.0], uniform=20.0)
+    adjusted = adjusted_values(DOUGLAS_FIR, 3.5, 11.25, 192.0)
+    section_modulus = 3.5 * 11.25**2 / 6.0
+    assert record["F_b_prime"] == pytest.approx(adjusted.F_b)
+    assert record["moment_capacity"] == pytest.approx(adjusted.F_b * section_modulus)
+    f_b = 20.0 * 192.0**2 / 8.0 / section_modulus
+    assert record["bending"] == pytest.approx(f_b / adjusted.F_b)
+    assert np.isfinite(record["governing"])
+
+
+class MemberResultsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.wood_type = Wood_Type.objects.create(
+            wood_name="Douglas Fir-Larch",
+            lumber_type="lumber",
+            lumber_grade="no_2",
+            E=1.6e6,
+            E_min=5.8e5,
+            G=0.5,
+            F_v=180,
+            F_c=1350,
+            F_c_perp=625,
+            F_b=900,
+            F_t=575,
+        )
+        self.member = Beams_and_Columns.objects.create(
+            user_selected_support_type="beam",
+            wood_type=self.wood_type,
+            breadth=Decimal("1.50"),
+            depth=Decimal("7.25"),
+            length=Decimal("144.00"),
+        )
+
+    def test_key_is_canonical(self):
+        self.wood_type.refresh_from_db()
+        key = result_key("beam", self.wood_type, Decimal("1.50"), 7.25, "144")
+        assert key == result_key("beam", self.wood_type, 1.5, Decimal("7.25"), 144)
+        assert key != result_key("column", self.wood_type, 1.5, 7.25, 144)
+        assert key != result_key("beam", self.wood_type, 1.5, 7.25, 144, uniform=1)
+
+    def test_results_are_computed_once_per_input(self):
+        results = self.member.results()
+        assert set(results) == set(RESULT_FIELDS)
+        duplicate = Beams_and_Columns(
+            user_selected_support_type="beam",
+            wood_type=self.wood_type,
+            breadth=1.5,
+            depth=7.25,
+            length=144,
+        )
+        with self.assertNumQueries(0):
+            assert duplicate.results() == results
+        key = result_key("beam", self.wood_type, 1.5, 7.25, 144, uniform=0, axial=0)
+        assert cache.get(key) == results
+
+    def test_wood_type_change_invalidates(self):
+        before = self.member.results()
+        self.wood_type.F_b = 1000
+        self.wood_type.save()
+        member = Beams_and_Columns.objects.get(pk=self.member.pk)
+        after = member.results()
+        assert after["F_b_prime"] > before["F_b_prime"]
+
+    def test_logs_have_no_results(self):
+        self.wood_type.lumber_type = "log"
+        self.wood_type.save()
+        assert member_results("beam", self.wood_type, 12, 12, 144) is None
+
+    def test_results_view(self):
+        response = self.client.get(self.member.get_absolute_url())
+        assert response.status_code == 200
+        assert response.context["results"] == self.member.results()
+        self.assertContains(response, "governing")
@@ -0,0 +1,118 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.core.cache.backends.dummy import DummyCache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from timberframes.beams_and_columns import catalog
+from timberframes.beams_and_columns.forms import BeamAndColumnForm
+from timberframes.beams_and_columns.models import Beams_and_Columns, Wood_Type
+
+pytestmark = pytest.mark.django_db
+
+
+class CatalogTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        catalog.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.wood_type = Wood_Type.objects.create(
+                wood_name="Douglas Fir-Larch",
+                lumber_type="lumber",
+                lumber_grade="no_2",
+                E=1.6e6,
+                E_min=5.8e5,
+                G=0.5,
+                F_v=180,
+                F_c=1350,
+                F_c_perp=625,
+                F_b=900,
+                F_t=575,
+            )
+        self.calculation = Beams_and_Columns.objects.create(
+            wood_type=self.wood_type, breadth=1.5, depth=7.25, length=144
+        )
+
+    def test_warm_catalog_needs_no_queries(self):
+        with self.assertNumQueries(1):
+            assert catalog.wood_types() == [self.wood_type]
+        with self.assertNumQueries(0):
+            assert catalog.get_wood_type(self.wood_type.pk) == self.wood_type
+            assert catalog.get_wood_type(str(self.wood_type.pk)) == self.wood_type
+            form = BeamAndColumnForm()
+            assert "Douglas Fir-Larch" in str(form["wood_type"])
+        calculation = Beams_and_Columns.objects.get(pk=self.calculation.pk)
+        with self.assertNumQueries(0):
+            assert calculation.support_type.mod_of_elast == self.wood_type.E
+
+    def test_list_view(self):
+        catalog.wood_types()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("wood_type_list"))
+        # Only the savepoint of the request transaction
+        assert not [query for query in queries if "SELECT" in query["sql"]]
+        self.assertContains(response, "Douglas Fir-Larch")
+
+    def test_form_validates_from_catalog(self):
+        catalog.wood_types()
+        data = {
+            "wood_type": self.wood_type.pk,
+            "user_selected_support_type": "beam",
+            "breadth": "1.5",
+            "depth": "7.25",
+            "length": "144",
+        }
+        # Only the existence check of the foreign key when validating the model
+        with self.assertNumQueries(1):
+            form = BeamAndColumnForm(data)
+            assert form.is_valid()
+        assert form.cleaned_data["wood_type"] == self.wood_type
+        form = BeamAndColumnForm({**data, "wood_type": self.wood_type.pk + 1})
+        assert "wood_type" in form.errors
+
+    def test_missing_wood_type(self):
+        with pytest.raises(Wood_Type.DoesNotExist):
+            catalog.get_wood_type(self.wood_type.pk + 1)
+        with pytest.raises(Wood_Type.DoesNotExist):
+            catalog.get_wood_type("fir")
+
+    def test_invalidated_on_commit(self):
+        catalog.wood_types()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.wood_type.F_b = 1000
+            self.wood_type.save()
+            # Not before the commit
+            assert catalog.get_wood_type(self.wood_type.pk).F_b == 900
+        assert catalog.get_wood_type(self.wood_type.pk).F_b == 1000
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.wood_type.delete()
+        assert catalog.wood_types() == []
+
+    def test_version_bumped_by_another_worker(self):
+        catalog.wood_types()
+        Wood_Type.objects.filter(pk=self.wood_type.pk).update(wood_name="DF-L")
+        with self.assertNumQueries(0):
+            assert catalog.wood_types()[0].wood_name == "Douglas Fir-Larch"
+        cache.incr(catalog.VERSION_KEY)
+        with self.assertNumQueries(1):
+            assert catalog.wood_types()[0].wood_name == "DF-L"
+
+    def test_evicted_version_reloads(self):
+        catalog.wood_types()
+        Wood_Type.objects.filter(pk=self.wood_type.pk).update(wood_name="DF-L")
+        cache.delete(catalog.VERSION_KEY)
+        assert catalog.wood_types()[0].wood_name == "DF-L"
+
+    def test_cache_that_stores_nothing(self):
+        dummy = DummyCache("dummy", {})
+        with mock.patch.object(catalog, "cache", dummy):
+            assert catalog.catalog_version() is None
+            assert catalog.wood_types() == [self.wood_type]
+            Wood_Type.objects.filter(pk=self.wood_type.pk).update(wood_name="DF-L")
+            assert catalog.get_wood_type(self.wood_type.pk).wood_name == "DF-L"
+            catalog.invalidate()
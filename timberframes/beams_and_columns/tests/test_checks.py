@@ -0,0 +1,22 @@
+import pytest
+
+from timberframes.beams_and_columns.checks import CheckLog, check
+
+
+def test_check_ratio_and_strictness():
+    result = check("bending_stress", 800.0, 1000.0)
+    assert result.ratio == pytest.approx(0.8)
+    assert result.passed
+    assert check("shear_stress", 1000.0, 1000.0).passed
+    assert not check("weak_axis_buckling", 1000.0, 1000.0, strict=True).passed
+
+
+def test_check_log_collects_without_formatting():
+    checks = CheckLog()
+    checks.record("bending_stress", 800.0, 1000.0)
+    checks.record("shear_stress", 200.0, 180.0)
+    assert not checks.passed
+    assert [result.name for result in checks.failures] == ["shear_stress"]
+    assert checks.governing.name == "shear_stress"
+    assert checks.report().splitlines()[1].endswith("FAIL")
+    assert CheckLog().governing is None
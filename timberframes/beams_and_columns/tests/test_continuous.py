@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.beams_and_columns import Beam
+from timberframes.beams_and_columns.checks import CheckLog
+from timberframes.beams_and_columns.continuous import continuous_beam
+
+
+def test_two_equal_spans():
+    result = continuous_beam([120.0, 120.0], 10.0)
+    wL = 10.0 * 120.0
+    np.testing.assert_allclose(
+        result.support_moments[0], [0.0, -wL * 120.0 / 8.0, 0.0], atol=1e-9
+    )
+    np.testing.assert_allclose(
+        result.reactions[0], [3.0 / 8.0 * wL, 10.0 / 8.0 * wL, 3.0 / 8.0 * wL]
+    )
+    assert result.span_moments[0, 0] == pytest.approx(9.0 / 128.0 * wL * 120.0)
+    assert result.max_shear[0] == pytest.approx(5.0 / 8.0 * wL)
+
+
+def test_batched_spans_match_individual_solves():
+    rng = np.random.default_rng(0)
+    spans = rng.uniform(60.0, 180.0, size=(50, 6))
+    loads = rng.uniform(1.0, 20.0, size=(50, 6))
+    batched = continuous_beam(spans, loads)
+    for i in (0, 17, 49):
+        single = continuous_beam(spans[i], loads[i])
+        np.testing.assert_allclose(
+            batched.support_moments[i], single.support_moments[0]
+        )
+    np.testing.assert_allclose(batched.reactions.sum(axis=-1), (spans * loads).sum(-1))
+
+    # Three-moment equation holds at every interior support
+    M = batched.support_moments
+    residual = (
+        M[:, :-2] * spans[:, :-1]
+        + 2.0 * M[:, 1:-1] * (spans[:, :-1] + spans[:, 1:])
+        + M[:, 2:] * spans[:, 1:]
+        + loads[:, :-1] * spans[:, :-1] ** 3 / 4.0
+        + loads[:, 1:] * spans[:, 1:] ** 3 / 4.0
+    )
+    np.testing.assert_allclose(residual, 0.0, atol=1e-6)
+
+
+def test_single_span_is_simply_supported():
+    result = continuous_beam([[144.0]], [[5.0]])
+    assert result.max_moment[0] == pytest.approx(5.0 * 144.0**2 / 8.0)
+
+
+def test_continuous_span_checks():
+    beam = Beam("beam", "lumber", 7.25, 1.5, 120.0, 1.6e6)
+    checks = CheckLog()
+    f_b, f_v = beam.continuous_span_checks(
+        [120.0, 120.0], 10.0, F_b_prime=900.0, F_v_prime=180.0, checks=checks
+    )
+    assert f_b == pytest.approx(10.0 * 120.0**2 / 8.0 / beam.section_modulus())
+    assert [result.name for result in checks] == ["bending_stress", "shear_stress"]
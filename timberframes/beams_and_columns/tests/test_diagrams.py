@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.beams_and_columns import Beam
+from timberframes.beams_and_columns.diagrams import beam_diagrams
+
+
+def test_simple_span_uniform_and_point():
+    L, EI = 120.0, 1.6e6 * 47.6
+    result = beam_diagrams(
+        [L, L],
+        1.6e6,
+        47.6,
+        uniform=[10.0, 0.0],
+        point=[0.0, 500.0],
+        point_location=L / 2.0,
+        stations=5,
+    )
+    assert result.shear.shape == (2, 5)
+    np.testing.assert_allclose(result.shear[0], 10.0 * (L / 2.0 - result.stations[0]))
+    assert result.moment[0, 2] == pytest.approx(10.0 * L**2 / 8.0)
+    assert result.deflection[0, 2] == pytest.approx(5 * 10.0 * L**4 / 384.0 / EI)
+    assert result.moment[1, 2] == pytest.approx(500.0 * L / 4.0)
+    assert result.deflection[1, 2] == pytest.approx(500.0 * L**3 / 48.0 / EI)
+    np.testing.assert_allclose(result.moment[:, [0, -1]], 0.0, atol=1e-9)
+
+
+def test_superposed_loads_and_cantilever():
+    beam = Beam("beam", "lumber", 7.25, 1.5, 72.0, 1.6e6)
+    EI = beam.mod_of_elast * beam.moment_of_inertia()
+    combined = beam.diagrams(
+        uniform=[2.0, 3.0],
+        point=[100.0, 50.0],
+        point_location=[72.0, 36.0],
+        cantilever=True,
+    )
+    assert combined.shear[0] == pytest.approx(5.0 * 72.0 + 150.0)
+    assert combined.deflection[-1] == pytest.approx(
+        beam.deflection(5.0, load_case=2)
+        + beam.deflection(100.0, load_case=0)
+        + beam.deflection(50.0, load_case=1, a=36.0)
+    )
+    assert combined.deflection[-1] == pytest.approx(
+        5.0 * 72.0**4 / 8.0 / EI
+        + 100.0 * 72.0**3 / 3.0 / EI
+        + 50.0 * 36.0**2 * (3 * 72.0 - 36.0) / 6.0 / EI
+    )
+
+
+def test_shear_excludes_loads_within_d():
+    beam = Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6)
+    result = beam.diagrams(
+        uniform=10.0, point=200.0, point_location=4.0, exclude_within_d=True
+    )
+    assert result.shear[0] == pytest.approx(beam.shear_force(10.0))
+    assert result.shear[0] == pytest.approx(-result.shear[-1])
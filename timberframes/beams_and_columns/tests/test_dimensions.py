@@ -0,0 +1,79 @@
+import pytest
+
+from timberframes.beams_and_columns.dimensions import (
+    DIMENSION_CHOICES,
+    dimension_choices,
+    parse_dimension,
+)
+from timberframes.beams_and_columns.fields import BreadthDepthField
+from timberframes.beams_and_columns.widgets import BreadthDepthWidget
+
+
+def test_sixteenth_choices():
+    choices = dimension_choices()
+    assert choices.whole[:3] == (("0", "0 inches"), ("1", "1 inch"), ("2", "2 inches"))
+    assert len(choices.whole) == 16
+    assert choices.fraction[1] == ("0.0625", "1/16")
+    assert choices.fraction[8] == ("0.5", "1/2")
+    assert len(dimension_choices("1/32").fraction) == 32
+    assert dimension_choices("mm").fraction[3] == ("0.3", "3 mm")
+
+
+def test_registry_is_immutable():
+    with pytest.raises(TypeError):
+        DIMENSION_CHOICES["1/8"] = None
+    with pytest.raises(TypeError):
+        dimension_choices().values["3,0.5"] = 0.0
+    with pytest.raises(ValueError):
+        dimension_choices("1/8")
+
+
+def test_fields_and_widgets_share_the_choice_tables():
+    first, second = BreadthDepthField(), BreadthDepthField()
+    assert first.fields[0].choices == list(dimension_choices().whole)
+    assert BreadthDepthWidget().widgets[1].choices is not None
+    assert first.widget.widgets[1].choices == second.widget.widgets[1].choices
+    assert BreadthDepthField(resolution="1/32").fields[1].choices[1] == (
+        "0.03125",
+        "1/32",
+    )
+
+
+def test_field_round_trip():
+    field = BreadthDepthField()
+    value = field.clean(["3", "0.5"])
+    assert value == "3,0.5"
+    assert field.to_inches(value) == 3.5
+    assert field.widget.decompress(value) == ["3", "0.5"]
+
+
+def test_field_labels_follow_the_resolution():
+    inches = BreadthDepthField()
+    assert [field.label for field in inches.fields] == [
+        "Inches",
+        "Fraction of an Inch",
+    ]
+    metric = BreadthDepthField(resolution="mm")
+    assert [field.label for field in metric.fields] == ["Centimeters", "Millimeters"]
+    assert "centimeters and millimeters" in metric.error_messages["incomplete"]
+
+
+@pytest.mark.parametrize(
+    "value, resolution, inches",
+    [
+        ("3,0.5", "1/16", 3.5),
+        ("11,0.9375", "1/16", 11.9375),
+        ("0,0.03125", "1/32", 0.03125),
+        ("8,0.9", "mm", 89.0 / 25.4),
+        # not in the choice tables
+        ("24,0.25", "1/16", 24.25),
+        ("7", "1/16", 7.0),
+    ],
+)
+def test_parse_dimension(value, resolution, inches):
+    assert parse_dimension(value, resolution) == pytest.approx(inches)
+
+
+def test_parse_dimension_rejects_garbage():
+    with pytest.raises(ValueError):
+        parse_dimension("three,half")
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.beams_and_columns import Beam
+from timberframes.beams_and_columns.frame import Frame, check_members
+
+E, AREA, INERTIA = 1.6e6, 38.5, 388.0
+
+
+def simple_beam(L=240.0):
+    return Frame(
+        nodes=[[0.0, 0.0], [L / 2.0, 0.0], [L, 0.0]],
+        members=[[0, 1], [1, 2]],
+        mod_of_elast=E,
+        area=AREA,
+        moment_of_inertia=INERTIA,
+        supports=[[True, True, False], [False, False, False], [False, True, False]],
+    )
+
+
+def test_simply_supported_uniform_load():
+    L, q = 240.0, 10.0
+    result = simple_beam(L).solve(uniform=-q)
+    assert result.displacements[0, 1, 1] == pytest.approx(
+        -5.0 * q * L**4 / 384.0 / E / INERTIA
+    )
+    np.testing.assert_allclose(result.reactions[0, [0, 2], 1], q * L / 2.0)
+    np.testing.assert_allclose(result.moment[0], q * L**2 / 8.0)
+    np.testing.assert_allclose(result.shear[0], q * L / 2.0)
+
+
+def test_cantilever_tip_load_and_multiple_cases():
+    L, P = 96.0, 500.0
+    frame = Frame(
+        nodes=[[0.0, 0.0], [0.0, L]],
+        members=[[0, 1]],
+        mod_of_elast=E,
+        area=AREA,
+        moment_of_inertia=INERTIA,
+        supports=[[True, True, True], [False, False, False]],
+    )
+    loads = np.zeros((2, 2, 3))
+    loads[0, 1, 0] = P
+    loads[1, 1, 1] = -P
+    result = frame.solve(nodal_loads=loads)
+    assert result.displacements[0, 1, 0] == pytest.approx(
+        P * L**3 / 3.0 / E / INERTIA
+    )
+    assert result.moment[0, 0] == pytest.approx(P * L)
+    assert result.axial[1, 0] == pytest.approx(-P)
+    assert result.displacements[1, 1, 1] == pytest.approx(-P * L / E / AREA)
+
+
+def test_bent_with_pinned_knee_braces_is_in_equilibrium():
+    # Two posts, a tie beam and two knee braces pegged at both ends
+    nodes = [
+        [0, 0],
+        [0, 120],
+        [0, 96],
+        [24, 120],
+        [144, 0],
+        [144, 120],
+        [144, 96],
+        [120, 120],
+    ]
+    members = [[0, 2], [2, 1], [1, 3], [3, 7], [7, 5], [4, 6], [6, 5], [2, 3], [6, 7]]
+    releases = np.zeros((len(members), 2), dtype=bool)
+    releases[-2:] = True
+    supports = np.zeros((len(nodes), 3), dtype=bool)
+    supports[[0, 4]] = True
+    frame = Frame(nodes, members, E, AREA, INERTIA, supports, releases=releases)
+
+    uniform = np.zeros((2, len(members)))
+    uniform[:, 2:5] = -20.0
+    nodal_loads = np.zeros((2, len(nodes), 3))
+    nodal_loads[1, 1, 0] = 1000.0
+    result = frame.solve(nodal_loads=nodal_loads, uniform=uniform)
+
+    total_vertical = 20.0 * 144.0
+    np.testing.assert_allclose(result.reactions[:, :, 1].sum(axis=-1), total_vertical)
+    np.testing.assert_allclose(
+        result.reactions[:, :, 0].sum(axis=-1), [0.0, -1000.0], atol=1e-6
+    )
+    np.testing.assert_allclose(result.end_forces[:, -2:, [2, 5]], 0.0, atol=1e-6)
+    assert frame.stiffness_matrix().nnz < frame.n_dof**2
+
+
+def test_check_members():
+    result = simple_beam().solve(uniform=-10.0)
+    beam = Beam("beam", "lumber", 11.25, 3.5, 120.0, E)
+    checks = check_members(result, [beam, beam], F_b_prime=1000.0, F_v_prime=180.0)
+    assert len(checks) == 4
+    assert checks[0].demand == pytest.approx(
+        10.0 * 240.0**2 / 8.0 / beam.section_modulus()
+    )
@@ -0,0 +1,152 @@
+import io
+import json
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from timberframes.beams_and_columns import catalog, importer
+from timberframes.beams_and_columns.models import (
+    BeamColumnResult,
+    Beams_and_Columns,
+    Wood_Type,
+)
+
+pytestmark = pytest.mark.django_db
+
+HEADER = (
+    "wood_name,lumber_type,lumber_grade,size_class,E,E_min,G,F_v,F_c,F_c_perp,F_b,F_t\n"
+)
+ROWS = [
+    "Douglas Fir-Larch,lumber,no_2,dimension,1600000,580000,0.5,180,1350,625,900,575\n",
+    "Douglas Fir-Larch,lumber,no_2,timber,1300000,470000,0.5,170,600,625,875,425\n",
+    "Hem-Fir,lumber,no_2,dimension,1300000,470000,0.43,150,1300,405,850,525\n",
+]
+
+
+def test_format_from_name():
+    assert importer.format_from_name("nds_4a.CSV") == "csv"
+    assert importer.format_from_name("nds_4a.ndjson") == "jsonl"
+    with pytest.raises(ValueError):
+        importer.format_from_name("nds_4a.xlsx")
+
+
+def test_read_jsonl_skips_blank_lines():
+    stream = io.StringIO('{"wood_name": "a"}\n\n{"wood_name": "b"}\nnot json\n')
+    rows = list(importer.read_rows(stream, "jsonl"))
+    assert [line for line, _ in rows] == [1, 3, 4]
+    assert rows[1][1] == {"wood_name": "b"}
+    assert isinstance(rows[2][1], ValueError)
+
+
+class ImportTests(TestCase):
+    def test_import_and_update(self):
+        report = importer.import_reference_values(
+            io.StringIO(HEADER + "".join(ROWS)), chunk_size=2
+        )
+        assert (report.rows, report.created, report.updated) == (3, 3, 0)
+        assert Wood_Type.objects.count() == 3
+        timber = Wood_Type.objects.get(
+            wood_name="Douglas Fir-Larch", size_class="timber"
+        )
+        assert timber.F_c == 600
+
+        # Unchanged rows are not written again
+        report = importer.import_reference_values(
+            io.StringIO(HEADER + ROWS[0] + ROWS[1].replace(",600,", ",700,"))
+        )
+        assert (report.created, report.updated) == (0, 1)
+        timber.refresh_from_db()
+        assert timber.F_c == 700
+        assert Wood_Type.objects.count() == 3
+
+    def test_updated_wood_types_refresh_results(self):
+        importer.import_reference_values(io.StringIO(HEADER + ROWS[0]))
+        wood_type = Wood_Type.objects.get()
+        calculation = Beams_and_Columns.objects.create(
+            wood_type=wood_type, breadth=1.5, depth=7.25, length=144
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            importer.import_reference_values(
+                io.StringIO(HEADER + ROWS[0].replace(",900,", ",1000,"))
+            )
+        wood_type.refresh_from_db()
+        result = BeamColumnResult.objects.get(calculation=calculation)
+        assert result.wood_type_revision == wood_type.revision
+        assert catalog.get_wood_type(wood_type.pk).F_b == 1000
+
+    def test_results_refreshed_in_one_pass_per_chunk(self):
+        importer.import_reference_values(io.StringIO(HEADER + "".join(ROWS)))
+        for wood_type in Wood_Type.objects.all():
+            Beams_and_Columns.objects.create(
+                wood_type=wood_type, breadth=1.5, depth=7.25, length=144
+            )
+
+        def import_changed(rows, F_t):
+            changed = [row.rsplit(",", 1)[0] + f",{F_t}\n" for row in rows]
+            with CaptureQueriesContext(connection) as queries:
+                report = importer.import_reference_values(
+                    io.StringIO(HEADER + "".join(changed))
+                )
+            assert report.updated == len(rows)
+            return len(queries)
+
+        assert import_changed(ROWS[:1], 600) == import_changed(ROWS, 650)
+        for result in BeamColumnResult.objects.select_related("calculation__wood_type"):
+            assert result.wood_type_revision == result.calculation.wood_type.revision
+
+    def test_rows_inserted_concurrently_are_not_counted(self):
+        importer.import_reference_values(io.StringIO(HEADER + ROWS[0]))
+        # As if another import inserted the first row after this one looked
+        with mock.patch.object(
+            Wood_Type.objects, "filter", return_value=Wood_Type.objects.none()
+        ):
+            report = importer.import_reference_values(
+                io.StringIO(HEADER + ROWS[0] + ROWS[2])
+            )
+        assert (report.created, report.updated) == (1, 0)
+        assert Wood_Type.objects.count() == 2
+
+    def test_invalid_rows_are_skipped(self):
+        rows = [
+            {"wood_name": "Spruce-Pine-Fir", "lumber_type": "lumber", "E": 1.4e6},
+            dict(zip(importer.COLUMNS, ROWS[2].strip().split(","))),
+            {"wood_name": "Oak", **dict.fromkeys(importer.VALUE_COLUMNS, 1)},
+        ]
+        rows[2]["lumber_type"] = "plywood"
+        stream = io.StringIO("".join(json.dumps(row) + "\n" for row in rows))
+        report = importer.import_reference_values(stream, "jsonl")
+        assert (report.rows, report.created, report.invalid) == (3, 1, 2)
+        assert [error.line for error in report.errors] == [1, 3]
+        assert "Missing" in report.errors[0].errors[0]
+
+    def test_dry_run(self):
+        report = importer.import_reference_values(
+            io.StringIO(HEADER + "".join(ROWS)), dry_run=True
+        )
+        assert report.rows == 3 and report.invalid == 0
+        assert not Wood_Type.objects.exists()
+
+    def test_command(self):
+        path = self.tmp_path / "nds.csv"
+        path.write_text(HEADER + "".join(ROWS))
+        stdout = io.StringIO()
+        call_command("import_wood_types", str(path), stdout=stdout)
+        assert "3 created" in stdout.getvalue()
+        assert "rows/s" in stdout.getvalue()
+
+        path.write_text(HEADER + ROWS[0].replace("lumber,", "plywood,", 1))
+        with pytest.raises(CommandError):
+            call_command(
+                "import_wood_types",
+                str(path),
+                stdout=io.StringIO(),
+                stderr=io.StringIO(),
+            )
+
+    @pytest.fixture(autouse=True)
+    def _tmp_path(self, tmp_path):
+        self.tmp_path = tmp_path
@@ -0,0 +1,110 @@
+import json
+import threading
+
+import numpy as np
+import pytest
+from django.core.management import call_command
+
+from timberframes.beams_and_columns.beams_and_columns import Beam, Loads
+from timberframes.beams_and_columns.instrument import (
+    input_size,
+    instrument,
+    is_instrumented,
+)
+
+DEFLECTION = Beam.deflection
+
+
+def test_methods_are_only_wrapped_inside_the_context():
+    assert Beam.deflection is DEFLECTION
+    with instrument():
+        assert is_instrumented()
+        assert Beam.deflection is not DEFLECTION
+    assert not is_instrumented()
+    assert Beam.deflection is DEFLECTION
+
+
+def test_records_calls_times_and_sizes():
+    beam = Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6)
+    loads = Loads()
+    with instrument() as profile:
+        for _ in range(3):
+            beam.deflection(5.0)
+        beam.area()
+        loads.load_combinations(np.zeros((10, 7)))
+    beam.deflection(5.0)
+
+    stats = profile["Beam.deflection"]
+    assert stats.calls == 3
+    assert stats.total_size == 3
+    assert 0.0 < stats.max_time <= stats.total_time
+    assert profile["Support_Type.area"].calls == 1
+    assert profile["Loads.load_combinations"].max_size == 70
+    assert "Beam.deflection" in profile.table()
+    assert json.dumps(profile.as_dict())
+
+
+def test_nested_contexts_get_their_own_profile():
+    beam = Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6)
+    with instrument() as outer:
+        beam.area()
+        with instrument() as inner:
+            beam.area()
+        assert is_instrumented()
+        beam.area()
+    assert outer["Support_Type.area"].calls == 3
+    assert inner["Support_Type.area"].calls == 1
+
+
+def test_threads_only_record_their_own_calls():
+    beam = Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6)
+    # Both contexts are open while both threads call the engine
+    barrier = threading.Barrier(2)
+    profiles = {}
+
+    def profiled(name, calls):
+        with instrument() as profile:
+            barrier.wait()
+            for _ in range(calls):
+                beam.area()
+            barrier.wait()
+        profiles[name] = profile
+
+    threads = [
+        threading.Thread(target=profiled, args=("first", 100)),
+        threading.Thread(target=profiled, args=("second", 30)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert profiles["first"]["Support_Type.area"].calls == 100
+    assert profiles["second"]["Support_Type.area"].calls == 30
+    assert not is_instrumented()
+
+
+def test_calls_outside_any_context_are_not_recorded():
+    beam = Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6)
+    with instrument() as profile:
+        thread = threading.Thread(target=beam.area)
+        thread.start()
+        thread.join()
+    assert "Support_Type.area" not in profile
+
+
+def test_exceptions_are_recorded_and_reraised():
+    beam = Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6)
+    with instrument() as profile:
+        with pytest.raises(ValueError):
+            beam.effective_length("nowhere")
+    assert profile["Beam.effective_length"].calls == 1
+
+
+def test_input_size():
+    assert input_size((1.0, np.ones((2, 3)), [1, 2]), {"moments": {"M_1": 1}}) == 10
+
+
+def test_engine_profile_command(capsys):
+    call_command("engine_profile", size=5, pattern="scalar.loads", format="json")
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["Loads.allowable_stress_design"]["calls"] == 10
@@ -0,0 +1,81 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.beams_and_columns import Column
+from timberframes.beams_and_columns.checks import CheckLog
+from timberframes.beams_and_columns.kernels import HAVE_NUMBA, beam_column_interaction
+
+
+def random_posts(n, seed=0):
+    rng = np.random.default_rng(seed)
+    d1 = rng.uniform(5.5, 11.5, n)
+    d2 = rng.uniform(3.5, 5.5, n)
+    return dict(
+        d1=d1,
+        d2=d2,
+        l_e_c=rng.uniform(48.0, 144.0, n),
+        l_e_b=rng.uniform(48.0, 144.0, n),
+        e1=rng.uniform(0.0, 1.0, n),
+        e2=rng.uniform(0.0, 1.0, n),
+        f_c=rng.uniform(50.0, 300.0, n),
+        f_b1=rng.uniform(100.0, 600.0, n),
+        f_b2=rng.uniform(0.0, 200.0, n),
+        F_c_prime=rng.uniform(800.0, 1400.0, n),
+        F_b1_prime=rng.uniform(900.0, 1500.0, n),
+        F_b2_prime=rng.uniform(900.0, 1500.0, n),
+        E_min_prime_1=rng.uniform(4.4e5, 6.2e5, n),
+        E_min_prime_2=np.where(np.arange(n) % 7 == 0, 0.0, 5.8e5),
+        E_min_prime_c=rng.uniform(4.4e5, 6.2e5, n),
+    )
+
+
+def scalar_interactions(posts):
+    column = Column("column", "lumber", 7.5, 7.5, 96.0, 1.3e6)
+    n = len(posts["d1"])
+    return np.array(
+        [
+            column.general_eqn_for_beam_columns(
+                **{name: values[i] for name, values in posts.items()}
+            )
+            for i in range(n)
+        ]
+    )
+
+
+def test_numpy_kernel_matches_scalar():
+    posts = random_posts(10_000)
+    vectorized = beam_column_interaction(**posts, use_numba=False)
+    np.testing.assert_allclose(
+        vectorized[:200],
+        scalar_interactions({name: values[:200] for name, values in posts.items()}),
+    )
+    assert vectorized.shape == (10_000,)
+
+
+@pytest.mark.skipif(not HAVE_NUMBA, reason="numba is not installed")
+def test_numba_kernel_matches_numpy():
+    posts = random_posts(5_000, seed=3)
+    np.testing.assert_allclose(
+        beam_column_interaction(**posts, use_numba=True),
+        beam_column_interaction(**posts, use_numba=False),
+    )
+
+
+def test_scalar_records_checks():
+    posts = random_posts(1)
+    checks = CheckLog()
+    Column("column", "lumber", 7.5, 7.5, 96.0, 1.3e6).general_eqn_for_beam_columns(
+        **{name: values[0] for name, values in posts.items()}, checks=checks
+    )
+    assert [result.name for result in checks][-1] == "beam_column_interaction"
+
+
+def test_scalar_without_checks_records_nothing():
+    posts = random_posts(1)
+    with mock.patch("timberframes.beams_and_columns.checks.check") as check:
+        Column("column", "lumber", 7.5, 7.5, 96.0, 1.3e6).general_eqn_for_beam_columns(
+            **{name: values[0] for name, values in posts.items()}
+        )
+    check.assert_not_called()
@@ -1,8 +1,21 @@
+from decimal import Decimal
+from unittest import mock
+
 import pytest
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from timberframes.beams_and_columns.models import Wood_Type
+from timberframes.beams_and_columns import catalog
+from timberframes.beams_and_columns.calculations import ENGINE_VERSION, member_results
+from timberframes.beams_and_columns.forms import BeamAndColumnForm, WoodTypeForm
+from timberframes.beams_and_columns.models import (
+    BeamColumnResult,
+    Beams_and_Columns,
+    Wood_Type,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -22,6 +35,8 @@ class WoodTypeTests(TestCase):
             F_b=875,
             F_t=450,
         )
+        # The invalidation waits for a commit that never comes in a TestCase
+        catalog.clear()
 
     def test_string_representation(self):
         self.assertEqual(str(self.wood_type), self.wood_type.wood_name)
@@ -65,6 +80,7 @@ class WoodTypeTests(TestCase):
                 "wood_name": "Red Oak",
                 "lumber_type": "log",
                 "lumber_grade": "no_1",
+                "size_class": "dimension",
                 "E": 1.2e6,
                 "E_min": 4.4e5,
                 "G": 0.67,
@@ -85,6 +101,7 @@ class WoodTypeTests(TestCase):
             {
                 "lumber_type": "log",
                 "lumber_grade": "no_2",
+                "size_class": "dimension",
                 "E": 1e6,
                 "E_min": 3.7e5,
                 "G": 0.67,
@@ -97,6 +114,49 @@ class WoodTypeTests(TestCase):
         )
         self.assertEqual(response.status_code, 302)
 
+    def test_duplicate_natural_key_is_a_form_error(self):
+        data = {
+            "wood_name": "Spruce-Pine-Fir",
+            "lumber_type": "lumber",
+            "lumber_grade": "no_2",
+            "size_class": "dimension",
+            "E": 1.4e6,
+            "E_min": 5.1e5,
+            "G": 0.42,
+            "F_v": 135,
+            "F_c": 1150,
+            "F_c_perp": 425,
+            "F_b": 875,
+            "F_t": 450,
+        }
+        assert not WoodTypeForm(data).is_valid()
+        assert WoodTypeForm({**data, "size_class": "timber"}).is_valid()
+
+    def test_colliding_edit_is_a_form_error(self):
+        other = Wood_Type.objects.create(
+            wood_name="Spruce-Pine-Fir",
+            lumber_type="lumber",
+            lumber_grade="no_1",
+            E=1.4e6,
+            E_min=5.1e5,
+            G=0.42,
+            F_v=135,
+            F_c=1150,
+            F_c_perp=425,
+            F_b=875,
+            F_t=450,
+        )
+        data = {
+            name: getattr(other, name)
+            for name in ("lumber_type", "size_class", "E", "E_min", "G", "F_v")
+            + ("F_c", "F_c_perp", "F_b", "F_t")
+        }
+        response = self.client.post(
+            reverse("wood_type_edit", args=[other.pk]), {**data, "lumber_grade": "no_2"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["form"].non_field_errors())
+
 
 # For some reason pytest is doing things in alphabetical order which causes
 # the wood_type to be deleted before other tests use it.
@@ -121,3 +181,260 @@ class WoodTypeDeleteTests(TestCase):
             reverse("wood_type_delete", args=f"{self.wood_type_2.id}")
         )
         self.assertEqual(response.status_code, 302)
+
+
+class BeamsAndColumnsDeduplicationTests(TestCase):
+    def setUp(self):
+        self.wood_type = Wood_Type.objects.create(
+            wood_name="Douglas Fir-Larch",
+            lumber_type="lumber",
+            lumber_grade="no_2",
+            E=1.6e6,
+            E_min=5.8e5,
+            G=0.5,
+            F_v=180,
+            F_c=1350,
+            F_c_perp=625,
+            F_b=900,
+            F_t=575,
+        )
+        catalog.clear()
+        self.inputs = {
+            "wood_type": self.wood_type.pk,
+            "user_selected_support_type": "beam",
+            "breadth": "1.5",
+            "depth": "7.25",
+            "length": "144",
+        }
+
+    def calculation(self, **inputs):
+        return Beams_and_Columns(
+            wood_type=self.wood_type,
+            user_selected_support_type=inputs.get("support_type", "beam"),
+            breadth=inputs.get("breadth", Decimal("1.50")),
+            depth=inputs.get("depth", Decimal("7.25")),
+            length=inputs.get("length", Decimal("144.00")),
+        )
+
+    def test_fingerprint_matches_stored_values(self):
+        calculation = self.calculation(breadth=1.5, depth="7.25", length=144.001)
+        calculation.save()
+        calculation.refresh_from_db()
+        assert calculation.fingerprint == calculation.input_fingerprint()
+        assert calculation.fingerprint == self.calculation().input_fingerprint()
+        assert (
+            calculation.fingerprint
+            != self.calculation(support_type="column").input_fingerprint()
+        )
+
+    def test_get_or_create_calculation(self):
+        first, created = Beams_and_Columns.objects.get_or_create_calculation(
+            self.calculation()
+        )
+        assert created
+        with self.assertNumQueries(1):
+            second, created = Beams_and_Columns.objects.get_or_create_calculation(
+                self.calculation(breadth=1.5)
+            )
+        assert not created and second.pk == first.pk
+
+    def test_get_or_create_calculation_lost_race(self):
+        winner = self.calculation()
+        winner.save()
+        # The lookup misses as if the other insert had not committed yet
+        lookups = [Beams_and_Columns.DoesNotExist(), winner]
+
+        def get(**kwargs):
+            result = lookups.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with mock.patch.object(Beams_and_Columns.objects, "get", side_effect=get):
+            loser, created = Beams_and_Columns.objects.get_or_create_calculation(
+                self.calculation()
+            )
+        assert not created and loser.pk == winner.pk
+        assert Beams_and_Columns.objects.count() == 1
+
+    def test_resubmission_reuses_row(self):
+        first = self.client.post(reverse("home"), self.inputs)
+        second = self.client.post(reverse("home"), {**self.inputs, "breadth": "1.50"})
+        self.assertEqual(first.status_code, 302)
+        self.assertEqual(first["Location"], second["Location"])
+        self.assertEqual(Beams_and_Columns.objects.count(), 1)
+        self.client.post(reverse("home"), {**self.inputs, "length": "120"})
+        self.assertEqual(Beams_and_Columns.objects.count(), 2)
+
+    def test_colliding_edit_is_a_form_error(self):
+        first = self.calculation()
+        first.save()
+        second = self.calculation(length=Decimal("120.00"))
+        second.save()
+        form = BeamAndColumnForm(self.inputs, instance=second)
+        assert not form.is_valid()
+        assert "same inputs" in form.non_field_errors()[0]
+        # Saving a calculation unchanged does not collide with itself
+        form = BeamAndColumnForm({**self.inputs, "length": "120"}, instance=second)
+        assert form.is_valid()
+        form.save()
+
+    def test_loads_are_inputs(self):
+        response = self.client.post(reverse("home"), self.inputs)
+        self.assertEqual(response.status_code, 302)
+        calculation = Beams_and_Columns.objects.get()
+        assert (calculation.uniform, calculation.axial) == (0, 0)
+        self.client.post(reverse("home"), {**self.inputs, "uniform": "0"})
+        self.assertEqual(Beams_and_Columns.objects.count(), 1)
+        self.client.post(reverse("home"), {**self.inputs, "uniform": "12.5"})
+        self.assertEqual(Beams_and_Columns.objects.count(), 2)
+        form = BeamAndColumnForm({**self.inputs, "axial": "-1"})
+        assert "axial" in form.errors
+
+    def test_collapse_duplicate_calculations(self):
+        rows = [self.calculation() for _ in range(3)] + [self.calculation(depth=9.25)]
+        # Rows saved before the fingerprint existed
+        for row in rows:
+            row.fingerprint = None
+        Beams_and_Columns.objects.bulk_create(rows)
+        call_command("collapse_duplicate_calculations", "--dry-run", stdout=mock.Mock())
+        self.assertEqual(Beams_and_Columns.objects.count(), 4)
+
+        call_command("collapse_duplicate_calculations", stdout=mock.Mock())
+        kept = list(Beams_and_Columns.objects.order_by("pk"))
+        self.assertEqual(len(kept), 2)
+        self.assertEqual(kept[0].pk, Beams_and_Columns.objects.earliest("pk").pk)
+        for row in kept:
+            self.assertEqual(row.fingerprint, row.input_fingerprint())
+        _, created = Beams_and_Columns.objects.get_or_create_calculation(
+            self.calculation()
+        )
+        assert not created
+
+
+class BeamColumnResultTests(TestCase):
+    def setUp(self):
+        self.wood_type = Wood_Type.objects.create(
+            wood_name="Douglas Fir-Larch",
+            lumber_type="lumber",
+            lumber_grade="no_2",
+            E=1.6e6,
+            E_min=5.8e5,
+            G=0.5,
+            F_v=180,
+            F_c=1350,
+            F_c_perp=625,
+            F_b=900,
+            F_t=575,
+        )
+        self.calculations = [
+            Beams_and_Columns.objects.create(
+                user_selected_support_type=support_type,
+                wood_type=self.wood_type,
+                breadth=1.5,
+                depth=depth,
+                length=length,
+            )
+            for support_type in ("beam", "column", "beam_and_column")
+            for depth in (5.5, 7.25, 9.25)
+            for length in (96, 144, 192)
+        ]
+
+    def test_stored_on_save(self):
+        calculation = self.calculations[4]
+        result = BeamColumnResult.objects.get(calculation=calculation)
+        expected = member_results("beam", self.wood_type, 1.5, 7.25, 144)
+        assert result.breakdown == pytest.approx(expected)
+        assert result.governing == pytest.approx(expected["governing"])
+        assert expected[result.governing_check] == result.governing
+        assert result.engine_version == ENGINE_VERSION
+        assert result.wood_type_revision == self.wood_type.revision
+        assert BeamColumnResult.objects.count() == len(self.calculations)
+
+    def test_size_class_change_recomputes(self):
+        revision = self.wood_type.revision
+        self.wood_type.size_class = "timber"
+        self.wood_type.save()
+        assert self.wood_type.revision != revision
+        for result in BeamColumnResult.objects.all():
+            assert result.wood_type_revision == self.wood_type.revision
+
+    def test_wood_type_update_view_recomputes_in_bulk(self):
+        before = dict(BeamColumnResult.objects.values_list("pk", "breakdown"))
+        data = {
+            name: getattr(self.wood_type, name)
+            for name in ("lumber_type", "lumber_grade", "size_class", "E", "E_min")
+            + ("G", "F_v", "F_c", "F_c_perp", "F_t")
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("wood_type_edit", args=[self.wood_type.pk]),
+                {**data, "F_b": 1200},
+            )
+        self.assertEqual(response.status_code, 302)
+        # The query count does not grow with the number of calculations
+        assert len(queries) < 15
+        self.wood_type.refresh_from_db()
+        for result in BeamColumnResult.objects.all():
+            assert result.wood_type_revision == self.wood_type.revision
+            assert (
+                result.breakdown["F_b_prime"] > before[result.pk]["F_b_prime"]
+                or result.calculation.user_selected_support_type == "column"
+            )
+        assert BeamColumnResult.objects.refresh(self.wood_type) == 0
+
+    def test_refresh_fills_missing_and_outdated(self):
+        BeamColumnResult.objects.filter(pk=self.calculations[0].pk).delete()
+        BeamColumnResult.objects.filter(pk=self.calculations[1].pk).update(
+            engine_version="0"
+        )
+        assert BeamColumnResult.objects.refresh(self.wood_type, batch_size=1) == 2
+        assert BeamColumnResult.objects.current().count() == len(self.calculations)
+
+    def test_no_design_values(self):
+        self.wood_type.lumber_type = "log"
+        self.wood_type.save()
+        result = BeamColumnResult.objects.get(calculation=self.calculations[0])
+        assert result.governing is None and result.breakdown == {}
+        assert self.calculations[0].results() is None
+
+    def test_filtering_is_a_query(self):
+        overloaded = self.calculations[2]
+        BeamColumnResult.objects.filter(pk=overloaded.pk).update(governing=1.5)
+        with self.assertNumQueries(1):
+            failing = list(
+                BeamColumnResult.objects.current()
+                .failing()
+                .values_list("pk", flat=True)
+            )
+        assert failing == [overloaded.pk]
+
+    def test_loads_reach_the_stored_results(self):
+        beam = Beams_and_Columns.objects.create(
+            user_selected_support_type="beam",
+            wood_type=self.wood_type,
+            breadth=1.5,
+            depth=5.5,
+            length=192,
+            uniform=Decimal("20.00"),
+        )
+        post = Beams_and_Columns.objects.create(
+            user_selected_support_type="column",
+            wood_type=self.wood_type,
+            breadth=3.5,
+            depth=3.5,
+            length=96,
+            axial=Decimal("2000.00"),
+        )
+        result = BeamColumnResult.objects.get(calculation=beam)
+        expected = member_results(
+            "beam", self.wood_type, 1.5, 5.5, 192, uniform=20, axial=0
+        )
+        assert result.breakdown == pytest.approx(expected)
+        assert result.governing > 1.0 and result.governing_check == "deflection"
+        result = BeamColumnResult.objects.get(calculation=post)
+        assert 0.0 < result.governing < 1.0
+        assert result.governing_check == "compression"
+        assert list(
+            BeamColumnResult.objects.failing().values_list("pk", flat=True)
+        ) == [beam.pk]
@@ -0,0 +1,56 @@
+import pytest
+
+from timberframes.beams_and_columns.reliability import (
+    ReliabilityModel,
+    iter_chunk_failures,
+    probability_of_failure,
+)
+
+POST = ReliabilityModel(
+    "lumber",
+    E=1.3e6,
+    F_c=1000.0,
+    F_b=1200.0,
+    f_c=450.0,
+    f_b=300.0,
+    column_slenderness=20.0,
+    beam_slenderness=10.0,
+)
+
+
+def test_reproducible_and_chunk_bounded():
+    first = probability_of_failure(POST, n_samples=50_000, chunk_size=8_192, seed=42)
+    second = probability_of_failure(POST, n_samples=50_000, chunk_size=8_192, seed=42)
+    assert first == second
+    assert first.samples == 50_000
+    assert 0.0 < first.lower <= first.probability <= first.upper < 1.0
+    sizes = [size for size, _ in iter_chunk_failures(POST, 50_000, 8_192, seed=42)]
+    assert max(sizes) == 8_192 and sum(sizes) == 50_000
+
+
+def test_process_pool_matches_serial():
+    serial = probability_of_failure(POST, n_samples=40_000, chunk_size=10_000, seed=7)
+    pooled = probability_of_failure(
+        POST, n_samples=40_000, chunk_size=10_000, seed=7, processes=2
+    )
+    assert serial == pooled
+
+
+def test_overloaded_member_fails():
+    overloaded = POST._replace(f_c=5000.0)
+    result = probability_of_failure(overloaded, n_samples=10_000, seed=1)
+    assert result.probability == pytest.approx(1.0)
+
+
+def test_logs_not_implemented():
+    with pytest.raises(ValueError, match="No design values"):
+        probability_of_failure(POST._replace(lumber_type="log"), n_samples=10)
+
+
+@pytest.mark.parametrize("n_samples, chunk_size", [(0, 8_192), (-5, 8_192), (10, 0)])
+def test_sample_counts_must_be_positive(n_samples, chunk_size):
+    with pytest.raises(ValueError):
+        probability_of_failure(POST, n_samples=n_samples, chunk_size=chunk_size)
+    # Raised on the call, not on the first chunk
+    with pytest.raises(ValueError):
+        iter_chunk_failures(POST, n_samples, chunk_size)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.beams_and_columns import Beam
+from timberframes.beams_and_columns.shrinkage import iter_shrinkage, shrinkage_summary
+
+SCHEDULE = [0.45, 0.3, 0.25, 0.2, 0.15, 0.12, 0.19]
+
+
+def test_chunks_match_scalar_shrinkage():
+    breadth, depth = np.array([7.5, 5.5]), np.array([9.5, 7.5])
+    chunks = list(iter_shrinkage(SCHEDULE, breadth, depth, 0.05, 0.025, chunk_size=3))
+    assert [(chunk.start, chunk.stop) for chunk in chunks] == [(0, 3), (3, 6), (6, 7)]
+    depth_change = np.concatenate([chunk.depth_change for chunk in chunks])
+    assert depth_change.shape == (7, 2)
+
+    beam = Beam("beam", "lumber", 9.5, 7.5, 144.0, 1.6e6)
+    for step, m_f in enumerate(SCHEDULE):
+        # Above the fiber saturation point the member has not started to shrink
+        expected = beam.estimated_shrinkage(0.025, 0.3, min(m_f, 0.3)) * 9.5
+        assert depth_change[step, 0] == pytest.approx(expected)
+
+
+def test_per_member_moisture_from_a_generator():
+    rows = ([m, m + 0.05] for m in (0.3, 0.2, 0.1))
+    summary = shrinkage_summary(rows, 6.0, 12.0, 0.04, 0.06, chunk_size=2)
+    assert summary.steps == 3
+    np.testing.assert_allclose(summary.breadth_change, [6 * 0.04 * 2 / 3, 6 * 0.04 / 2])
+    np.testing.assert_allclose(summary.depth_change, summary.max_depth_change)
+
+
+def test_tolerance_flags_first_time_step():
+    summary = shrinkage_summary(
+        SCHEDULE, [1.5, 11.5], [3.5, 11.5], 0.05, 0.05, tolerance=0.11, chunk_size=2
+    )
+    np.testing.assert_array_equal(summary.exceeded, [False, True])
+    # 11.5 * 0.05 * (0.3 - 0.25) / 0.3 = 0.096 at step 2, 0.19 at step 3;
+    # the 3.5 in. deep member peaks at 0.105
+    np.testing.assert_array_equal(summary.first_exceeded, [-1, 3])
+    # Re-wetting at the last step does not clear the flag, but peak is kept
+    assert summary.max_depth_change[1] > summary.depth_change[1]
+
+
+def test_empty_schedule():
+    assert list(iter_shrinkage([], 1.5, 3.5, 0.05, 0.05)) == []
+    with pytest.raises(ValueError):
+        shrinkage_summary([], 1.5, 3.5, 0.05, 0.05)
@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+# Wall time allowed for a fresh interpreter to import Django and run
+# django.setup(), generous enough for a loaded CI runner
+SETUP_BUDGET = 3.0
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+elapsed = time.perf_counter() - start
+import timberframes.beams_and_columns.beams_and_columns as bac
+import timberframes.beams_and_columns.fields
+import timberframes.beams_and_columns.forms
+beam = bac.Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6)
+beam.stability_factor(1000.0, 900.0)
+bac.Loads().allowable_stress_design(10.0, L=40.0)
+print(json.dumps({"elapsed": elapsed, "numpy": "numpy" in sys.modules}))
+"""
+
+
+def _run_setup():
+    env = dict(os.environ)
+    env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=str(settings.ROOT_DIR),
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_django_setup_and_scalar_engine_do_not_import_numpy():
+    result = _run_setup()
+    assert not result["numpy"]
+    assert result["elapsed"] < SETUP_BUDGET
@@ -0,0 +1,159 @@
+import json
+
+import pytest
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from timberframes.beams_and_columns import catalog, streaming
+from timberframes.beams_and_columns.adjustments import reference_values
+from timberframes.beams_and_columns.calculations import RESULT_FIELDS, evaluate
+from timberframes.beams_and_columns.models import Wood_Type
+
+pytestmark = pytest.mark.django_db
+
+
+def member_of(wood_type, support_type, breadth, depth, length, **loads):
+    return {
+        "wood_type": wood_type,
+        "support_type": support_type,
+        "breadth": breadth,
+        "depth": depth,
+        "length": length,
+        **loads,
+    }
+
+
+def test_read_ndjson():
+    members = list(streaming.read_ndjson([b'{"wood_type": 1}\n', b"\n", b"{\n"]))
+    assert members[0] == {"wood_type": 1}
+    assert isinstance(members[1], streaming.InvalidLine)
+
+
+@pytest.mark.parametrize(
+    "member, error",
+    [
+        ([], "JSON object"),
+        ({"support_type": "beam"}, "wood_type is required"),
+        ({"wood_type": 1.7, "support_type": "beam"}, "wood_type must be an integer"),
+        ({"wood_type": True, "support_type": "beam"}, "wood_type must be an integer"),
+        ({"wood_type": "1", "support_type": "beam"}, "wood_type must be an integer"),
+        ({"wood_type": 1, "support_type": "truss"}, "support_type"),
+        ({"wood_type": 1, "support_type": "beam", "breadth": "2"}, "number"),
+        (
+            {"wood_type": 1, "support_type": "beam", "breadth": 1.5, "depth": 0},
+            "depth must be a positive number",
+        ),
+    ],
+)
+def test_validate_member_errors(member, error):
+    with pytest.raises(ValueError, match=error):
+        streaming.validate_member(member)
+
+
+def test_validate_member_defaults():
+    member = streaming.validate_member(member_of(1, "column", 3.5, 3.5, 96))
+    assert member.length == 96.0 and member.uniform == 0.0
+    assert member.duration == "ten_years"
+    assert member.column_bracing == "both_trans_fixed_rot_free"
+
+
+class BatchCalculationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.wood_types = [
+            Wood_Type.objects.create(
+                wood_name=name,
+                lumber_type=lumber_type,
+                lumber_grade="no_2",
+                E=1.6e6,
+                E_min=5.8e5,
+                G=0.5,
+                F_v=180,
+                F_c=1350,
+                F_c_perp=625,
+                F_b=900,
+                F_t=575,
+            )
+            for name, lumber_type in (
+                ("Douglas Fir-Larch", "lumber"),
+                ("Southern Pine", "glulam"),
+                ("White Oak", "log"),
+            )
+        ]
+        catalog.clear()
+        lumber, glulam, log = (wood_type.pk for wood_type in self.wood_types)
+        self.members = [
+            member_of(lumber, "beam", 1.5, 7.25, 144, uniform=10.0),
+            member_of(glulam, "column", 5.125, 6.0, 120, axial=8000.0),
+            member_of(log, "beam", 8, 8, 144),
+            member_of(0, "beam", 1.5, 7.25, 144),
+            member_of(
+                lumber,
+                "beam_and_column",
+                3.5,
+                5.5,
+                96,
+                uniform=5.0,
+                axial=3000.0,
+                duration="two_months",
+                column_bracing="both_trans_fixed_rot_fixed",
+            ),
+        ]
+
+    def lines(self, response):
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        return [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+
+    def check(self, lines):
+        assert [line["index"] for line in lines] == list(range(len(self.members)))
+        assert "results" in lines[0] and "results" in lines[1]
+        assert "No design values" in lines[2]["error"]
+        assert "No wood type" in lines[3]["error"]
+        assert set(lines[4]["results"]) == set(RESULT_FIELDS)
+        (expected,) = evaluate(
+            reference_values(self.wood_types[0]),
+            "beam",
+            [1.5],
+            [7.25],
+            [144.0],
+            uniform=10.0,
+        )
+        assert lines[0]["results"]["governing"] == pytest.approx(expected["governing"])
+
+    def test_json_array(self):
+        response = self.client.post(
+            reverse("batch_calculation"),
+            json.dumps(self.members),
+            content_type="application/json",
+        )
+        self.check(self.lines(response))
+
+    def test_ndjson_stream(self):
+        body = "".join(json.dumps(member) + "\n" for member in self.members)
+        response = self.client.post(
+            reverse("batch_calculation"),
+            body + "not json\n",
+            content_type="application/x-ndjson",
+        )
+        lines = self.lines(response)
+        self.check(lines[:-1])
+        assert lines[-1]["error"].startswith("Invalid JSON")
+
+    def test_chunks_keep_input_order(self):
+        chunks = list(streaming.calculate(self.members * 3, chunk_size=4))
+        assert len(chunks) == 4
+        lines = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+        assert [line["index"] for line in lines] == list(range(15))
+
+    def test_invalid_body(self):
+        url = reverse("batch_calculation")
+        response = self.client.post(url, "{", content_type="application/json")
+        assert response.status_code == 400
+        response = self.client.post(url, "{}", content_type="application/json")
+        assert response.status_code == 400
+        assert self.client.get(url).status_code == 405
@@ -0,0 +1,69 @@
+import warnings
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.sweep import SWEEP_DTYPE, sweep, utilization
+
+DOUGLAS_FIR = SimpleNamespace(
+    lumber_type="lumber", E=1.6e6, E_min=5.8e5, F_v=180, F_c=1350, F_b=900
+)
+
+
+def test_sweep_grid_shape_and_labels():
+    breadth = [1.5, 3.5]
+    depth = [5.5, 7.25, 9.25]
+    length = np.linspace(48.0, 192.0, 4)
+    result = sweep(DOUGLAS_FIR, breadth, depth, length, uniform=10.0, shard_size=5)
+    assert result.dtype == SWEEP_DTYPE
+    assert result.shape == (2, 3, 4)
+    assert result["depth"][1, 2, 3] == 9.25
+    assert result["length"][0, 0, 3] == 192.0
+    # Deeper and wider sections are less utilized, longer spans more
+    assert np.all(np.diff(result["bending"], axis=1) < 0.0)
+    assert np.all(np.diff(result["bending"], axis=0) < 0.0)
+    assert np.all(np.diff(result["deflection"], axis=2) > 0.0)
+
+
+def test_sweep_matches_pointwise_utilization():
+    result = sweep(DOUGLAS_FIR, [3.5], [3.5, 5.5], [96.0], uniform=5.0, axial=4000.0)
+    point = utilization(
+        {
+            "lumber_type": "lumber",
+            "E": 1.6e6,
+            "E_min": 5.8e5,
+            "F_v": 180.0,
+            "F_c": 1350.0,
+            "F_b": 900.0,
+        },
+        3.5,
+        5.5,
+        96.0,
+        uniform=5.0,
+        axial=4000.0,
+    )
+    for name in SWEEP_DTYPE.names:
+        assert result[name][0, 1, 0] == pytest.approx(point[name])
+    assert result["governing"][0, 1, 0] == max(
+        point[name]
+        for name in ("bending", "shear", "deflection", "compression", "interaction")
+    )
+
+
+def test_sweep_process_pool_matches_serial():
+    axes = ([1.5, 3.5, 5.5], np.arange(3.5, 12.0, 1.0), np.arange(48.0, 240.0, 24.0))
+    serial = sweep(DOUGLAS_FIR, *axes, uniform=8.0, axial=2000.0, shard_size=50)
+    pooled = sweep(
+        DOUGLAS_FIR, *axes, uniform=8.0, axial=2000.0, shard_size=50, processes=2
+    )
+    np.testing.assert_array_equal(serial, pooled)
+
+
+def test_pure_axial_point_past_the_buckling_load():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = sweep(DOUGLAS_FIR, [1.5], [3.5], [96.0, 192.0], axial=20000.0)
+    # Without bending the interaction is the compression term alone
+    np.testing.assert_allclose(result["interaction"], result["compression"] ** 2)
+    assert np.all(np.isfinite(result["interaction"]))
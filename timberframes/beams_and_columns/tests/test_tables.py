@@ -0,0 +1,58 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from timberframes.beams_and_columns.batch import BeamBatch, ColumnBatch
+from timberframes.beams_and_columns.beams_and_columns import Beam, Column
+from timberframes.beams_and_columns.tables import ColumnBracing, DesignKe, LoadPlacement
+
+
+def test_beam_table_matches_scalar_for_mixed_conditions():
+    conditions = [
+        (placement, single_span, length)
+        for placement, single_span, length in itertools.product(
+            LoadPlacement, (False, True), (36.0, 144.0)
+        )
+        if single_span or placement <= LoadPlacement.concentrated_end
+    ]
+    placements, single_spans, lengths = (np.array(c) for c in zip(*conditions))
+    beams = BeamBatch("lumber", 7.25, 1.5, lengths, 1.6e6)
+    expected = [
+        Beam("beam", "lumber", 7.25, 1.5, length, 1.6e6).effective_length(
+            placement.name, single_span
+        )
+        for placement, single_span, length in conditions
+    ]
+    np.testing.assert_allclose(
+        beams.effective_length(placements, single_spans), expected
+    )
+    assert Beam("beam", "lumber", 7.25, 1.5, 36.0, 1.6e6).effective_length(
+        "uniform", True
+    ) == pytest.approx(2.06 * 36.0)
+
+
+def test_beam_table_rejects_untabulated_conditions():
+    with pytest.raises(ValueError):
+        Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6).effective_length(
+            "concentrated_center_with_support", False
+        )
+    with pytest.raises(ValueError):
+        Beam("beam", "lumber", 7.25, 1.5, 144.0, 1.6e6).effective_length("midspan")
+
+
+def test_column_table_matches_scalar():
+    conditions = list(itertools.product(ColumnBracing, DesignKe))
+    bracings, designs = (np.array(c) for c in zip(*conditions))
+    columns = ColumnBatch("lumber", 5.5, 5.5, 120.0, 1.3e6)
+    column = Column("column", "lumber", 5.5, 5.5, 120.0, 1.3e6)
+    expected = [
+        column.effective_length(bracing.name, design.name)
+        for bracing, design in conditions
+    ]
+    np.testing.assert_allclose(columns.effective_length(bracings, designs), expected)
+    assert column.slenderness_ratio("top_trans_free_rot_free") == pytest.approx(
+        2.1 * 120.0 / 5.5
+    )
+    with pytest.raises(ValueError):
+        column.effective_length("both_trans_fixed_rot_fixed", "approximate")
@@ -1,6 +1,7 @@
 from django.urls import path
 
 from .views import (
+    BatchCalculationView,
     BeamAndColumnFormView,
     BeamAndColumnResultsView,
     WoodTypeDeleteView,
@@ -23,6 +24,11 @@ urlpatterns = [
         view=BeamAndColumnResultsView.as_view(),
         name="beams_and_columns_results",
     ),
+    path(
+        "api/calculate/",
+        view=BatchCalculationView.as_view(),
+        name="batch_calculation",
+    ),
     # path("wood_type", view=WoodTypeFormView.as_view(), name="wood_type"),
     # path("wood_type/", view=WoodTypeFormView.as_view(), name="wood_type"),
     path("wood_type/", view=WoodTypeListView.as_view(), name="wood_type_list"),
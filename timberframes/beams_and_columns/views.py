@@ -1,7 +1,14 @@
+import json
+
+from django.http import HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.urls import reverse_lazy
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import DetailView, ListView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
+from . import catalog, streaming
 from .forms import BeamAndColumnForm, WoodTypeForm
 from .models import Beams_and_Columns, Wood_Type
 
@@ -12,6 +19,9 @@ class WoodTypeListView(ListView):
     model = Wood_Type
     template_name = "beams_and_columns/wood_type_list.html"
 
+    def get_queryset(self):
+        return catalog.wood_types()
+
 
 class WoodTypeDetailView(DetailView):
     model = Wood_Type
@@ -36,7 +46,7 @@ class WoodTypeUpdateView(UpdateView):
         # "wood_name",
         "lumber_type",
         "lumber_grade",
-        # "size",
+        "size_class",
         "E",
         "E_min",
         "G",
@@ -62,6 +72,14 @@ class BeamAndColumnFormView(CreateView):
     model = Beams_and_Columns
     form_class = BeamAndColumnForm
     template_name = "pages/home.html"
+
+    def form_valid(self, form):
+        # Identical inputs share one row, and with it the cached results
+        self.object, _ = Beams_and_Columns.objects.get_or_create_calculation(
+            form.instance
+        )
+        return HttpResponseRedirect(self.get_success_url())
+
     # success_url = reverse_lazy('beams_and_columns_results')
     # slug_field = "beams_and_columns"
     # slug_url_kwarg = "beams_and_columns"
@@ -71,4 +89,39 @@ class BeamAndColumnFormView(CreateView):
 class BeamAndColumnResultsView(DetailView):
     model = Beams_and_Columns
     template_name = "beams_and_columns/beams_and_columns_results.html"
+    queryset = Beams_and_Columns.objects.select_related("wood_type", "result")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["results"] = self.object.results()
+        return context
+
     # success_url = reverse_lazy("beams_and_columns_results")
+
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl")
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class BatchCalculationView(View):
+    """Evaluates a JSON array or an NDJSON stream of members, see
+    ``streaming.Member``, and streams back one NDJSON line per member"""
+
+    http_method_names = ["post"]
+
+    def post(self, request, *args, **kwargs):
+        if request.content_type in NDJSON_CONTENT_TYPES:
+            # Read lazily, while the results of earlier members stream out
+            members = streaming.read_ndjson(request)
+        else:
+            try:
+                members = json.loads(request.body)
+            except ValueError as error:
+                return JsonResponse({"error": f"Invalid JSON: {error}"}, status=400)
+            if not isinstance(members, list):
+                return JsonResponse(
+                    {"error": "Expected a JSON array of members."}, status=400
+                )
+        return StreamingHttpResponse(
+            streaming.calculate(members), content_type="application/x-ndjson"
+        )
@@ -1,37 +1,23 @@
-import re
-from fractions import Fraction as frac
-
-import numpy as np
 from django import forms
 
+from .dimensions import DEFAULT_RESOLUTION, dimension_choices
+
 
 class BreadthDepthWidget(forms.MultiWidget):
     """Widget to have a separate inch and fraction of an inch selection"""
 
-    def __init__(self, attrs=None):
-        i_selections = []
-        for x in np.arange(0, 16):
-            if x == 1:
-                i_selections.append((f"{x}", f"{x} inch"))
-            else:
-                i_selections.append((f"{x}", f"{x} inches"))
-        INCH_SELECTIONS = tuple(i_selections)
-
-        f_selections = []
-        for x in np.arange(0, 16) / 16:
-            f_selections.append((f"{x}", str(frac(x))))
-        FRACTIONAL_SELECTIONS = tuple(f_selections)
-
+    def __init__(self, attrs=None, resolution=DEFAULT_RESOLUTION):
+        choices = dimension_choices(resolution)
         _widgets = [
-            forms.Select(attrs=attrs, choices=INCH_SELECTIONS),
-            forms.Select(attrs=attrs, choices=FRACTIONAL_SELECTIONS),
+            forms.Select(attrs=attrs, choices=choices.whole),
+            forms.Select(attrs=attrs, choices=choices.fraction),
         ]
         super(BreadthDepthWidget, self).__init__(_widgets, attrs)
         # super().__init__(_widgets, attrs)
 
     def decompress(self, value):
         if value:
-            splt_value = re.split(",", value)
-            return [splt_value[0], splt_value[1]]
+            whole, _, fraction = value.partition(",")
+            return [whole, fraction]
         else:
             return [None, None]